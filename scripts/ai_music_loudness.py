@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""ITU-R BS.1770 integrated loudness and true-peak measurement.
+
+Both meters take audio block by block, so the in-memory and streaming
+normalizers share them. K-weighting runs through `sosfilt`, with the filter
+state carried between blocks. Mean-square energy is accumulated per 100 ms
+hop. Integrated loudness averages 400 ms blocks (four hops, 75% overlap)
+that pass the absolute (-70 LUFS) and relative (-10 LU) gates. True peak is
+the maximum of a 4x oversampled signal.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import firwin, sosfilt, upfirdn
+
+
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+LOUDNESS_OFFSET = -0.691
+HOPS_PER_BLOCK = 4
+TRUE_PEAK_OVERSAMPLE = 4
+TRUE_PEAK_TAPS = 49
+MEASURE_BLOCK_FRAMES = 65536
+
+
+def k_weighting_sos(sample_rate: int) -> np.ndarray:
+    """Return the two BS.1770 K-weighting biquads (shelf + high-pass) for any sample rate."""
+    # Pre-filter: high shelf, +4 dB above ~1.7 kHz.
+    gain_db = 3.999843853973347
+    q = 0.7071752369554196
+    k = math.tan(math.pi * 1681.974450955533 / sample_rate)
+    vh = 10.0 ** (gain_db / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1.0 + k / q + k * k
+    shelf = [
+        (vh + vb * k / q + k * k) / a0,
+        2.0 * (k * k - vh) / a0,
+        (vh - vb * k / q + k * k) / a0,
+        1.0,
+        2.0 * (k * k - 1.0) / a0,
+        (1.0 - k / q + k * k) / a0,
+    ]
+
+    # RLB weighting: second-order high-pass at ~38 Hz.
+    q = 0.5003270373238773
+    k = math.tan(math.pi * 38.13547087602444 / sample_rate)
+    a0 = 1.0 + k / q + k * k
+    highpass = [1.0, -2.0, 1.0, 1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0]
+    return np.array([shelf, highpass], dtype=np.float64)
+
+
+def channel_weights(channels: int) -> np.ndarray:
+    # BS.1770 weights surround channels (Ls, Rs of a 5-channel layout) at +1.5 dB.
+    if channels == 5:
+        return np.array([1.0, 1.0, 1.0, 1.41, 1.41])
+    return np.ones(channels)
+
+
+class LoudnessMeter:
+    """Streaming integrated-loudness meter. Feed float blocks shaped (frames, channels)."""
+
+    def __init__(self, sample_rate: int, channels: int) -> None:
+        self.sos = k_weighting_sos(sample_rate)
+        # Zero filter state: the signal starts from silence, as BS.1770 assumes.
+        self.zi = np.zeros((len(self.sos), 2, channels))
+        self.hop = max(1, int(round(sample_rate * 0.1)))
+        self.weights = channel_weights(channels)
+        self.pending = np.zeros(channels)
+        self.pending_frames = 0
+        self.hop_energy: list[np.ndarray] = []
+
+    def push(self, block: np.ndarray) -> None:
+        if len(block) == 0:
+            return
+        filtered, self.zi = sosfilt(self.sos, block.astype(np.float64), axis=0, zi=self.zi)
+        squared = filtered * filtered
+
+        # Complete the hop left over from the previous block.
+        fill = min(self.hop - self.pending_frames, len(squared))
+        self.pending += squared[:fill].sum(axis=0)
+        self.pending_frames += fill
+        squared = squared[fill:]
+        if self.pending_frames < self.hop:
+            return
+        self.hop_energy.append(self.pending / self.hop)
+
+        whole = len(squared) // self.hop
+        if whole:
+            hops = squared[: whole * self.hop].reshape(whole, self.hop, -1).mean(axis=1)
+            self.hop_energy.extend(hops)
+        remainder = squared[whole * self.hop:]
+        self.pending = remainder.sum(axis=0)
+        self.pending_frames = len(remainder)
+
+    def integrated(self) -> float:
+        """Gated integrated loudness in LUFS (`-inf` for silence or sub-400 ms input)."""
+        if len(self.hop_energy) < HOPS_PER_BLOCK:
+            return float('-inf')
+        hops = np.asarray(self.hop_energy)
+        blocks = sliding_window_view(hops, HOPS_PER_BLOCK, axis=0).mean(axis=-1)
+        power = blocks @ self.weights
+        with np.errstate(divide='ignore'):
+            block_loudness = LOUDNESS_OFFSET + 10.0 * np.log10(power)
+
+        gated = power[block_loudness > ABSOLUTE_GATE_LUFS]
+        if gated.size == 0:
+            return float('-inf')
+        relative_gate = LOUDNESS_OFFSET + 10.0 * np.log10(gated.mean()) + RELATIVE_GATE_LU
+        gated = power[(block_loudness > ABSOLUTE_GATE_LUFS) & (block_loudness > relative_gate)]
+        if gated.size == 0:
+            return float('-inf')
+        return float(LOUDNESS_OFFSET + 10.0 * np.log10(gated.mean()))
+
+
+class TruePeakMeter:
+    """Streaming true-peak meter using a 4x polyphase interpolator."""
+
+    def __init__(self, channels: int) -> None:
+        self.taps = firwin(TRUE_PEAK_TAPS, 1.0 / TRUE_PEAK_OVERSAMPLE) * TRUE_PEAK_OVERSAMPLE
+        self.history = np.zeros((-(-len(self.taps) // TRUE_PEAK_OVERSAMPLE), channels))
+        self.peak = 0.0
+
+    def push(self, block: np.ndarray) -> None:
+        if len(block) == 0:
+            return
+        self.peak = max(self.peak, float(np.max(np.abs(block))))
+        signal = np.concatenate([self.history, block.astype(np.float64)])
+        oversampled = upfirdn(self.taps, signal, TRUE_PEAK_OVERSAMPLE, 1, axis=0)
+        fresh = oversampled[len(self.history) * TRUE_PEAK_OVERSAMPLE: len(signal) * TRUE_PEAK_OVERSAMPLE]
+        if len(fresh):
+            self.peak = max(self.peak, float(np.max(np.abs(fresh))))
+        self.history = signal[-len(self.history):]
+
+    def finish(self) -> float:
+        """Flush the filter tail and return the true peak in dBTP."""
+        self.push(np.zeros_like(self.history))
+        return 20.0 * math.log10(self.peak) if self.peak > 0 else float('-inf')
+
+
+def measure(data: np.ndarray, sample_rate: int) -> tuple[float, float]:
+    """Return (integrated LUFS, true peak dBTP) for a whole (frames, channels) array."""
+    if data.ndim == 1:
+        data = data[:, None]
+    loudness = LoudnessMeter(sample_rate, data.shape[1])
+    peak = TruePeakMeter(data.shape[1])
+    for start in range(0, len(data), MEASURE_BLOCK_FRAMES):
+        loudness.push(data[start:start + MEASURE_BLOCK_FRAMES])
+        peak.push(data[start:start + MEASURE_BLOCK_FRAMES])
+    return loudness.integrated(), peak.finish()
+
+
+def loudness_gain(measured_lufs: float, true_peak_db: float, target_lufs: float, ceiling_db: float) -> float:
+    """Linear gain that reaches `target_lufs` without pushing the true peak over `ceiling_db`."""
+    if not math.isfinite(measured_lufs):
+        return 1.0
+    gain_db = target_lufs - measured_lufs
+    if math.isfinite(true_peak_db):
+        gain_db = min(gain_db, ceiling_db - true_peak_db)
+    return min(10.0 ** (gain_db / 20.0), 10.0)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Signal-health metrics for AI music tracks: windowed RMS, DC offset, clipping and silence.
+
+`SignalAnalyzer` takes float blocks shaped (frames, channels) in order, so
+whole-track arrays and `sf.blocks` streams are measured the same way. Each
+block is viewed as non-overlapping RMS windows, with no copy. Sums, squares,
+clip counts and the first and last audible sample all come from that one
+pass. The DC offset is measured over the audible range only, so silent
+padding does not dilute it. Inter-sample clipping is the true peak of
+`TruePeakMeter` rising above 0 dBTP.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from ai_music_loudness import TruePeakMeter
+
+
+RMS_WINDOW_SECONDS = 0.05
+SILENCE_THRESHOLD_DB = -60.0
+CLIP_THRESHOLD = 0.999
+# Offsets below this (about -80 dBFS) are left alone by DC removal.
+DC_THRESHOLD = 1e-4
+TRIM_PAD_SECONDS = 0.01
+# `analyze` feeds whole arrays in slices of this many frames so the 4x true-peak pass stays small.
+ANALYZE_BLOCK_FRAMES = 65536
+
+
+@dataclass(frozen=True)
+class SignalMetrics:
+    sample_rate: int
+    frames: int
+    dc_offset: tuple[float, ...]
+    rms_db: float
+    window_rms_min_db: float
+    window_rms_max_db: float
+    clipped_samples: int
+    true_peak_db: float
+    first_audible: int
+    last_audible: int
+
+    @property
+    def leading_silence(self) -> float:
+        return self.first_audible / self.sample_rate
+
+    @property
+    def trailing_silence(self) -> float:
+        return (self.frames - self.last_audible) / self.sample_rate
+
+    @property
+    def has_dc(self) -> bool:
+        return max(abs(value) for value in self.dc_offset) > DC_THRESHOLD
+
+    def trim_bounds(self) -> tuple[int, int]:
+        """Frame range [start, stop) that keeps the audible part plus a short pad."""
+        pad = int(round(TRIM_PAD_SECONDS * self.sample_rate))
+        if self.last_audible <= self.first_audible:
+            return 0, self.frames
+        return max(0, self.first_audible - pad), min(self.frames, self.last_audible + pad)
+
+    def summary(self) -> str:
+        dc = '/'.join(f'{value:+.5f}' for value in self.dc_offset)
+        return (
+            f'rms {self.rms_db:.1f} dBFS (windows {self.window_rms_min_db:.1f}..{self.window_rms_max_db:.1f}), '
+            f'dc {dc}, clipped {self.clipped_samples}, true peak {self.true_peak_db:.1f} dBTP, '
+            f'silence {self.leading_silence:.2f}s lead / {self.trailing_silence:.2f}s tail'
+        )
+
+    def warnings(self) -> list[str]:
+        issues = []
+        if self.clipped_samples:
+            issues.append(f'{self.clipped_samples} clipped sample(s)')
+        if self.true_peak_db > 0.0:
+            issues.append(f'inter-sample clipping ({self.true_peak_db:.2f} dBTP)')
+        if self.has_dc:
+            issues.append('DC offset ' + '/'.join(f'{value:+.5f}' for value in self.dc_offset))
+        if self.leading_silence > 0.5 or self.trailing_silence > 0.5:
+            issues.append(f'{self.leading_silence:.2f}s leading / {self.trailing_silence:.2f}s trailing silence')
+        return issues
+
+
+def to_db(power: float) -> float:
+    return 10.0 * math.log10(power) if power > 0 else float('-inf')
+
+
+class SignalAnalyzer:
+    """Streaming signal-health meter."""
+
+    def __init__(self, sample_rate: int, channels: int, window_seconds: float = RMS_WINDOW_SECONDS) -> None:
+        self.sample_rate = sample_rate
+        self.window = max(1, int(round(sample_rate * window_seconds)))
+        self.silence = 10.0 ** (SILENCE_THRESHOLD_DB / 20.0)
+        self.true_peak = TruePeakMeter(channels)
+        self.frames = 0
+        self.total = np.zeros(channels)
+        self.sum_before_audible = np.zeros(channels)
+        self.sum_through_audible = np.zeros(channels)
+        self.total_squares = 0.0
+        self.clipped = 0
+        self.window_min = float('inf')
+        self.window_max = 0.0
+        self.first_audible = -1
+        self.last_audible = 0
+        self.pending = np.zeros((0, channels))
+
+    def push(self, block: np.ndarray) -> None:
+        if block.ndim == 1:
+            block = block[:, None]
+        if len(block) == 0:
+            return
+        block = block.astype(np.float64, copy=False)
+        offset = self.frames
+        self.frames += len(block)
+        self.true_peak.push(block)
+
+        magnitude = np.abs(block)
+        self.total_squares += float(np.einsum('ij,ij->', block, block))
+        self.clipped += int(np.count_nonzero(magnitude >= CLIP_THRESHOLD))
+        audible = np.flatnonzero(magnitude.max(axis=1) > self.silence)
+        if audible.size:
+            if self.first_audible < 0:
+                self.first_audible = offset + int(audible[0])
+                self.sum_before_audible = self.total + block[: audible[0]].sum(axis=0)
+            self.last_audible = offset + int(audible[-1]) + 1
+            self.sum_through_audible = self.total + block[: audible[-1] + 1].sum(axis=0)
+        self.total += block.sum(axis=0)
+
+        # Windows straddling block boundaries are completed from the pending remainder.
+        joined = np.concatenate([self.pending, block]) if len(self.pending) else block
+        count = len(joined) // self.window
+        if count:
+            rows, cols = joined.strides
+            windows = as_strided(joined, shape=(count, self.window, joined.shape[1]), strides=(rows * self.window, rows, cols))
+            power = np.einsum('wfc,wfc->w', windows, windows) / (self.window * joined.shape[1])
+            self.window_min = min(self.window_min, float(power.min()))
+            self.window_max = max(self.window_max, float(power.max()))
+        self.pending = joined[count * self.window:].copy()
+
+    def result(self) -> SignalMetrics:
+        channels = len(self.total)
+        frames = max(1, self.frames)
+        audible = self.last_audible - self.first_audible if self.first_audible >= 0 else 0
+        dc = (self.sum_through_audible - self.sum_before_audible) / audible if audible > 0 else self.total / frames
+        return SignalMetrics(
+            sample_rate=self.sample_rate,
+            frames=self.frames,
+            dc_offset=tuple(float(value) for value in dc),
+            rms_db=to_db(self.total_squares / (frames * channels)),
+            window_rms_min_db=to_db(self.window_min) if math.isfinite(self.window_min) else float('-inf'),
+            window_rms_max_db=to_db(self.window_max),
+            clipped_samples=self.clipped,
+            true_peak_db=self.true_peak.finish(),
+            first_audible=max(0, self.first_audible),
+            last_audible=self.last_audible if self.first_audible >= 0 else 0
+        )
+
+
+def analyze(data: np.ndarray, sample_rate: int) -> SignalMetrics:
+    if data.ndim == 1:
+        data = data[:, None]
+    analyzer = SignalAnalyzer(sample_rate, data.shape[1])
+    for start in range(0, len(data), ANALYZE_BLOCK_FRAMES):
+        analyzer.push(data[start:start + ANALYZE_BLOCK_FRAMES])
+    return analyzer.result()
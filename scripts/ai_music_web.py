@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Compressed web renditions of normalized AI music tracks.
+
+Each normalized FLAC is encoded to OGG Vorbis at every tier in
+`WEB_RENDITIONS`, and every (track, tier) pair runs as its own pool task.
+`manifest.json` in the rendition directory records each file's size,
+duration and bitrate, plus the connection types it suits, so the loader can
+pick a tier from `navigator.connection.effectiveType`. Renditions are reused
+when the source FLAC's STREAMINFO audio MD5 is unchanged.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import json
+from pathlib import Path
+
+import soundfile as sf
+from mutagen.flac import FLAC
+
+
+MANIFEST_NAME = 'manifest.json'
+ENCODE_BLOCK_FRAMES = 65536
+
+
+@dataclass(frozen=True)
+class WebRendition:
+    tier: str
+    # libsndfile maps Vorbis quality to 1 - compression_level.
+    compression_level: float
+    connections: tuple[str, ...]
+
+
+WEB_RENDITIONS = (
+    WebRendition('high', 0.2, ('4g',)),
+    WebRendition('medium', 0.5, ('3g',)),
+    WebRendition('low', 0.8, ('2g', 'slow-2g')),
+)
+
+
+def audio_md5(path: Path) -> str:
+    return format(FLAC(path).info.md5_signature, '032x')
+
+
+def rendition_path(web_dir: Path, track_id: str, rendition: WebRendition) -> Path:
+    return web_dir / f'{track_id}.{rendition.tier}.ogg'
+
+
+def encode_rendition(source_path: Path, output_path: Path, rendition: WebRendition) -> dict:
+    """Encode one OGG Vorbis rendition and return its manifest entry."""
+    info = sf.info(str(source_path))
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = output_path.with_name(f'{output_path.name}.partial')
+    # Block-wise writes: libsndfile's Vorbis encoder can crash on very large single writes.
+    with sf.SoundFile(
+        str(partial_path),
+        'w',
+        samplerate=info.samplerate,
+        channels=info.channels,
+        format='OGG',
+        subtype='VORBIS',
+        compression_level=rendition.compression_level
+    ) as out:
+        for block in sf.blocks(str(source_path), blocksize=ENCODE_BLOCK_FRAMES, dtype='float32', always_2d=True):
+            out.write(block)
+    partial_path.replace(output_path)
+    return describe_rendition(output_path, rendition)
+
+
+def describe_rendition(path: Path, rendition: WebRendition) -> dict:
+    info = sf.info(str(path))
+    size = path.stat().st_size
+    return {
+        'tier': rendition.tier,
+        'file': path.name,
+        'bytes': size,
+        'duration': round(info.frames / info.samplerate, 3),
+        'kbps': round(size * 8 / 1000 / (info.frames / info.samplerate), 1) if info.frames else 0.0,
+        'connections': list(rendition.connections)
+    }
+
+
+def load_manifest(web_dir: Path) -> dict:
+    path = web_dir / MANIFEST_NAME
+    if not path.exists():
+        return {'tracks': {}}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def build_renditions(sources: list[tuple[Path, str]], web_dir: Path, max_workers: int) -> tuple[list[str], list[str]]:
+    """Encode missing or stale renditions in parallel and update the manifest.
+
+    Returns (log lines, failures).
+    """
+    manifest = load_manifest(web_dir)
+    tracks = manifest.setdefault('tracks', {})
+    lines: list[str] = []
+    failures: list[str] = []
+
+    pending: list[tuple[str, Path, WebRendition]] = []
+    source_md5: dict[str, str] = {}
+    for source_path, track_id in sources:
+        md5 = audio_md5(source_path)
+        source_md5[track_id] = md5
+        entry = tracks.get(track_id, {})
+        for rendition in WEB_RENDITIONS:
+            if entry.get('sourceMd5') == md5 and rendition_path(web_dir, track_id, rendition).exists():
+                lines.append(f'[SKIP] {track_id}.{rendition.tier}.ogg: source unchanged')
+                continue
+            pending.append((track_id, source_path, rendition))
+
+    encoded: dict[tuple[str, str], dict] = {}
+    with ProcessPoolExecutor(max_workers=max(1, min(max_workers, len(pending) or 1))) as pool:
+        futures = {
+            (track_id, rendition.tier): pool.submit(
+                encode_rendition, source_path, rendition_path(web_dir, track_id, rendition), rendition
+            )
+            for track_id, source_path, rendition in pending
+        }
+        for key, future in futures.items():
+            try:
+                encoded[key] = future.result()
+            except Exception as exc:
+                failures.append(f'{key[0]}.{key[1]}.ogg: {exc}')
+
+    for source_path, track_id in sources:
+        renditions = []
+        for rendition in WEB_RENDITIONS:
+            path = rendition_path(web_dir, track_id, rendition)
+            entry = encoded.get((track_id, rendition.tier))
+            if entry is None and path.exists():
+                entry = describe_rendition(path, rendition)
+            if entry is None:
+                continue
+            if (track_id, rendition.tier) in encoded:
+                lines.append(f'[WEB] {entry["file"]}: {entry["bytes"]} bytes, {entry["kbps"]:.0f} kbps')
+            renditions.append(entry)
+        tracks[track_id] = {
+            'source': source_path.name,
+            'sourceBytes': source_path.stat().st_size,
+            'sourceMd5': source_md5[track_id],
+            'renditions': renditions
+        }
+
+    manifest['tracks'] = dict(sorted(tracks.items()))
+    web_dir.mkdir(parents=True, exist_ok=True)
+    (web_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2) + '\n', encoding='utf-8')
+    return lines, failures
+
+
+def verify_renditions(manifest: dict, web_dir: Path, track_id: str, source_path: Path) -> list[str]:
+    """Return problems with a track's manifest entry and rendition files."""
+    entry = manifest.get('tracks', {}).get(track_id)
+    if entry is None:
+        return ['missing from web manifest']
+    problems: list[str] = []
+    source = sf.info(str(source_path))
+    source_duration = source.frames / source.samplerate
+    if entry.get('sourceMd5') != audio_md5(source_path):
+        problems.append('web renditions are stale (source audio changed)')
+
+    tiers = {rendition['tier']: rendition for rendition in entry.get('renditions', [])}
+    for rendition in WEB_RENDITIONS:
+        listed = tiers.get(rendition.tier)
+        if listed is None:
+            problems.append(f'{rendition.tier}: missing from manifest')
+            continue
+        path = web_dir / listed['file']
+        if not path.exists():
+            problems.append(f'{rendition.tier}: missing file {path}')
+            continue
+        if path.stat().st_size != listed['bytes']:
+            problems.append(f'{rendition.tier}: size {path.stat().st_size} != manifest {listed["bytes"]}')
+        info = sf.info(str(path))
+        if info.format != 'OGG' or info.subtype != 'VORBIS':
+            problems.append(f'{rendition.tier}: {info.format}/{info.subtype} is not OGG/VORBIS')
+        duration = info.frames / info.samplerate
+        if abs(duration - listed['duration']) > 0.01 or abs(duration - source_duration) > 0.05:
+            problems.append(
+                f'{rendition.tier}: duration {duration:.2f}s vs manifest {listed["duration"]:.2f}s, source {source_duration:.2f}s'
+            )
+    return problems
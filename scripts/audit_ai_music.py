@@ -2,6 +2,11 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import json
+import os
 from pathlib import Path
 
 import numpy as np
@@ -9,6 +14,9 @@ import soundfile as sf
 
 from mutagen.flac import FLAC
 
+from ai_music_signal import SignalAnalyzer
+from ai_music_web import MANIFEST_NAME, load_manifest, verify_renditions
+
 
 TRACK_IDS = [
     'world-1',
@@ -34,6 +42,18 @@ WORLD_BOSS_MIN = 47.0
 TARGET_SR = 44100
 TARGET_CHANNELS = 2
 TARGET_FORMAT = 'flac'
+BLOCK_FRAMES = 65536
+DEFAULT_CACHE_PATH = 'artifacts/music/audit_cache.json'
+# Bump when check_track semantics change so stale cache entries are discarded.
+AUDIT_VERSION = 3
+
+
+@dataclass(frozen=True)
+class AuditResult:
+    track_id: str
+    passed: bool
+    output: str
+    cached: bool = False
 
 
 def parse_args() -> argparse.Namespace:
@@ -44,6 +64,23 @@ def parse_args() -> argparse.Namespace:
         default=','.join(TRACK_IDS),
         help='Comma-separated track IDs to validate (default: all expected tracks).'
     )
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Stream blocks and stop at the first non-zero block instead of decoding the whole track.'
+    )
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Tracks audited concurrently.')
+    parser.add_argument(
+        '--cache',
+        default=DEFAULT_CACHE_PATH,
+        help='Result cache keyed on size, mtime and content hash (empty string disables).'
+    )
+    parser.add_argument('--web-dir', help='Web rendition directory (default: <input-dir>/web).')
+    parser.add_argument(
+        '--require-web',
+        action='store_true',
+        help='Fail if the web rendition manifest is missing (otherwise it is only checked when present).'
+    )
     return parser.parse_args()
 
 
@@ -58,51 +95,133 @@ def expected_min_duration(track_id: str) -> float:
     return TITLE_WORLD_MAP_MIN if track_id in {'title', 'world-map'} else WORLD_BOSS_MIN
 
 
-def check_track(path: Path, track_id: str) -> bool:
+def has_signal(path: Path, block_frames: int = BLOCK_FRAMES) -> bool:
+    for block in sf.blocks(str(path), blocksize=block_frames, dtype='float32'):
+        if np.any(block):
+            return True
+    return False
+
+
+def check_track(path: Path, track_id: str, fast: bool = False) -> tuple[bool, list[str]]:
+    """Audit one track; returns (passed, report lines) instead of printing so tracks can run concurrently."""
+    lines: list[str] = []
     if not path.exists():
-        print(f'FAIL {track_id}: missing file {path}')
-        return False
+        lines.append(f'FAIL {track_id}: missing file {path}')
+        return False, lines
 
     try:
         FLAC(str(path))
     except Exception as error:
-        print(f'FAIL {track_id}: mutagen could not parse FLAC container ({error})')
-        return False
+        lines.append(f'FAIL {track_id}: mutagen could not parse FLAC container ({error})')
+        return False, lines
 
     info = sf.info(str(path))
     if info.format.lower() != TARGET_FORMAT:
-        print(f'FAIL {track_id}: format={info.format} != {TARGET_FORMAT}')
-        return False
+        lines.append(f'FAIL {track_id}: format={info.format} != {TARGET_FORMAT}')
+        return False, lines
 
     if info.samplerate != TARGET_SR:
-        print(f'FAIL {track_id}: sample rate {info.samplerate} != {TARGET_SR}')
-        return False
+        lines.append(f'FAIL {track_id}: sample rate {info.samplerate} != {TARGET_SR}')
+        return False, lines
 
     if info.channels != TARGET_CHANNELS:
-        print(f'FAIL {track_id}: channels {info.channels} != {TARGET_CHANNELS}')
-        return False
+        lines.append(f'FAIL {track_id}: channels {info.channels} != {TARGET_CHANNELS}')
+        return False, lines
 
     if info.frames <= 0:
-        print(f'FAIL {track_id}: empty or zero-frame audio')
-        return False
+        lines.append(f'FAIL {track_id}: empty or zero-frame audio')
+        return False, lines
 
     duration = float(info.frames) / float(info.samplerate)
     min_duration = expected_min_duration(track_id)
     if duration < min_duration:
-        print(f'FAIL {track_id}: duration {duration:.2f}s < {min_duration:.2f}s')
-        return False
+        lines.append(f'FAIL {track_id}: duration {duration:.2f}s < {min_duration:.2f}s')
+        return False, lines
 
-    data, _ = sf.read(str(path), dtype='float32')
-    if data.size == 0:
-        print(f'FAIL {track_id}: no audio data')
-        return False
+    if fast:
+        if not has_signal(path):
+            lines.append(f'FAIL {track_id}: zero-energy output')
+            return False, lines
+    else:
+        # One streamed pass measures the track and checks for signal, so memory stays at one block.
+        analyzer = SignalAnalyzer(info.samplerate, info.channels)
+        audible = False
+        for block in sf.blocks(str(path), blocksize=BLOCK_FRAMES, dtype='float32', always_2d=True):
+            analyzer.push(block)
+            audible = audible or bool(np.any(block))
+        if analyzer.frames == 0:
+            lines.append(f'FAIL {track_id}: no audio data')
+            return False, lines
 
-    if np.max(np.abs(data)) <= 0:
-        print(f'FAIL {track_id}: zero-energy output')
-        return False
+        if not audible:
+            lines.append(f'FAIL {track_id}: zero-energy output')
+            return False, lines
 
-    print(f'PASS {track_id}: {duration:.2f}s {info.samplerate}Hz {info.channels}ch {path.stat().st_size} bytes')
-    return True
+    lines.append(f'PASS {track_id}: {duration:.2f}s {info.samplerate}Hz {info.channels}ch {path.stat().st_size} bytes')
+    if not fast:
+        metrics = analyzer.result()
+        lines.append(f'INFO {track_id}: {metrics.summary()}')
+        for warning in metrics.warnings():
+            lines.append(f'WARN {track_id}: {warning}')
+    return True, lines
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open('rb') as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cache(cache_path: Path | None) -> dict:
+    if cache_path is None or not cache_path.exists():
+        return {}
+    try:
+        cache = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != AUDIT_VERSION:
+        return {}
+    return cache.get('tracks', {})
+
+
+def save_cache(cache_path: Path | None, entries: dict) -> None:
+    if cache_path is None:
+        return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps({'version': AUDIT_VERSION, 'tracks': entries}, indent=2) + '\n', encoding='utf-8')
+
+
+def cached_result(entry: dict | None, path: Path, fast: bool) -> tuple[dict | None, bool]:
+    """Return (cache entry with a fresh stat, hit) for `path`."""
+    if not path.exists():
+        return None, False
+    stat = path.stat()
+    fresh = {'path': str(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    # A full-decode result also answers a fast audit; a fast result never answers a full one.
+    usable = entry is not None and entry.get('path') == str(path) and (fast or not entry.get('fast'))
+    if usable and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+        return {**entry, **fresh}, True
+
+    fresh['sha256'] = file_digest(path)
+    if usable and entry['size'] == stat.st_size and entry.get('sha256') == fresh['sha256']:
+        return {**entry, **fresh}, True
+    return fresh, False
+
+
+def audit_track(path: Path, track_id: str, fast: bool, entry: dict | None) -> tuple[AuditResult, dict | None]:
+    fresh, hit = cached_result(entry, path, fast)
+    if hit and fresh is not None:
+        return AuditResult(track_id, fresh['passed'], fresh['output'], cached=True), fresh
+
+    passed, lines = check_track(path, track_id, fast)
+    result = AuditResult(track_id, passed, ''.join(f'{line}\n' for line in lines))
+    if fresh is None:
+        return result, None
+    if 'sha256' not in fresh:
+        fresh['sha256'] = file_digest(path)
+    return result, {**fresh, 'fast': fast, 'passed': passed, 'output': result.output}
 
 
 def main() -> None:
@@ -110,11 +229,44 @@ def main() -> None:
     input_dir = Path(args.input_dir)
     track_ids = parse_tracks(args.tracks)
     files_to_check = [(input_dir / f'{track_id}.flac', track_id) for track_id in track_ids]
+    cache_path = Path(args.cache) if args.cache else None
+    cache = load_cache(cache_path)
+
+    # Decoding and hashing release the GIL, so threads give real parallelism here.
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        outcomes = list(pool.map(
+            lambda item: audit_track(item[0], item[1], args.fast, cache.get(item[1])),
+            files_to_check
+        ))
 
     failures = []
-    for path, track_id in files_to_check:
-        if not check_track(path, track_id):
-            failures.append(track_id)
+    for result, entry in outcomes:
+        print(result.output, end='')
+        if entry is not None:
+            cache[result.track_id] = entry
+        if not result.passed:
+            failures.append(result.track_id)
+    web_dir = Path(args.web_dir) if args.web_dir else input_dir / 'web'
+    if (web_dir / MANIFEST_NAME).exists():
+        manifest = load_manifest(web_dir)
+        for path, track_id in files_to_check:
+            if track_id in failures:
+                continue
+            problems = verify_renditions(manifest, web_dir, track_id, path)
+            for problem in problems:
+                print(f'FAIL {track_id}: web {problem}')
+            if problems:
+                failures.append(track_id)
+            else:
+                print(f'PASS {track_id}: web renditions match {web_dir / MANIFEST_NAME}')
+    elif args.require_web:
+        print(f'FAIL web: missing manifest {web_dir / MANIFEST_NAME}')
+        failures.append('web')
+
+    reused = sum(1 for result, _ in outcomes if result.cached)
+    if cache_path is not None:
+        save_cache(cache_path, cache)
+        print(f'Audit cache: {reused}/{len(outcomes)} track(s) reused from {cache_path}.')
 
     if failures:
         print(f'{len(failures)} track(s) failed quality gate.')
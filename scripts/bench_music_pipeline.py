@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Benchmark the AI music pipeline and flag regressions against a JSON baseline.
+
+Deterministic test tracks are synthesized for every case in `CASES`, in
+several sample rates, channel counts and lengths, so runs are comparable
+across machines and commits. Each stage is timed as the best of `--repeat`
+runs. It is then run once more under `tracemalloc` to get its peak Python/NumPy
+allocation. libsndfile's own C buffers are not visible to tracemalloc.
+Results are normalized per minute of audio. A stage regresses when its time
+or memory exceeds the baseline by more than `--tolerance`, ignoring
+differences below `NOISE_FLOOR`.
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+import io
+import json
+from pathlib import Path
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+import soundfile as sf
+
+from audit_ai_music import check_track
+from normalize_ai_music import infer_profile, normalize_track, normalize_track_streaming, resample
+
+
+DEFAULT_BASELINE = 'artifacts/music/bench_baseline.json'
+DEFAULT_RESULTS = 'artifacts/music/bench_latest.json'
+BENCH_TRACK_ID = 'world-1'
+# Differences below these are timer/allocator noise and never count as regressions.
+NOISE_FLOOR = {'secondsPerMinute': 0.01, 'peakMbPerMinute': 0.5}
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    sample_rate: int
+    channels: int
+    seconds: float
+
+    @property
+    def name(self) -> str:
+        return f'{self.sample_rate}hz-{self.channels}ch-{self.seconds:g}s'
+
+
+CASES = (
+    BenchCase(48000, 2, 60.0),
+    BenchCase(44100, 2, 60.0),
+    BenchCase(32000, 1, 60.0),
+    BenchCase(22050, 1, 120.0),
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Time and memory-profile the AI music pipeline.')
+    parser.add_argument('--cases', help='Comma-separated case names to run (default: all). See --list.')
+    parser.add_argument('--list', action='store_true', help='List benchmark cases and exit.')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage; the fastest is kept.')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline JSON to compare against.')
+    parser.add_argument('--results', default=DEFAULT_RESULTS, help='Where to write this run\'s results.')
+    parser.add_argument('--update-baseline', action='store_true', help='Write this run\'s results as the new baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed fractional slowdown/growth (default: 0.25).')
+    return parser.parse_args()
+
+
+def synthesize(case: BenchCase) -> np.ndarray:
+    """A deterministic chord-plus-noise track for `case`, shaped (frames, channels)."""
+    rng = np.random.default_rng([case.sample_rate, case.channels, int(case.seconds * 1000)])
+    t = np.arange(int(case.sample_rate * case.seconds), dtype=np.float64) / case.sample_rate
+    tones = sum(np.sin(2.0 * np.pi * freq * t + phase) for freq, phase in zip((110.0, 220.0, 330.0, 495.0), rng.uniform(0, 6.28, 4)))
+    envelope = 0.6 + 0.4 * np.sin(2.0 * np.pi * 0.25 * t)
+    mono = 0.15 * tones * envelope
+    channels = [mono + rng.normal(0.0, 0.01, mono.shape) for _ in range(case.channels)]
+    return np.stack(channels, axis=1).astype(np.float32)
+
+
+def measure(stage: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Return (best seconds, peak MB) for a zero-argument stage."""
+    best = float('inf')
+    for _ in range(max(1, repeat)):
+        with redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            stage()
+            best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    try:
+        with redirect_stdout(io.StringIO()):
+            stage()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak / (1024 * 1024)
+
+
+def bench_case(case: BenchCase, workdir: Path, repeat: int) -> dict[str, dict[str, float]]:
+    data = synthesize(case)
+    profile = infer_profile(BENCH_TRACK_ID)
+    source = workdir / f'{case.name}.source.flac'
+    sf.write(str(source), data, case.sample_rate, format='FLAC', subtype='PCM_16')
+    resampled = resample(data, case.sample_rate, profile.target_sr)
+    output = workdir / f'{case.name}.flac'
+    streamed = workdir / f'{case.name}.streamed.flac'
+    encoded = workdir / f'{case.name}.encoded.flac'
+
+    stages: dict[str, Callable[[], object]] = {
+        'resample': lambda: resample(data, case.sample_rate, profile.target_sr),
+        'normalize': lambda: normalize_track(source, output, profile, False),
+        'normalize-streaming': lambda: normalize_track_streaming(source, streamed, profile, False, 65536),
+        'encode': lambda: sf.write(str(encoded), resampled, profile.target_sr, format='FLAC', subtype='PCM_24'),
+        'audit': lambda: check_track(output, BENCH_TRACK_ID),
+        'audit-fast': lambda: check_track(output, BENCH_TRACK_ID, fast=True),
+    }
+    minutes = case.seconds / 60.0
+    results = {}
+    for stage_name, stage in stages.items():
+        seconds, peak_mb = measure(stage, repeat)
+        results[stage_name] = {
+            'secondsPerMinute': round(seconds / minutes, 4),
+            'peakMbPerMinute': round(peak_mb / minutes, 3),
+        }
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for case_name, stages in results.items():
+        for stage_name, metrics in stages.items():
+            reference = baseline.get(case_name, {}).get(stage_name)
+            if reference is None:
+                continue
+            for key, unit in (('secondsPerMinute', 's/min'), ('peakMbPerMinute', 'MB/min')):
+                if metrics[key] - reference[key] <= NOISE_FLOOR[key]:
+                    continue
+                if metrics[key] > reference[key] * (1.0 + tolerance):
+                    growth = f'+{(metrics[key] / reference[key] - 1.0) * 100:.0f}%' if reference[key] > 0 else 'new'
+                    regressions.append(
+                        f'{case_name} {stage_name}: {metrics[key]:.3f} {unit} vs baseline {reference[key]:.3f} ({growth})'
+                    )
+    return regressions
+
+
+def main() -> None:
+    args = parse_args()
+    if args.list:
+        for case in CASES:
+            print(case.name)
+        return
+
+    selected = {entry.strip() for entry in args.cases.split(',') if entry.strip()} if args.cases else None
+    cases = [case for case in CASES if selected is None or case.name in selected]
+    if not cases:
+        print('No benchmark cases selected.')
+        raise SystemExit(1)
+
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    with tempfile.TemporaryDirectory(prefix='music-bench-') as tmp:
+        for case in cases:
+            results[case.name] = bench_case(case, Path(tmp), args.repeat)
+            for stage_name, metrics in results[case.name].items():
+                print(
+                    f'[BENCH] {case.name} {stage_name}: {metrics["secondsPerMinute"]:.3f} s/min, '
+                    f'{metrics["peakMbPerMinute"]:.1f} MB/min peak'
+                )
+
+    results_path = Path(args.results)
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    results_path.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        merged = json.loads(baseline_path.read_text(encoding='utf-8')) if baseline_path.exists() else {}
+        merged.update(results)
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(merged, indent=2) + '\n', encoding='utf-8')
+        print(f'Baseline updated: {baseline_path}')
+        return
+
+    if not baseline_path.exists():
+        print(f'No baseline at {baseline_path}; run with --update-baseline to record one.')
+        return
+
+    regressions = compare(results, json.loads(baseline_path.read_text(encoding='utf-8')), args.tolerance)
+    if regressions:
+        print('Music pipeline regressions:')
+        for entry in regressions:
+            print(f' - {entry}')
+        raise SystemExit(1)
+
+    print(f'No regressions beyond {args.tolerance * 100:.0f}% of {baseline_path}.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Find seamless loop points for AI music tracks and export them as metadata.
+
+For each candidate loop end E near the tail of a track, a Hann-windowed
+template of the audio after E is cross-correlated (FFT) against the audio
+near the start of the track. The best loop start S is the offset where the
+audio after S most closely matches the audio after E. The match is scored by
+normalized cross-correlation. Loop lengths (E - S) are never shorter than the
+`min_duration` that `normalize_ai_music.infer_profile` sets for the track.
+
+Results are written as LOOPSTART / LOOPEND Vorbis comments (sample frames)
+and merged into a JSON sidecar next to the tracks.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import json
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+from mutagen.flac import FLAC
+from scipy.fft import irfft, next_fast_len, rfft
+from scipy.signal import correlate, get_window
+
+from normalize_ai_music import TRACK_IDS, infer_profile
+
+
+DEFAULT_SIDECAR = 'loop_points.json'
+# Overlap-save block length in comparison windows; larger blocks waste less of each inverse FFT.
+BLOCK_WINDOWS = 8
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Detect sample-accurate loop points for AI music tracks.')
+    parser.add_argument('--input-dir', default='public/music/ai', help='Directory containing normalized FLAC tracks.')
+    parser.add_argument(
+        '--tracks',
+        default=','.join(track_id for track_id in TRACK_IDS if track_id.startswith(('world-', 'boss-'))),
+        help='Comma-separated track IDs to analyze (default: looping world-* and boss-* tracks).'
+    )
+    parser.add_argument('--window-seconds', type=float, default=1.0, help='Length of the compared region after each point.')
+    parser.add_argument('--hop-seconds', type=float, default=0.25, help='Spacing between candidate loop ends.')
+    parser.add_argument('--min-loop-seconds', type=float, help='Override the profile minimum loop length.')
+    parser.add_argument('--min-score', type=float, default=0.8, help='Reject loops whose correlation is below this.')
+    parser.add_argument('--sidecar', default=DEFAULT_SIDECAR, help='JSON sidecar file name, relative to --input-dir.')
+    parser.add_argument('--dry-run', action='store_true', help='Report loop points without writing tags or the sidecar.')
+    return parser.parse_args()
+
+
+def parse_tracks(tracks_arg: str) -> list[str]:
+    return [entry.strip() for entry in tracks_arg.split(',') if entry.strip()]
+
+
+@dataclass(frozen=True)
+class PreparedSignal:
+    """Per-track FFT state shared by every candidate loop end.
+
+    `spectra` holds overlap-save blocks: the real FFT of `block` frames starting every `step` frames, so one
+    block yields `step` correlation offsets. `energy` is the Hann-windowed signal energy at each offset.
+    """
+
+    spectra: np.ndarray
+    energy: np.ndarray
+    block: int
+    step: int
+
+
+def prepare_signal(signal: np.ndarray, window: np.ndarray) -> PreparedSignal:
+    width = len(window)
+    block = next_fast_len(BLOCK_WINDOWS * width, real=True)
+    step = block - width + 1
+    count = -(-(len(signal) - width + 1) // step)
+    padded = np.zeros((count - 1) * step + block)
+    padded[:len(signal)] = signal
+    spectra = rfft(np.lib.stride_tricks.sliding_window_view(padded, block)[::step], axis=1)
+    energy = correlate(signal * signal, window, mode='valid', method='fft')
+    return PreparedSignal(spectra, energy, block, step)
+
+
+def best_match(prepared: PreparedSignal, template: np.ndarray, window: np.ndarray, limit: int) -> tuple[int, float]:
+    """Return (offset, score) of the windowed normalized cross-correlation peak of `template`.
+
+    Only offsets below `limit` are searched, so only the blocks covering them are inverse transformed.
+    """
+    weighted = template * window
+    kernel = np.conj(rfft(weighted, prepared.block))
+    blocks = -(-limit // prepared.step)
+    numerator = irfft(prepared.spectra[:blocks] * kernel, prepared.block, axis=1)[:, :prepared.step].reshape(-1)[:limit]
+    template_energy = float(np.dot(weighted, template))
+    denominator = np.sqrt(np.maximum(prepared.energy[:limit], 0.0) * template_energy)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        score = np.where(denominator > 1e-12, numerator / denominator, 0.0)
+    offset = int(np.argmax(score))
+    return offset, float(score[offset])
+
+
+def find_loop(mono: np.ndarray, sample_rate: int, min_loop: float, window_seconds: float, hop_seconds: float) -> tuple[int, int, float]:
+    """Return (loop start, loop end, score) in frames for a mono signal."""
+    frames = len(mono)
+    width = max(1, int(round(window_seconds * sample_rate)))
+    hop = max(1, int(round(hop_seconds * sample_rate)))
+    min_frames = int(round(min_loop * sample_rate))
+    last_end = frames - width
+    if last_end < min_frames:
+        raise RuntimeError(
+            f'track is {frames / sample_rate:.2f}s; a {min_loop:.2f}s loop plus a {window_seconds:.2f}s '
+            'comparison window does not fit'
+        )
+
+    window = get_window('hann', width).astype(np.float64)
+    prepared = prepare_signal(mono, window)
+    best = (0, last_end, -1.0)
+    for end in range(last_end, min_frames - 1, -hop):
+        # Loop starts may only sit early enough to keep the loop at least `min_frames` long.
+        start, score = best_match(prepared, mono[end:end + width], window, end - min_frames + 1)
+        if score > best[2]:
+            best = (start, end, score)
+    return best
+
+
+def write_loop_tags(path: Path, loop_start: int, loop_end: int) -> None:
+    media = FLAC(path)
+    media['LOOPSTART'] = str(loop_start)
+    media['LOOPEND'] = str(loop_end)
+    media.save()
+
+
+def analyze_track(path: Path, track_id: str, args: argparse.Namespace) -> dict:
+    if not path.exists():
+        raise RuntimeError(f'missing file {path}')
+    data, sample_rate = sf.read(str(path), dtype='float64', always_2d=True)
+    mono = data.mean(axis=1)
+    min_loop = args.min_loop_seconds if args.min_loop_seconds is not None else infer_profile(track_id).min_duration
+    loop_start, loop_end, score = find_loop(mono, sample_rate, min_loop, args.window_seconds, args.hop_seconds)
+    if score < args.min_score:
+        raise RuntimeError(f'best loop scores {score:.3f}, below --min-score {args.min_score:.3f}')
+    return {
+        'sampleRate': sample_rate,
+        'loopStart': loop_start,
+        'loopEnd': loop_end,
+        'loopStartSeconds': round(loop_start / sample_rate, 6),
+        'loopEndSeconds': round(loop_end / sample_rate, 6),
+        'score': round(score, 4)
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    input_dir = Path(args.input_dir)
+    sidecar_path = input_dir / args.sidecar
+    loops: dict[str, dict] = {}
+    if sidecar_path.exists():
+        loops = json.loads(sidecar_path.read_text(encoding='utf-8'))
+
+    failures: list[str] = []
+    for track_id in parse_tracks(args.tracks):
+        path = input_dir / f'{track_id}.flac'
+        try:
+            loop = analyze_track(path, track_id, args)
+        except Exception as exc:
+            failures.append(f'{track_id}: {exc}')
+            continue
+        loops[track_id] = loop
+        if not args.dry_run:
+            write_loop_tags(path, loop['loopStart'], loop['loopEnd'])
+        print(
+            f'[LOOP] {track_id}: {loop["loopStartSeconds"]:.3f}s -> {loop["loopEndSeconds"]:.3f}s '
+            f'({(loop["loopEnd"] - loop["loopStart"]) / loop["sampleRate"]:.2f}s, score {loop["score"]:.3f})'
+        )
+
+    if not args.dry_run:
+        sidecar_path.write_text(json.dumps(dict(sorted(loops.items())), indent=2) + '\n', encoding='utf-8')
+        print(f'Wrote {sidecar_path}')
+
+    if failures:
+        print('Loop detection failed:')
+        for entry in failures:
+            print(f' - {entry}')
+        raise SystemExit(1)
+
+    print('Loop detection complete.')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,15 +2,37 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+import hashlib
+import io
+import json
+import math
+import os
 from pathlib import Path
+import shutil
+import time
 from typing import Iterable
 
 import numpy as np
 import soundfile as sf
 from mutagen import File
-from scipy.signal import resample_poly
+from mutagen.flac import FLAC
+from scipy.signal import firwin, resample_poly, upfirdn
 
+from ai_music_loudness import LoudnessMeter, TruePeakMeter, loudness_gain
+from ai_music_signal import SignalAnalyzer, SignalMetrics, analyze
+from ai_music_web import build_renditions
+
+
+# Bump whenever processing changes in a way that should re-encode fingerprinted tracks.
+TOOL_VERSION = '1'
+FINGERPRINT_TAG = 'SUPERBART_NORMALIZE'
+# Written by detect_music_loops.py in source sample frames; carried through re-normalization.
+LOOP_TAGS = ('LOOPSTART', 'LOOPEND')
+# Compliant tracks whose gain would move them less than this are passed through untouched.
+PASSTHROUGH_TOLERANCE_DB = 0.05
 
 TRACK_IDS = [
     'world-1',
@@ -36,6 +58,27 @@ class TrackNormalizationProfile:
     target_channels: int
     target_format: str
     min_duration: float
+    target_lufs: float
+    true_peak_ceiling_db: float
+
+
+@dataclass(frozen=True)
+class NormalizeOptions:
+    dry_run: bool
+    mode: str = 'peak'
+    streaming: bool = False
+    block_frames: int = 65536
+    force: bool = False
+    trim_silence: bool = False
+    remove_dc: bool = False
+
+
+@dataclass(frozen=True)
+class TrackResult:
+    track_id: str
+    error: str | None
+    output: str
+    seconds: float
 
 
 def infer_profile(track_id: str) -> TrackNormalizationProfile:
@@ -43,10 +86,44 @@ def infer_profile(track_id: str) -> TrackNormalizationProfile:
         target_sr=44100,
         target_channels=2,
         target_format='flac',
-        min_duration=50.0 if track_id in {'title', 'world-map'} else 47.0
+        min_duration=50.0 if track_id in {'title', 'world-map'} else 47.0,
+        # Menu music sits a little under gameplay; boss themes a little above.
+        target_lufs=-17.0 if track_id in {'title', 'world-map'} else (-15.0 if track_id.startswith('boss-') else -16.0),
+        true_peak_ceiling_db=-1.0
     )
 
 
+class GainAnalysis:
+    """Accumulates peak, integrated loudness and true peak over processed blocks."""
+
+    def __init__(self, profile: TrackNormalizationProfile, mode: str) -> None:
+        self.mode = mode
+        self.peak = 0.0
+        self.loudness = LoudnessMeter(profile.target_sr, profile.target_channels) if mode == 'lufs' else None
+        self.true_peak = TruePeakMeter(profile.target_channels) if mode == 'lufs' else None
+
+    def push(self, block: np.ndarray) -> None:
+        if len(block) == 0:
+            return
+        self.peak = max(self.peak, float(np.max(np.abs(block))))
+        if self.loudness is not None and self.true_peak is not None:
+            self.loudness.push(block)
+            self.true_peak.push(block)
+
+    def gain(self, profile: TrackNormalizationProfile) -> tuple[float, str]:
+        """Return the linear gain to apply and a short log summary."""
+        if self.loudness is None or self.true_peak is None:
+            return (min(0.98 / self.peak, 10.0) if self.peak > 0 else 1.0), ''
+        measured = self.loudness.integrated()
+        true_peak = self.true_peak.finish()
+        gain = loudness_gain(measured, true_peak, profile.target_lufs, profile.true_peak_ceiling_db)
+        gain_db = 20.0 * math.log10(gain)
+        return gain, (
+            f', {measured:.1f} LUFS {true_peak:.1f} dBTP -> '
+            f'{measured + gain_db:.1f} LUFS {true_peak + gain_db:.1f} dBTP'
+        )
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Normalize AI music tracks to consistent production settings.')
     parser.add_argument('--input-dir', default='public/music/ai', help='Directory containing generated AI music files.')
@@ -57,6 +134,49 @@ def parse_args() -> argparse.Namespace:
         help='Comma-separated track IDs to normalize (default: all AI tracks).'
     )
     parser.add_argument('--dry-run', action='store_true', help='Resolve tracks and report what would be done.')
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Maximum tracks normalized concurrently (default: CPU count; 1 runs in-process).'
+    )
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Process tracks block-wise in two passes so memory stays constant regardless of track length.'
+    )
+    parser.add_argument(
+        '--block-frames',
+        type=int,
+        default=65536,
+        help='Frames per block for streaming reads and gain analysis (default: 65536).'
+    )
+    parser.add_argument(
+        '--mode',
+        choices=['peak', 'lufs'],
+        default='peak',
+        help='peak: scale to 0.98 full scale. lufs: BS.1770 integrated loudness to the profile target and true-peak ceiling.'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-encode every track even if its processing fingerprint already matches.'
+    )
+    parser.add_argument(
+        '--trim-silence',
+        action='store_true',
+        help='Trim leading/trailing silence below -60 dBFS (keeping a 10 ms pad) before resampling.'
+    )
+    parser.add_argument('--remove-dc', action='store_true', help='Subtract the per-channel DC offset before resampling.')
+    parser.add_argument(
+        '--web',
+        action='store_true',
+        help='Also encode OGG Vorbis web renditions (high/medium/low) and update their manifest.'
+    )
+    parser.add_argument(
+        '--web-dir',
+        help='Output directory for web renditions (default: <output-dir>/web).'
+    )
     return parser.parse_args()
 
 
@@ -101,12 +221,199 @@ def normalize_channels(data: np.ndarray, target_channels: int) -> np.ndarray:
     return tiled[:, :target_channels]
 
 
+def resample(data: np.ndarray, source_sr: int, target_sr: int) -> np.ndarray:
+    if source_sr == target_sr:
+        return data
+    return resample_poly(data, target_sr, source_sr, axis=0)
+
+
+class StreamingResampler:
+    """Block-wise equivalent of `resample_poly(x, target_sr, source_sr, axis=0)`.
+
+    Uses the same Kaiser-windowed FIR and output alignment as `resample_poly`.
+    Between blocks it carries only the input history the filter still needs,
+    so the concatenated output matches a whole-signal resample.
+    """
+
+    def __init__(self, source_sr: int, target_sr: int, total_frames: int, channels: int) -> None:
+        divisor = math.gcd(target_sr, source_sr)
+        self.up = target_sr // divisor
+        self.down = source_sr // divisor
+        max_rate = max(self.up, self.down)
+        half_len = 10 * max_rate
+        taps = firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0)).astype(np.float32) * self.up
+        n_pre_pad = self.down - half_len % self.down
+        self.taps = np.concatenate([np.zeros(n_pre_pad, dtype=np.float32), taps])
+        self.next_out = (half_len + n_pre_pad) // self.down
+        self.end_out = self.next_out + -(-total_frames * self.up // self.down)
+        self.buffer = np.zeros((0, channels), dtype=np.float32)
+        self.buffer_start = 0
+
+    def _first_input(self, output_index: int) -> int:
+        first = max(0, -(-(output_index * self.down - (len(self.taps) - 1)) // self.up))
+        # Align to a multiple of `down` so upfirdn's output grid matches the global one.
+        return (first // self.down) * self.down
+
+    def process(self, block: np.ndarray, final: bool = False) -> np.ndarray:
+        parts = [self.buffer, block]
+        if final:
+            parts.append(np.zeros((len(self.taps) // self.up + 2, self.buffer.shape[1]), dtype=np.float32))
+        self.buffer = np.concatenate(parts)
+        available = self.buffer_start + len(self.buffer)
+        last = min(self.end_out, (available * self.up - 1) // self.down + 1)
+        if last <= self.next_out:
+            return np.zeros((0, self.buffer.shape[1]), dtype=np.float32)
+
+        start = self._first_input(self.next_out)
+        filtered = upfirdn(self.taps, self.buffer[start - self.buffer_start:], self.up, self.down, axis=0)
+        offset = start * self.up // self.down
+        out = filtered[self.next_out - offset:last - offset]
+        self.next_out = last
+
+        keep_from = self._first_input(self.next_out)
+        self.buffer = self.buffer[keep_from - self.buffer_start:]
+        self.buffer_start = keep_from
+        return out.astype(np.float32, copy=False)
+
+
+@dataclass(frozen=True)
+class SourceStages:
+    """Source-rate trim range and DC offset applied before resampling."""
+    start: int
+    stop: int
+    dc: np.ndarray | None = None
+    summary: str = ''
+
+
+def plan_source_stages(metrics: SignalMetrics, trim_silence: bool, remove_dc: bool) -> SourceStages:
+    start, stop = metrics.trim_bounds() if trim_silence else (0, metrics.frames)
+    dc = np.asarray(metrics.dc_offset, dtype=np.float32) if remove_dc and metrics.has_dc else None
+    notes = []
+    if (start, stop) != (0, metrics.frames):
+        notes.append(
+            f'trimmed {start / metrics.sample_rate:.2f}s lead / {(metrics.frames - stop) / metrics.sample_rate:.2f}s tail'
+        )
+    if dc is not None:
+        notes.append('removed DC ' + '/'.join(f'{value:+.5f}' for value in metrics.dc_offset))
+    return SourceStages(start, stop, dc, ''.join(f', {note}' for note in notes))
+
+
+def scan_source_stages(input_path: Path, block_frames: int, trim_silence: bool, remove_dc: bool) -> SourceStages | None:
+    """Measure a track block-wise and plan its trim/DC stages (None if neither is requested)."""
+    if not (trim_silence or remove_dc):
+        return None
+    info = sf.info(str(input_path))
+    analyzer = SignalAnalyzer(info.samplerate, info.channels)
+    for block in sf.blocks(str(input_path), blocksize=block_frames, dtype='float32', always_2d=True):
+        analyzer.push(block)
+    return plan_source_stages(analyzer.result(), trim_silence, remove_dc)
+
+
+def iter_normalized_blocks(
+    input_path: Path,
+    profile: TrackNormalizationProfile,
+    block_frames: int,
+    stages: SourceStages | None = None
+) -> Iterable[np.ndarray]:
+    """Yield resampled, channel-normalized blocks of a track without loading it fully."""
+    info = sf.info(str(input_path))
+    start, stop = (stages.start, stages.stop) if stages is not None else (0, info.frames)
+    resampler = None
+    if info.samplerate != profile.target_sr:
+        resampler = StreamingResampler(info.samplerate, profile.target_sr, stop - start, info.channels)
+
+    for block in sf.blocks(
+        str(input_path), blocksize=block_frames, dtype='float32', always_2d=True, start=start, stop=stop
+    ):
+        if stages is not None and stages.dc is not None:
+            block = block - stages.dc
+        if resampler is not None:
+            block = resampler.process(block)
+        if len(block):
+            yield normalize_channels(block, profile.target_channels)
+    if resampler is not None:
+        tail = resampler.process(np.zeros((0, info.channels), dtype=np.float32), final=True)
+        if len(tail):
+            yield normalize_channels(tail, profile.target_channels)
+
+
+def normalize_track_streaming(
+    input_path: Path,
+    output_path: Path,
+    profile: TrackNormalizationProfile,
+    dry_run: bool,
+    block_frames: int,
+    mode: str = 'peak',
+    trim_silence: bool = False,
+    remove_dc: bool = False
+) -> int:
+    """Normalize block-wise; returns the source frames trimmed from the start."""
+    if not input_path.exists():
+        raise RuntimeError(f'Missing input track: {input_path.name}')
+
+    info = sf.info(str(input_path))
+    if info.frames <= 0:
+        raise RuntimeError(f'Empty track: {input_path.name}')
+
+    stages = scan_source_stages(input_path, block_frames, trim_silence, remove_dc)
+    frames = stages.stop - stages.start if stages is not None else info.frames
+    out_frames = -(-frames * profile.target_sr // info.samplerate)
+    duration = out_frames / profile.target_sr
+    if duration < profile.min_duration:
+        raise RuntimeError(
+            f'Track duration {duration:.2f}s is below minimum {profile.min_duration:.2f}s for {input_path.name}. '
+            'Regeneration is required; normalization cannot stretch content.'
+        )
+
+    # Pass 1: measure the peak (and loudness in lufs mode) of the processed signal.
+    analysis = GainAnalysis(profile, mode)
+    for block in iter_normalized_blocks(input_path, profile, block_frames, stages):
+        analysis.push(block)
+    gain, summary = analysis.gain(profile)
+    if stages is not None:
+        summary = stages.summary + summary
+
+    if dry_run:
+        print(
+            f'[DRY-RUN] would stream-normalize {input_path.name}: '
+            f'{duration:.2f}s, {info.samplerate}Hz->{profile.target_sr}Hz, {info.channels}ch->{profile.target_channels}ch{summary}'
+        )
+        return 0
+
+    # Pass 2: re-run the pipeline, apply gain and write blocks straight to the encoder.
+    # A sibling temp file keeps in-place runs (input dir == output dir) from reading their own output.
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = output_path.with_name(f'{output_path.name}.partial')
+    with sf.SoundFile(
+        str(partial_path),
+        'w',
+        samplerate=profile.target_sr,
+        channels=profile.target_channels,
+        format=profile.target_format.upper(),
+        subtype='PCM_24'
+    ) as out:
+        for block in iter_normalized_blocks(input_path, profile, block_frames, stages):
+            out.write(block * gain)
+    partial_path.replace(output_path)
+    check_mutagen_format(output_path, profile.target_format)
+    print(
+        f'[NORMALIZED] {output_path.name} -> '
+        f'{profile.target_format.upper()} {profile.target_sr}Hz {profile.target_channels}ch ({duration:.2f}s, streamed{summary})'
+    )
+    return stages.start if stages is not None else 0
+
+
 def normalize_track(
     input_path: Path,
     output_path: Path,
     profile: TrackNormalizationProfile,
-    dry_run: bool
-) -> None:
+    dry_run: bool,
+    mode: str = 'peak',
+    trim_silence: bool = False,
+    remove_dc: bool = False,
+    block_frames: int = 65536
+) -> int:
+    """Normalize in memory; returns the source frames trimmed from the start."""
     if not input_path.exists():
         raise RuntimeError(f'Missing input track: {input_path.name}')
 
@@ -114,14 +421,28 @@ def normalize_track(
     if data.size == 0:
         raise RuntimeError(f'Empty track: {input_path.name}')
 
-    if sample_rate != profile.target_sr:
-        data = resample_poly(data, profile.target_sr, sample_rate, axis=0)
+    stage_summary = ''
+    trim_start = 0
+    if trim_silence or remove_dc:
+        stages = plan_source_stages(analyze(data, sample_rate), trim_silence, remove_dc)
+        trim_start = stages.start
+        data = data[stages.start:stages.stop]
+        if stages.dc is not None:
+            data = data - stages.dc
+        stage_summary = stages.summary
+
+    data = resample(data, sample_rate, profile.target_sr)
 
     data = normalize_channels(data, profile.target_channels)
 
-    peak = float(np.max(np.abs(data)))
-    if peak > 0:
-        data = data * min(0.98 / peak, 10.0)
+    # Fixed slices keep the meters' working set (4x true-peak oversampling) independent of track length.
+    analysis = GainAnalysis(profile, mode)
+    for start in range(0, len(data), block_frames):
+        analysis.push(data[start:start + block_frames])
+    gain, summary = analysis.gain(profile)
+    summary = stage_summary + summary
+    if gain != 1.0:
+        data = data * gain
 
     duration = data.shape[0] / profile.target_sr
     if duration < profile.min_duration:
@@ -133,9 +454,9 @@ def normalize_track(
     if dry_run:
         print(
             f'[DRY-RUN] would normalize {input_path.name}: '
-            f'{duration:.2f}s, {sample_rate}Hz->{profile.target_sr}Hz, {data.shape[1]}ch->{profile.target_channels}ch'
+            f'{duration:.2f}s, {sample_rate}Hz->{profile.target_sr}Hz, {data.shape[1]}ch->{profile.target_channels}ch{summary}'
         )
-        return
+        return 0
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     sf.write(
@@ -148,8 +469,156 @@ def normalize_track(
     check_mutagen_format(output_path, profile.target_format)
     print(
         f'[NORMALIZED] {output_path.name} -> '
-        f'{profile.target_format.upper()} {profile.target_sr}Hz {profile.target_channels}ch ({duration:.2f}s)'
+        f'{profile.target_format.upper()} {profile.target_sr}Hz {profile.target_channels}ch ({duration:.2f}s{summary})'
     )
+    return trim_start
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open('rb') as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def profile_digest(profile: TrackNormalizationProfile, options: NormalizeOptions) -> str:
+    payload = json.dumps(
+        {**asdict(profile), 'mode': options.mode, 'trimSilence': options.trim_silence, 'removeDc': options.remove_dc},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def read_fingerprint(path: Path) -> tuple[dict[str, str], str]:
+    """Return (fingerprint fields, STREAMINFO audio MD5) for a FLAC; fields are empty if untagged."""
+    try:
+        media = FLAC(path)
+    except Exception:
+        return {}, ''
+    values = (media.tags or {}).get(FINGERPRINT_TAG, [])
+    fields = dict(item.split('=', 1) for item in values[0].split(';') if '=' in item) if values else {}
+    return fields, format(media.info.md5_signature, '032x')
+
+
+def write_fingerprint(path: Path, profile_hash: str, source_hash: str) -> None:
+    media = FLAC(path)
+    audio_md5 = format(media.info.md5_signature, '032x')
+    media[FINGERPRINT_TAG] = f'tool={TOOL_VERSION};profile={profile_hash};source={source_hash};audio={audio_md5}'
+    media.save()
+
+
+def read_loop_tags(path: Path) -> dict[str, int]:
+    """LOOPSTART/LOOPEND sample frames written by detect_music_loops.py ({} if absent or malformed)."""
+    try:
+        tags = FLAC(path).tags or {}
+    except Exception:
+        return {}
+    values = {key: tags.get(key, [''])[0].strip() for key in LOOP_TAGS}
+    if not all(value.isdigit() for value in values.values()):
+        return {}
+    return {key: int(value) for key, value in values.items()}
+
+
+def carry_loop_tags(path: Path, loop: dict[str, int], source_sr: int, trim_start: int) -> str:
+    """Map source loop points through the trim and resample onto `path`; returns a log summary."""
+    media = FLAC(path)
+    scale = media.info.sample_rate / source_sr
+    mapped = {key: int(round((value - trim_start) * scale)) for key, value in loop.items()}
+    if not 0 <= mapped['LOOPSTART'] < mapped['LOOPEND'] <= media.info.total_samples:
+        return f'dropped LOOPSTART/LOOPEND {loop["LOOPSTART"]}/{loop["LOOPEND"]}: outside the trimmed audio'
+    for key, value in mapped.items():
+        media[key] = str(value)
+    media.save()
+    return f'kept LOOPSTART/LOOPEND {mapped["LOOPSTART"]}/{mapped["LOOPEND"]}'
+
+
+def fingerprint_matches(
+    input_path: Path,
+    output_path: Path,
+    profile_hash: str,
+    source_hash: str
+) -> bool:
+    if not output_path.exists():
+        return False
+    fields, output_md5 = read_fingerprint(output_path)
+    if fields.get('tool') != TOOL_VERSION or fields.get('profile') != profile_hash:
+        return False
+    if fields.get('audio') != output_md5:
+        return False
+    if fields.get('source') == source_hash:
+        return True
+    # In-place runs: the input is the tagged output of a previous run.
+    _, input_md5 = read_fingerprint(input_path)
+    return input_md5 == output_md5 and output_md5 != '0' * 32
+
+
+def passthrough_summary(input_path: Path, profile: TrackNormalizationProfile, options: NormalizeOptions) -> str | None:
+    """Return a log summary if the input already meets the profile, else None."""
+    info = sf.info(str(input_path))
+    if (
+        info.format != profile.target_format.upper()
+        or info.subtype != 'PCM_24'
+        or info.samplerate != profile.target_sr
+        or info.channels != profile.target_channels
+        or info.duration < profile.min_duration
+    ):
+        return None
+
+    analysis = GainAnalysis(profile, options.mode)
+    signal = SignalAnalyzer(info.samplerate, info.channels) if options.trim_silence or options.remove_dc else None
+    for block in sf.blocks(str(input_path), blocksize=options.block_frames, dtype='float32', always_2d=True):
+        analysis.push(block)
+        if signal is not None:
+            signal.push(block)
+    gain, summary = analysis.gain(profile)
+    if abs(20.0 * math.log10(gain)) > PASSTHROUGH_TOLERANCE_DB:
+        return None
+    if signal is not None and plan_source_stages(signal.result(), options.trim_silence, options.remove_dc).summary:
+        return None
+    return f'{info.duration:.2f}s{summary}'
+
+
+def process_track(input_path: Path, output_path: Path, profile: TrackNormalizationProfile, options: NormalizeOptions) -> None:
+    """Skip, pass through or normalize one track, then stamp its processing fingerprint."""
+    if not input_path.exists():
+        raise RuntimeError(f'Missing input track: {input_path.name}')
+
+    profile_hash = profile_digest(profile, options)
+    source_hash = file_digest(input_path)
+    if not options.force and fingerprint_matches(input_path, output_path, profile_hash, source_hash):
+        print(f'[SKIP] {output_path.name}: fingerprint matches (tool {TOOL_VERSION}, profile {profile_hash})')
+        return
+
+    summary = passthrough_summary(input_path, profile, options)
+    if summary is not None:
+        if options.dry_run:
+            print(f'[DRY-RUN] would pass through {input_path.name}: already compliant ({summary})')
+            return
+        if input_path.resolve() != output_path.resolve():
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(input_path, output_path)
+        write_fingerprint(output_path, profile_hash, source_hash)
+        print(f'[PASSTHROUGH] {output_path.name}: already compliant ({summary})')
+        return
+
+    # Read before normalizing: in-place runs overwrite the input.
+    source_sr = sf.info(str(input_path)).samplerate
+    loop = read_loop_tags(input_path)
+    if options.streaming:
+        trim_start = normalize_track_streaming(
+            input_path, output_path, profile, options.dry_run, options.block_frames, options.mode,
+            options.trim_silence, options.remove_dc
+        )
+    else:
+        trim_start = normalize_track(
+            input_path, output_path, profile, options.dry_run, options.mode, options.trim_silence, options.remove_dc,
+            options.block_frames
+        )
+    if not options.dry_run:
+        if loop:
+            print(f'[LOOP] {output_path.name}: {carry_loop_tags(output_path, loop, source_sr, trim_start)}')
+        write_fingerprint(output_path, profile_hash, source_hash)
 
 
 def build_file_paths(input_dir: Path, output_dir: Path, track_ids: Iterable[str]) -> list[tuple[Path, Path, str]]:
@@ -159,6 +628,32 @@ def build_file_paths(input_dir: Path, output_dir: Path, track_ids: Iterable[str]
     ]
 
 
+def run_track(input_path: Path, output_path: Path, track_id: str, options: NormalizeOptions) -> TrackResult:
+    """Normalize one track, capturing its log output so parallel runs print in track order."""
+    buffer = io.StringIO()
+    started = time.perf_counter()
+    error: str | None = None
+    profile = infer_profile(track_id)
+    with redirect_stdout(buffer):
+        try:
+            process_track(input_path, output_path, profile, options)
+        except Exception as exc:
+            error = str(exc)
+    return TrackResult(track_id, error, buffer.getvalue(), time.perf_counter() - started)
+
+
+def run_tracks(jobs: list[tuple[Path, Path, str]], options: NormalizeOptions, max_workers: int) -> list[TrackResult]:
+    if max_workers <= 1 or len(jobs) <= 1:
+        return [run_track(input_path, output_path, track_id, options) for input_path, output_path, track_id in jobs]
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+        futures = [
+            pool.submit(run_track, input_path, output_path, track_id, options)
+            for input_path, output_path, track_id in jobs
+        ]
+        return [future.result() for future in futures]
+
+
 def main() -> None:
     args = parse_args()
     input_dir = Path(args.input_dir)
@@ -167,14 +662,35 @@ def main() -> None:
 
     failures: list[str] = []
 
-    for input_path, output_path, track_id in build_file_paths(input_dir, output_dir, track_ids):
-        profile = infer_profile(track_id)
-        try:
-            normalize_track(input_path, output_path, profile, args.dry_run)
-        except Exception as error:
-            failures.append(f'{track_id}: {error}')
+    started = time.perf_counter()
+    options = NormalizeOptions(
+        dry_run=args.dry_run,
+        mode=args.mode,
+        streaming=args.streaming,
+        block_frames=args.block_frames,
+        force=args.force,
+        trim_silence=args.trim_silence,
+        remove_dc=args.remove_dc
+    )
+    results = run_tracks(build_file_paths(input_dir, output_dir, track_ids), options, args.jobs)
+    for result in results:
+        print(result.output, end='')
+        print(f'[TIMING] {result.track_id}: {result.seconds:.2f}s')
+        if result.error is not None:
+            failures.append(f'{result.track_id}: {result.error}')
             if args.dry_run:
-                print(f'[ERROR] {track_id}: {error}')
+                print(f'[ERROR] {result.track_id}: {result.error}')
+
+    if args.web and not args.dry_run:
+        web_started = time.perf_counter()
+        web_dir = Path(args.web_dir) if args.web_dir else output_dir / 'web'
+        sources = [(output_dir / f'{result.track_id}.flac', result.track_id) for result in results if result.error is None]
+        lines, web_failures = build_renditions(sources, web_dir, args.jobs)
+        for line in lines:
+            print(line)
+        failures.extend(f'web {entry}' for entry in web_failures)
+        print(f'[TIMING] web renditions: {time.perf_counter() - web_started:.2f}s')
+    print(f'[TIMING] total wall time: {time.perf_counter() - started:.2f}s')
 
     if failures:
         print('Normalization failed:')
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Pack short audio clips (stingers, jingles) into audio-sprite files.
+
+Clips are resampled and remixed to a common rate and channel count with the
+normalizer's `resample` and `normalize_channels`. They are then laid end to
+end, each followed by a silence guard so decoder pre-roll and seek slop never
+bleed into the next clip. A new sprite file starts whenever the current one
+would exceed `--max-sprite-seconds`. The JSON map gives, for every clip id,
+its sprite file and its start and duration in seconds and frames, which is
+what the audio engine needs to play the clip with a single offset/duration
+call.
+
+The game's own sound effects are synthesized in `src/audio/sfx.ts` and ship
+no clip files, so there is no default input or output directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from normalize_ai_music import normalize_channels, resample
+
+
+CLIP_SUFFIXES = ('.flac', '.wav', '.ogg')
+FORMATS = {
+    'ogg': ('OGG', 'VORBIS'),
+    'flac': ('FLAC', 'PCM_16'),
+    'wav': ('WAV', 'PCM_16'),
+}
+WRITE_BLOCK_FRAMES = 65536
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Pack short audio clips into audio sprites with an offset map.')
+    parser.add_argument('--input-dir', required=True, help='Directory of short clips (clip id = file stem).')
+    parser.add_argument('--output-dir', required=True, help='Output directory for sprites and the map.')
+    parser.add_argument('--name', default='sprite', help='Sprite file name prefix.')
+    parser.add_argument('--format', choices=sorted(FORMATS), default='ogg', help='Sprite container (default: ogg).')
+    parser.add_argument('--sample-rate', type=int, default=44100, help='Sprite sample rate.')
+    parser.add_argument('--channels', type=int, default=2, help='Sprite channel count.')
+    parser.add_argument('--guard-seconds', type=float, default=0.25, help='Silence inserted after every clip.')
+    parser.add_argument('--max-clip-seconds', type=float, default=10.0, help='Reject clips longer than this.')
+    parser.add_argument('--max-sprite-seconds', type=float, default=30.0, help='Start a new sprite beyond this length.')
+    parser.add_argument('--dry-run', action='store_true', help='Report the layout without writing files.')
+    return parser.parse_args()
+
+
+def load_clip(path: Path, sample_rate: int, channels: int) -> np.ndarray:
+    data, source_sr = sf.read(str(path), dtype='float32', always_2d=True)
+    return normalize_channels(resample(data, source_sr, sample_rate), channels).astype(np.float32, copy=False)
+
+
+def layout_sprites(
+    clips: list[tuple[str, np.ndarray]],
+    guard_frames: int,
+    max_sprite_frames: int
+) -> list[list[tuple[str, np.ndarray, int]]]:
+    """Group clips into sprites in order, returning (clip id, audio, start frame) per sprite."""
+    sprites: list[list[tuple[str, np.ndarray, int]]] = []
+    cursor = 0
+    for clip_id, audio in clips:
+        needed = len(audio) + guard_frames
+        if not sprites or (cursor + needed > max_sprite_frames and sprites[-1]):
+            sprites.append([])
+            cursor = 0
+        sprites[-1].append((clip_id, audio, cursor))
+        cursor += needed
+    return sprites
+
+
+def write_sprite(path: Path, parts: list[tuple[str, np.ndarray, int]], guard_frames: int, sample_rate: int, channels: int, file_format: str) -> int:
+    container, subtype = FORMATS[file_format]
+    frames = parts[-1][2] + len(parts[-1][1]) + guard_frames
+    buffer = np.zeros((frames, channels), dtype=np.float32)
+    for _, audio, start in parts:
+        buffer[start:start + len(audio)] = audio
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Block-wise writes: libsndfile's Vorbis encoder can crash on very large single writes.
+    with sf.SoundFile(str(path), 'w', samplerate=sample_rate, channels=channels, format=container, subtype=subtype) as out:
+        for offset in range(0, frames, WRITE_BLOCK_FRAMES):
+            out.write(buffer[offset:offset + WRITE_BLOCK_FRAMES])
+    return frames
+
+
+def main() -> None:
+    args = parse_args()
+    input_dir = Path(args.input_dir)
+    output_dir = Path(args.output_dir)
+    paths = sorted(path for path in input_dir.glob('*') if path.suffix.lower() in CLIP_SUFFIXES) if input_dir.is_dir() else []
+    if not paths:
+        print(f'No clips found in {input_dir}.')
+        raise SystemExit(1)
+
+    failures: list[str] = []
+    clips: list[tuple[str, np.ndarray]] = []
+    seen: set[str] = set()
+    for path in paths:
+        if path.stem in seen:
+            failures.append(f'{path.name}: duplicate clip id "{path.stem}"')
+            continue
+        seen.add(path.stem)
+        try:
+            audio = load_clip(path, args.sample_rate, args.channels)
+        except Exception as exc:
+            failures.append(f'{path.name}: {exc}')
+            continue
+        duration = len(audio) / args.sample_rate
+        if len(audio) == 0 or duration > args.max_clip_seconds:
+            failures.append(f'{path.name}: duration {duration:.2f}s outside (0, {args.max_clip_seconds:.2f}]s')
+            continue
+        clips.append((path.stem, audio))
+
+    if failures:
+        print('Audio sprite packing failed:')
+        for entry in failures:
+            print(f' - {entry}')
+        raise SystemExit(1)
+
+    guard_frames = int(round(args.guard_seconds * args.sample_rate))
+    max_sprite_frames = int(round(args.max_sprite_seconds * args.sample_rate))
+    sprites = layout_sprites(clips, guard_frames, max_sprite_frames)
+
+    sprite_map: dict = {
+        'sampleRate': args.sample_rate,
+        'channels': args.channels,
+        'guardSeconds': args.guard_seconds,
+        'sprites': [],
+        'clips': {}
+    }
+    for index, parts in enumerate(sprites):
+        file_name = f'{args.name}-{index}.{args.format}'
+        frames = parts[-1][2] + len(parts[-1][1]) + guard_frames
+        if not args.dry_run:
+            frames = write_sprite(output_dir / file_name, parts, guard_frames, args.sample_rate, args.channels, args.format)
+        sprite_map['sprites'].append({'file': file_name, 'duration': round(frames / args.sample_rate, 6), 'clips': len(parts)})
+        for clip_id, audio, start in parts:
+            sprite_map['clips'][clip_id] = {
+                'sprite': file_name,
+                'start': round(start / args.sample_rate, 6),
+                'duration': round(len(audio) / args.sample_rate, 6),
+                'startFrame': start,
+                'frames': len(audio)
+            }
+        print(f'[SPRITE] {file_name}: {len(parts)} clip(s), {frames / args.sample_rate:.2f}s')
+
+    if args.dry_run:
+        print(f'[DRY-RUN] would pack {len(clips)} clip(s) into {len(sprites)} sprite(s).')
+        return
+
+    map_path = output_dir / f'{args.name}.json'
+    map_path.write_text(json.dumps(sprite_map, indent=2) + '\n', encoding='utf-8')
+    print(f'Packed {len(clips)} clip(s) into {len(sprites)} sprite(s); map: {map_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import { spawnSync } from 'node:child_process';
+
+import { afterAll, describe, expect, test } from 'vitest';
+
+const trackIds = ['world-1', 'world-2', 'boss-1', 'boss-2', 'title', 'world-map'];
+const inputDir = fs.mkdtempSync(path.join(os.tmpdir(), 'audit-ai-music-'));
+
+const writeTracks = `
+import sys
+import numpy as np
+import soundfile as sf
+
+sr = 44100
+t = np.arange(sr * 52) / sr
+for index, track_id in enumerate(sys.argv[2:]):
+    tone = 0.25 * np.sin(2 * np.pi * (110 + 55 * index) * t)
+    sf.write(f'{sys.argv[1]}/{track_id}.flac', np.column_stack([tone, tone]), sr, subtype='PCM_16')
+`;
+
+describe('audit_ai_music parallel output', () => {
+  afterAll(() => {
+    fs.rmSync(inputDir, { recursive: true, force: true });
+  });
+
+  test('keeps every track report intact with --jobs > 1', () => {
+    const setup = spawnSync('python3', ['-c', writeTracks, inputDir, ...trackIds], { encoding: 'utf8' });
+    expect(setup.status, setup.stderr).toBe(0);
+
+    const result = spawnSync(
+      'python3',
+      ['scripts/audit_ai_music.py', '--input-dir', inputDir, '--tracks', trackIds.join(','), '--jobs', '4', '--cache', ''],
+      { encoding: 'utf8' }
+    );
+    expect(result.status, result.stdout + result.stderr).toBe(0);
+
+    const lines = result.stdout.trim().split('\n');
+    const reportLines = lines.filter((line) => /^(PASS|INFO|WARN|FAIL) /.test(line));
+    let cursor = 0;
+    for (const trackId of trackIds) {
+      // Each track's lines appear exactly once, contiguously, in track order.
+      expect(reportLines[cursor]).toMatch(new RegExp(`^PASS ${trackId}: `));
+      expect(reportLines[cursor + 1]).toMatch(new RegExp(`^INFO ${trackId}: `));
+      cursor += 2;
+      while (reportLines[cursor]?.startsWith(`WARN ${trackId}: `)) {
+        cursor += 1;
+      }
+    }
+    expect(cursor).toBe(reportLines.length);
+    expect(lines[lines.length - 1]).toBe('All AI music tracks passed quality gate.');
+  });
+});
@@ -32,6 +32,12 @@ REQUIRED_PNG_DIMENSIONS = {
     'public/assets/sprites/map_node_locked.png': (16, 16),
     'public/assets/sprites/map_node_selected.png': (16, 16),
     'public/assets/sprites/map_path_dot.png': (8, 8),
+    'public/assets/tiles/tile_ground_w1_top.png': (32, 32),
+    'public/assets/tiles/tile_ground_w1_mid.png': (32, 32),
+    'public/assets/tiles/tile_oneway_w1.png': (32, 32),
+    'public/assets/tiles/tile_ground_w2_top.png': (32, 32),
+    'public/assets/tiles/tile_ground_w2_mid.png': (32, 32),
+    'public/assets/tiles/tile_oneway_w2.png': (32, 32),
 }
 
 REFERENCE_IMAGE_CONSTRAINTS = {
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Generate seeded, tileable parallax background layers for every world.
+
+Themes live in `tools/imagegen/background_themes.json`. Each world has a sky
+gradient, a far layer silhouette and a near layer silhouette. Every shape is
+built as a NumPy array. Silhouette sizes are fractions of the layer size, so
+one theme renders at any resolution. Shapes wrap horizontally, so the left
+and right edges of a layer meet seamlessly when `parallax.ts` repeats it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except Exception:  # pragma: no cover
+    print('ERROR: Pillow and numpy are required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+
+THEMES_PATH = 'tools/imagegen/background_themes.json'
+DEFAULT_OUT_DIR = 'tmp/imagegen/backgrounds'
+LAYER_SEED_OFFSETS = {'far': 0, 'near': 1}
+# Lit window pane pitch as a fraction of layer height (8px at the 256px default).
+WINDOW_PITCH = 1.0 / 32.0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Generate procedural hill_far_wN / hill_near_wN parallax layers.')
+    parser.add_argument('--themes', default=THEMES_PATH, help='Per-world theme config.')
+    parser.add_argument('--worlds', help='Comma-separated world numbers (default: every world in the theme config).')
+    parser.add_argument('--width', type=int, help='Layer width in pixels (default: theme config width).')
+    parser.add_argument('--height', type=int, help='Layer height in pixels (default: theme config height).')
+    parser.add_argument('--seed-offset', type=int, default=0, help='Added to every world seed to explore variations.')
+    parser.add_argument(
+        '--out-dir',
+        default=DEFAULT_OUT_DIR,
+        help='Output directory. Use public/assets/bg to replace the shipped layers.'
+    )
+    return parser.parse_args()
+
+
+def hex_rgb(value: str) -> np.ndarray:
+    value = value.lstrip('#')
+    return np.array([int(value[i:i + 2], 16) for i in (0, 2, 4)], dtype=np.float32)
+
+
+def vertical_gradient(width: int, height: int, top: str, bottom: str) -> np.ndarray:
+    t = np.linspace(0.0, 1.0, height, dtype=np.float32)[:, None, None]
+    rows = hex_rgb(top) + (hex_rgb(bottom) - hex_rgb(top)) * t
+    rgb = np.broadcast_to(rows, (height, width, 3))
+    alpha = np.full((height, width, 1), 255, dtype=np.float32)
+    return np.concatenate([rgb, alpha], axis=2).round().astype(np.uint8)
+
+
+def wrapped_distance(columns: np.ndarray, centers: np.ndarray, width: int) -> np.ndarray:
+    """Horizontal distance on a ring, shape (len(centers), len(columns))."""
+    delta = np.abs(columns[None, :] - centers[:, None])
+    return np.minimum(delta, width - delta)
+
+
+def ridge_profile(spec: dict, width: int, height: int, rng: np.random.Generator) -> np.ndarray:
+    # Integer harmonics keep the sum periodic over the layer width.
+    x = np.arange(width, dtype=np.float32) / width
+    harmonics = np.asarray(spec['harmonics'], dtype=np.float32)
+    phases = rng.uniform(0.0, 2.0 * np.pi, size=harmonics.size).astype(np.float32)
+    weights = 1.0 / np.arange(1, harmonics.size + 1, dtype=np.float32)
+    waves = np.sin(2.0 * np.pi * harmonics[:, None] * x[None, :] + phases[:, None]) * weights[:, None]
+    shape = waves.sum(axis=0) / weights.sum()
+    return (spec['base'] + spec['amplitude'] * shape) * height
+
+
+def spike_profile(spec: dict, width: int, height: int, rng: np.random.Generator) -> np.ndarray:
+    count = spec['count']
+    centers = (np.arange(count) + rng.uniform(-0.3, 0.3, size=count)) * (width / count)
+    half_widths = rng.uniform(spec['minWidth'], spec['maxWidth'], size=count) * width / 2.0
+    heights = rng.uniform(spec['minHeight'], spec['maxHeight'], size=count) * height
+    distance = wrapped_distance(np.arange(width, dtype=np.float64), centers, width)
+    triangles = heights[:, None] * np.clip(1.0 - distance / half_widths[:, None], 0.0, None)
+    return triangles.max(axis=0)
+
+
+def tower_profile(spec: dict, width: int, height: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """Return per-column tower heights and each column's offset from its tower's left edge."""
+    count = spec['count']
+    lefts = ((np.arange(count) + rng.uniform(0.0, 0.5, size=count)) * (width / count)).astype(np.int64)
+    widths = np.maximum(2, (rng.uniform(spec['minWidth'], spec['maxWidth'], size=count) * width).astype(np.int64))
+    heights = rng.uniform(spec['minHeight'], spec['maxHeight'], size=count) * height
+
+    columns = np.arange(width)
+    local = (columns[None, :] - lefts[:, None]) % width
+    inside = local < widths[:, None]
+    per_tower = np.where(inside, heights[:, None], 0.0)
+    owner = per_tower.argmax(axis=0)
+    profile = per_tower.max(axis=0)
+    offset = np.where(profile > 0, local[owner, columns], -1)
+    return profile, offset
+
+
+def silhouette_layer(spec: dict, theme: dict, width: int, height: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """Build the silhouette RGBA and coverage mask for one layer spec."""
+    offset = None
+    if spec['kind'] == 'ridge':
+        profile = ridge_profile(spec, width, height, rng)
+    elif spec['kind'] == 'spikes':
+        profile = spike_profile(spec, width, height, rng)
+    elif spec['kind'] == 'towers':
+        profile, offset = tower_profile(spec, width, height, rng)
+    else:
+        raise ValueError(f'unknown silhouette kind "{spec["kind"]}"')
+
+    rows = np.arange(height)[:, None]
+    tops = height - np.clip(profile, 0.0, height)
+    mask = rows >= np.ceil(tops)[None, :]
+
+    layer = np.zeros((height, width, 4), dtype=np.uint8)
+    layer[mask, :3] = hex_rgb(spec['color']).astype(np.uint8)
+    layer[mask, 3] = spec.get('alpha', 255)
+
+    if offset is not None and spec.get('windows'):
+        # Lit window grid scaled like the silhouettes: panes half a pitch wide, rows every 1.5 pitches down.
+        pitch = max(4.0, height * WINDOW_PITCH)
+        across = offset[None, :] % pitch
+        depth = rows - tops[None, :]
+        lit = (
+            mask
+            & (across >= pitch / 4.0)
+            & (across < pitch * 0.75)
+            & (depth >= pitch * 0.75)
+            & (depth % (pitch * 1.5) < pitch * 0.625)
+        )
+        layer[lit, :3] = hex_rgb(theme['accent']).astype(np.uint8)
+    return layer, mask
+
+
+def composite(base: np.ndarray, over: np.ndarray) -> np.ndarray:
+    alpha = over[:, :, 3:4].astype(np.float32) / 255.0
+    out = base.astype(np.float32)
+    out[:, :, :3] = over[:, :, :3] * alpha + out[:, :, :3] * (1.0 - alpha)
+    out[:, :, 3:4] = np.maximum(out[:, :, 3:4], over[:, :, 3:4])
+    return out.round().astype(np.uint8)
+
+
+def render_world(theme: dict, width: int, height: int, seed: int) -> dict[str, np.ndarray]:
+    layers: dict[str, np.ndarray] = {}
+    for name in ('far', 'near'):
+        rng = np.random.default_rng([seed, LAYER_SEED_OFFSETS[name]])
+        silhouette, _ = silhouette_layer(theme[name], theme, width, height, rng)
+        if name == 'far':
+            sky = vertical_gradient(width, height, theme['skyTop'], theme['skyBottom'])
+            layers[name] = composite(sky, silhouette)
+        else:
+            layers[name] = silhouette
+    return layers
+
+
+def main() -> int:
+    args = parse_args()
+    config = json.loads(Path(args.themes).read_text(encoding='utf-8'))
+    width = args.width or config['width']
+    height = args.height or config['height']
+    worlds = [entry.strip() for entry in args.worlds.split(',')] if args.worlds else sorted(config['worlds'], key=int)
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for world in worlds:
+        theme = config['worlds'].get(world)
+        if theme is None:
+            print(f'No background theme for world {world}.')
+            return 1
+        layers = render_world(theme, width, height, theme['seed'] + args.seed_offset)
+        for name, pixels in layers.items():
+            path = out_dir / f'hill_{name}_w{world}.png'
+            Image.fromarray(pixels, 'RGBA').save(path)
+            print(f'[BACKGROUND] {path} {width}x{height} ({theme[name]["kind"]})')
+
+    print(f'Generated {len(worlds) * 2} background layer(s).')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
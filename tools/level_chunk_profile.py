@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Chunk, family and pacing-phase frequency profile over exported levels.
+
+Input is generated-level JSON as written by
+`scripts/export_levels_for_unity.ts`: one level per `.json` file, or one
+level per line in `.jsonl` files. Only `metadata` is used. Its `chunksUsed`
+holds `CHUNK_LIBRARY` ids for authored campaign levels and
+`FAMILY_TEMPLATES` family names for legacy levels; its `pacing` holds the
+phase list. The template a family picked (`mid_flat`, `coin_arc`, ...) and
+the phase each chunk belongs to are not exported, so they are not profiled.
+
+The vocabulary comes from `src/levelgen/generator.ts`. Files are read in
+batches by a process pool. Each batch is reduced to count vectors and a
+chunk co-occurrence matrix, built as `presence.T @ presence` over one-hot
+level rows, so memory stays flat however many levels are read. The report
+contains frequency tables, per-world counts, the co-occurrence matrix (CSV)
+and alerts for library chunks and families that never appear.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import json
+import os
+from pathlib import Path
+import re
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    print('ERROR: numpy is required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+
+GENERATOR_PATH = 'src/levelgen/generator.ts'
+STRUCTURAL_CHUNKS = {'start', 'checkpoint', 'end'}
+# Legacy levels record these families under a library chunk id (see generateLegacyLevel).
+FAMILY_CHUNK_ALIASES = {'benchmark_sprint': 'benchmark_sprint_01'}
+LIBRARY_ID_RE = re.compile(r"^  (\w+): \{\n    id: '\w+'", re.MULTILINE)
+BLOCK_KEY_RE = re.compile(r'^  (\w+):', re.MULTILINE)
+PHASE_RE = re.compile(r"'([A-Z]+)'")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Profile chunk, family and phase usage across exported levels.')
+    parser.add_argument('inputs', nargs='*', default=['artifacts/unity/levels'], help='Level .json/.jsonl files or directories.')
+    parser.add_argument('--out-dir', default='artifacts/levelgen', help='Where chunk_profile.json and the co-occurrence CSV go.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes.')
+    parser.add_argument('--batch', type=int, default=64, help='Files per worker task.')
+    parser.add_argument('--top', type=int, default=10, help='Rows of each frequency table to print.')
+    parser.add_argument('--fail-on-unused', action='store_true', help='Exit non-zero when a library chunk is never used.')
+    return parser.parse_args()
+
+
+def read_vocabulary(repo: Path) -> dict[str, list[str]]:
+    text = (repo / GENERATOR_PATH).read_text(encoding='utf-8')
+
+    def block(marker: str) -> str:
+        start = text.index(marker)
+        return text[start:text.index('\n};', start)]
+
+    return {
+        'chunks': LIBRARY_ID_RE.findall(block('export const CHUNK_LIBRARY')),
+        'families': BLOCK_KEY_RE.findall(block('export const FAMILY_TEMPLATES')),
+        'phases': PHASE_RE.findall(text[text.index('const PHASE_ORDER'):text.index('];', text.index('const PHASE_ORDER'))]),
+    }
+
+
+def iter_metadata(path: Path):
+    if path.suffix == '.jsonl':
+        with path.open(encoding='utf-8') as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line).get('metadata', {})
+    else:
+        yield json.loads(path.read_text(encoding='utf-8')).get('metadata', {})
+
+
+def profile_batch(paths: list[str], ids: list[str], phases: list[str]) -> dict:
+    """Count vectors and co-occurrence for a batch of files; ids indexes chunks and families together."""
+    index = {name: position for position, name in enumerate(ids)}
+    phase_index = {name: position for position, name in enumerate(phases)}
+    rows: list[np.ndarray] = []
+    worlds: list[int] = []
+    counts = np.zeros(len(ids), dtype=np.int64)
+    phase_counts = np.zeros(len(phases), dtype=np.int64)
+    phase_order_errors = 0
+    unknown: Counter[str] = Counter()
+    errors: list[str] = []
+
+    for raw_path in paths:
+        try:
+            for metadata in iter_metadata(Path(raw_path)):
+                present = np.zeros(len(ids), dtype=bool)
+                for chunk in metadata.get('chunksUsed', []):
+                    if chunk in STRUCTURAL_CHUNKS:
+                        continue
+                    if chunk not in index:
+                        unknown[chunk] += 1
+                        continue
+                    counts[index[chunk]] += 1
+                    present[index[chunk]] = True
+                pacing = [phase_index.get(phase, -1) for phase in metadata.get('pacing', [])]
+                for position in pacing:
+                    if position >= 0:
+                        phase_counts[position] += 1
+                if pacing != list(range(len(phases))):
+                    phase_order_errors += 1
+                rows.append(present)
+                worlds.append(int(metadata.get('world', 0)))
+        except (OSError, ValueError, AttributeError) as error:
+            errors.append(f'{raw_path}: {error}')
+
+    presence = np.array(rows, dtype=np.int32).reshape(-1, len(ids))
+    world_array = np.array(worlds, dtype=np.int64)
+    return {
+        'levels': len(rows),
+        'counts': counts,
+        'levelsWith': presence.sum(axis=0),
+        'cooccurrence': presence.T @ presence,
+        'perWorld': {int(world): presence[world_array == world].sum(axis=0) for world in np.unique(world_array)},
+        'phaseCounts': phase_counts,
+        'phaseOrderErrors': phase_order_errors,
+        'unknown': unknown,
+        'errors': errors,
+    }
+
+
+def collect_inputs(inputs: list[str]) -> list[str]:
+    paths = []
+    for entry in inputs:
+        path = Path(entry)
+        if path.is_dir():
+            paths.extend(str(child) for child in sorted(path.rglob('*')) if child.suffix in ('.json', '.jsonl'))
+        elif path.exists():
+            paths.append(str(path))
+    return paths
+
+
+def frequency_table(ids: list[str], counts: np.ndarray, levels_with: np.ndarray, levels: int) -> list[dict]:
+    order = np.lexsort((np.array(ids), -counts))
+    return [
+        {'id': ids[i], 'count': int(counts[i]), 'levels': int(levels_with[i]), 'share': round(float(levels_with[i]) / max(levels, 1), 4)}
+        for i in order
+    ]
+
+
+def main() -> int:
+    args = parse_args()
+    repo = Path(__file__).resolve().parents[1]
+    vocabulary = read_vocabulary(repo)
+    ids = vocabulary['chunks'] + [family for family in vocabulary['families'] if family not in vocabulary['chunks']]
+    phases = vocabulary['phases']
+    paths = collect_inputs(args.inputs)
+    if not paths:
+        print(f'No level JSON found in {", ".join(args.inputs)}. Export some with: npm run unity:export:all')
+        return 1
+
+    batch = max(1, args.batch)
+    batches = [paths[start:start + batch] for start in range(0, len(paths), batch)]
+    levels = 0
+    counts = np.zeros(len(ids), dtype=np.int64)
+    levels_with = np.zeros(len(ids), dtype=np.int64)
+    cooccurrence = np.zeros((len(ids), len(ids)), dtype=np.int64)
+    per_world: dict[int, np.ndarray] = {}
+    phase_counts = np.zeros(len(phases), dtype=np.int64)
+    phase_order_errors = 0
+    unknown: Counter[str] = Counter()
+    errors: list[str] = []
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for result in pool.map(profile_batch, batches, [ids] * len(batches), [phases] * len(batches)):
+            levels += result['levels']
+            counts += result['counts']
+            levels_with += result['levelsWith']
+            cooccurrence += result['cooccurrence']
+            for world, row in result['perWorld'].items():
+                per_world[world] = per_world.get(world, 0) + row
+            phase_counts += result['phaseCounts']
+            phase_order_errors += result['phaseOrderErrors']
+            unknown.update(result['unknown'])
+            errors.extend(result['errors'])
+
+    chunk_slice = slice(0, len(vocabulary['chunks']))
+    family_mask = np.isin(ids, vocabulary['families'])
+    unused_chunks = [ids[i] for i in np.flatnonzero(levels_with[chunk_slice] == 0)]
+    # Families only show up in legacy levels; without any, every family would look unused.
+    legacy_mask = family_mask & ~np.isin(ids, vocabulary['chunks'])
+    legacy_seen = bool(levels_with[legacy_mask].any())
+    used = {name for name, seen in zip(ids, levels_with) if seen}
+    unused_families = [
+        ids[i]
+        for i in np.flatnonzero(legacy_mask & (levels_with == 0))
+        if FAMILY_CHUNK_ALIASES.get(ids[i]) not in used
+    ] if legacy_seen else []
+
+    report = {
+        'levels': levels,
+        'files': len(paths),
+        'chunks': frequency_table(ids[chunk_slice], counts[chunk_slice], levels_with[chunk_slice], levels),
+        'families': frequency_table(
+            [ids[i] for i in np.flatnonzero(family_mask)], counts[family_mask], levels_with[family_mask], levels
+        ),
+        'phases': {phase: int(count) for phase, count in zip(phases, phase_counts)},
+        'phaseOrderErrors': phase_order_errors,
+        'perWorld': {
+            str(world): {ids[i]: int(row[i]) for i in np.flatnonzero(row)} for world, row in sorted(per_world.items())
+        },
+        'unusedChunks': unused_chunks,
+        'unusedFamilies': unused_families,
+        'unknownChunks': dict(unknown.most_common()),
+    }
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / 'chunk_profile.json').write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+    with (out_dir / 'chunk_cooccurrence.csv').open('w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(['chunk', *ids])
+        for name, row in zip(ids, cooccurrence):
+            writer.writerow([name, *row.tolist()])
+
+    print(f'Profiled {levels} level(s) from {len(paths)} file(s) -> {out_dir}/chunk_profile.json')
+    for title, table in (('chunks', report['chunks']), ('families', report['families'])):
+        used = [row for row in table if row['count']]
+        if used:
+            print(f'Top {title}:')
+            for row in used[: args.top]:
+                print(f'  {row["id"]}: {row["count"]} use(s) in {row["share"] * 100:.0f}% of levels')
+    print('Phases: ' + ', '.join(f'{phase} {count}' for phase, count in report['phases'].items()))
+
+    alerts = [f'unused chunk template: {name}' for name in unused_chunks]
+    alerts += [f'unused chunk family: {name}' for name in unused_families]
+    alerts += [f'chunk id not in {GENERATOR_PATH}: {name} ({count}x)' for name, count in unknown.most_common()]
+    if phase_order_errors:
+        alerts.append(f'{phase_order_errors} level(s) with pacing not in PHASE_ORDER')
+    alerts += errors
+    if alerts:
+        print(f'{len(alerts)} alert(s):')
+        for entry in alerts:
+            print(f'- {entry}')
+    return 1 if errors or (args.fail_on_unused and unused_chunks) else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
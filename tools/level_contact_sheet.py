@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Render paginated PNG contact sheets of `levelgen_smoke.py` levels.
+
+Tiles come from `public/assets/tiles`, using the same choice as PlayScene:
+`tile_ground_w{N}_top` for a solid tile with open space above it,
+`tile_ground_w{N}_mid` otherwise, and `tile_ground` for worlds without
+their own tiles. Per world, the tiles are scaled to `--tile` px and
+composited over the sky colour into a small atlas (K, tile, tile, 3). A
+level is then drawn in one fancy-index lookup: the tile-id grid indexes the
+atlas, and the (H, W, tile, tile, 3) result is transposed and reshaped into
+the preview image.
+
+Each worker process renders and saves whole pages. `index.json` records
+which world/level/seed sits at each page cell.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import json
+import os
+from pathlib import Path
+import time
+
+try:
+    import numpy as np
+    from PIL import Image, ImageDraw
+except Exception:  # pragma: no cover
+    print('ERROR: numpy and Pillow are required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+from levelgen_smoke import GOAL, HEIGHT, SOLID, SPAWN, WIDTH, generate_grid, parse_range
+
+
+TILES_DIR = Path(__file__).resolve().parents[1] / 'public/assets/tiles'
+SKY = (92, 148, 252)
+BACKGROUND = (24, 24, 32)
+LABEL_COLOR = (232, 232, 232)
+MARKER_COLORS = {'spawn': (64, 220, 96), 'goal': (240, 64, 64)}
+LABEL_HEIGHT = 12
+GUTTER = 4
+# Atlas slots: 0 sky, 1 ground top, 2 ground fill, 3 spawn, 4 goal.
+SKY_ID, TOP_ID, MID_ID, SPAWN_ID, GOAL_ID = range(5)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Render contact sheets of generated levels for bulk review.')
+    parser.add_argument('--worlds', default='1-7', help='World range, e.g. 1-7.')
+    parser.add_argument('--levels', default='1-6', help='Level range.')
+    parser.add_argument('--seeds', default='0-99', help='Seed range.')
+    parser.add_argument('--tile', type=int, default=4, help='Preview pixels per tile.')
+    parser.add_argument('--columns', type=int, default=4, help='Levels per sheet row.')
+    parser.add_argument('--per-page', type=int, default=64, help='Levels per sheet.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes.')
+    parser.add_argument('--out-dir', default='artifacts/levelgen/previews', help='Where sheets are written.')
+    return parser.parse_args()
+
+
+def load_tile(name: str, size: int) -> np.ndarray:
+    path = TILES_DIR / f'{name}.png'
+    if not path.exists():
+        path = TILES_DIR / 'tile_ground.png'
+    tile = Image.open(path).convert('RGBA').resize((size, size), Image.Resampling.BOX)
+    sky = Image.new('RGBA', (size, size), SKY + (255,))
+    return np.asarray(Image.alpha_composite(sky, tile).convert('RGB'))
+
+
+@lru_cache(maxsize=None)
+def load_atlas(world: int, size: int) -> np.ndarray:
+    atlas = np.empty((5, size, size, 3), dtype=np.uint8)
+    atlas[SKY_ID] = SKY
+    atlas[TOP_ID] = load_tile(f'tile_ground_w{world}_top', size)
+    atlas[MID_ID] = load_tile(f'tile_ground_w{world}_mid', size)
+    atlas[SPAWN_ID] = MARKER_COLORS['spawn']
+    atlas[GOAL_ID] = MARKER_COLORS['goal']
+    return atlas
+
+
+def atlas_ids(grid: np.ndarray) -> np.ndarray:
+    solid = grid == SOLID
+    above = np.zeros_like(solid)
+    above[1:] = solid[:-1]
+    ids = np.where(solid, np.where(above, MID_ID, TOP_ID), SKY_ID).astype(np.uint8)
+    ids[grid == SPAWN] = SPAWN_ID
+    ids[grid == GOAL] = GOAL_ID
+    return ids
+
+
+def render_level(ids: np.ndarray, atlas: np.ndarray) -> np.ndarray:
+    """(H*tile, W*tile, 3) image for a tile-id grid: one atlas lookup, then a reshape."""
+    height, width = ids.shape
+    size = atlas.shape[1]
+    return atlas[ids].transpose(0, 2, 1, 3, 4).reshape(height * size, width * size, 3)
+
+
+def render_page(page: int, entries: list[tuple[int, int, int]], size: int, columns: int, out_dir: str) -> str:
+    cell_w = WIDTH * size
+    cell_h = HEIGHT * size + LABEL_HEIGHT
+    rows = -(-len(entries) // columns)
+    sheet = np.empty((GUTTER + rows * (cell_h + GUTTER), GUTTER + columns * (cell_w + GUTTER), 3), dtype=np.uint8)
+    sheet[:] = BACKGROUND
+    for slot, (world, level, seed) in enumerate(entries):
+        top = GUTTER + (slot // columns) * (cell_h + GUTTER) + LABEL_HEIGHT
+        left = GUTTER + (slot % columns) * (cell_w + GUTTER)
+        sheet[top:top + HEIGHT * size, left:left + cell_w] = render_level(
+            atlas_ids(generate_grid(world, level, seed)), load_atlas(world, size)
+        )
+
+    image = Image.fromarray(sheet)
+    draw = ImageDraw.Draw(image)
+    for slot, (world, level, seed) in enumerate(entries):
+        top = GUTTER + (slot // columns) * (cell_h + GUTTER)
+        left = GUTTER + (slot % columns) * (cell_w + GUTTER)
+        draw.text((left, top), f'w{world} l{level} seed {seed}', fill=LABEL_COLOR)
+    path = Path(out_dir) / f'sheet_{page:04d}.png'
+    image.save(path, compress_level=3)
+    return path.name
+
+
+def main() -> int:
+    args = parse_args()
+    entries = [
+        (world, level, seed)
+        for world in parse_range(args.worlds)
+        for level in parse_range(args.levels)
+        for seed in parse_range(args.seeds)
+    ]
+    if not entries:
+        print('No levels selected.')
+        return 1
+
+    size = max(1, args.tile)
+    columns = max(1, args.columns)
+    per_page = max(1, args.per_page)
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.glob('sheet_*.png'):
+        stale.unlink()
+    pages = [entries[start:start + per_page] for start in range(0, len(entries), per_page)]
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = [
+            pool.submit(render_page, page + 1, chunk, size, columns, str(out_dir)) for page, chunk in enumerate(pages)
+        ]
+        names = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started
+
+    index = {
+        name: [{'world': world, 'level': level, 'seed': seed} for world, level, seed in chunk]
+        for name, chunk in zip(names, pages)
+    }
+    (out_dir / 'index.json').write_text(json.dumps(index, indent=2) + '\n', encoding='utf-8')
+    print(f'Rendered {len(entries)} level(s) onto {len(pages)} sheet(s) in {elapsed:.2f}s -> {out_dir}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
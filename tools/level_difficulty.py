@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Difficulty metrics over batches of `levelgen_smoke.py` levels.
+
+Each worker generates a chunk of seeds into an (N, HEIGHT, WIDTH) stack.
+Every metric is then computed for the whole stack with array operations on
+column occupancy and ground tops:
+
+- gaps: runs of columns with no ground. Run starts and ends come from
+  `np.diff` of the padded occupancy; this gives the count and widths.
+- ground variance: variance of ground-top rows over the columns that have
+  ground.
+- longest safe run: the most consecutive columns walkable without jumping,
+  meaning ground on both sides and a height change of at most one row.
+- hazard density: the fraction of columns that are pits or pit edges. The
+  smoke grid has no enemies or spikes, so pits are the hazards.
+
+Per-world histograms and summary statistics are written as JSON or CSV. The
+run also checks that mean difficulty ramps up across worlds.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import json
+import os
+from pathlib import Path
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    print('ERROR: numpy is required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+from levelgen_smoke import HEIGHT, SOLID, WIDTH, generate_grid, parse_range
+
+
+METRIC_BINS = {
+    'gapCount': np.arange(0, 41),
+    'gapWidth': np.arange(1, 13),
+    'groundVariance': np.linspace(0.0, 6.0, 25),
+    'longestSafeRun': np.arange(0, WIDTH + 1, 5),
+    'hazardDensity': np.linspace(0.0, 0.5, 26),
+}
+# Metrics expected to rise with world number; longestSafeRun is expected to fall.
+RAMP_DIRECTION = {'gapCount': 1, 'hazardDensity': 1, 'longestSafeRun': -1}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Compute per-world difficulty histograms over generated levels.')
+    parser.add_argument('--worlds', default='1-7', help='World range, e.g. 1-7.')
+    parser.add_argument('--levels', default='1-6', help='Level range.')
+    parser.add_argument('--seeds', default='0-999', help='Seed range.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes.')
+    parser.add_argument('--chunk', type=int, default=2000, help='Seeds per worker task.')
+    parser.add_argument('--format', choices=['json', 'csv'], default='json', help='Output format.')
+    parser.add_argument('--out', default='artifacts/levelgen/difficulty.json', help='Output path.')
+    return parser.parse_args()
+
+
+def run_lengths(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Row index and length of every run of True along axis 1 of a 2-D bool array."""
+    padded = np.zeros((mask.shape[0], mask.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    start_rows, start_cols = np.nonzero(edges == 1)
+    _, end_cols = np.nonzero(edges == -1)
+    return start_rows, end_cols - start_cols
+
+
+def level_metrics(grids: np.ndarray) -> dict[str, np.ndarray]:
+    """Per-level metrics for a (N, HEIGHT, WIDTH) stack; gapWidth is flattened over all gaps."""
+    solid = grids == SOLID
+    ground = solid.any(axis=1)
+    tops = np.where(ground, solid.argmax(axis=1), HEIGHT).astype(np.float64)
+    count = len(grids)
+
+    gap_rows, gap_widths = run_lengths(~ground)
+    gap_count = np.bincount(gap_rows, minlength=count)
+
+    columns = ground.sum(axis=1)
+    masked_tops = np.where(ground, tops, 0.0)
+    mean_top = masked_tops.sum(axis=1) / np.maximum(columns, 1)
+    variance = (np.where(ground, (tops - mean_top[:, None]) ** 2, 0.0)).sum(axis=1) / np.maximum(columns, 1)
+
+    safe_step = ground[:, :-1] & ground[:, 1:] & (np.abs(np.diff(tops, axis=1)) <= 1)
+    safe_rows, safe_lengths = run_lengths(safe_step)
+    longest = np.zeros(count, dtype=np.int64)
+    np.maximum.at(longest, safe_rows, safe_lengths + 1)
+    longest = np.where(columns > 0, np.maximum(longest, 1), 0)
+
+    pit = ~ground
+    edge = np.zeros_like(pit)
+    edge[:, 1:] |= pit[:, :-1]
+    edge[:, :-1] |= pit[:, 1:]
+    hazard = (pit | (ground & edge)).mean(axis=1)
+
+    return {
+        'gapCount': gap_count,
+        'gapWidth': gap_widths,
+        'groundVariance': variance,
+        'longestSafeRun': longest,
+        'hazardDensity': hazard,
+    }
+
+
+def metrics_chunk(world: int, level: int, seeds: list[int]) -> dict[str, np.ndarray]:
+    grids = np.stack([generate_grid(world, level, seed) for seed in seeds])
+    return level_metrics(grids)
+
+
+def summarize(values: np.ndarray, bins: np.ndarray) -> dict:
+    # The open last bin catches values past the configured range.
+    counts, edges = np.histogram(values, bins=np.append(bins, np.inf))
+    return {
+        'samples': int(values.size),
+        'mean': round(float(values.mean()), 4) if values.size else 0.0,
+        'p50': round(float(np.percentile(values, 50)), 4) if values.size else 0.0,
+        'p90': round(float(np.percentile(values, 90)), 4) if values.size else 0.0,
+        'histogram': {'edges': [round(float(edge), 4) for edge in edges[:-1]], 'counts': counts.tolist()},
+    }
+
+
+def ramp_report(per_world: dict[int, dict]) -> list[str]:
+    lines = []
+    worlds = sorted(per_world)
+    for metric, direction in RAMP_DIRECTION.items():
+        means = [per_world[world][metric]['mean'] for world in worlds]
+        breaks = [
+            f'{worlds[i]}->{worlds[i + 1]}'
+            for i in range(len(means) - 1)
+            if (means[i + 1] - means[i]) * direction < 0
+        ]
+        trend = 'rising' if direction > 0 else 'falling'
+        status = f'{trend} as expected' if not breaks else f'not {trend} at world {", ".join(breaks)}'
+        lines.append(f'{metric}: {" / ".join(f"{mean:.3f}" for mean in means)} ({status})')
+    return lines
+
+
+def write_csv(path: Path, per_world: dict[int, dict]) -> None:
+    with path.open('w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(['world', 'metric', 'bin_start', 'count', 'mean', 'p50', 'p90'])
+        for world, metrics in sorted(per_world.items()):
+            for metric, summary in metrics.items():
+                for edge, count in zip(summary['histogram']['edges'], summary['histogram']['counts']):
+                    writer.writerow([world, metric, edge, count, summary['mean'], summary['p50'], summary['p90']])
+
+
+def main() -> int:
+    args = parse_args()
+    worlds = parse_range(args.worlds)
+    levels = parse_range(args.levels)
+    seeds = parse_range(args.seeds)
+    chunk = max(1, args.chunk)
+    tasks = [
+        (world, level, seeds[start:start + chunk])
+        for world in worlds
+        for level in levels
+        for start in range(0, len(seeds), chunk)
+    ]
+    if not tasks:
+        print('No levels selected.')
+        return 1
+
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(metrics_chunk, *zip(*tasks)))
+
+    per_world: dict[int, dict] = {}
+    for world in worlds:
+        chunks = [result for task, result in zip(tasks, results) if task[0] == world]
+        per_world[world] = {
+            metric: summarize(np.concatenate([chunk_result[metric] for chunk_result in chunks]), bins)
+            for metric, bins in METRIC_BINS.items()
+        }
+
+    out_path = Path(args.out)
+    if args.format == 'csv' and out_path.suffix == '.json':
+        out_path = out_path.with_suffix('.csv')
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    if args.format == 'csv':
+        write_csv(out_path, per_world)
+    else:
+        out_path.write_text(json.dumps({str(world): metrics for world, metrics in per_world.items()}, indent=2) + '\n', encoding='utf-8')
+
+    total = sum(per_world[world]['gapCount']['samples'] for world in worlds)
+    print(f'Difficulty metrics for {total} level(s) across {len(worlds)} world(s) -> {out_path}')
+    for line in ramp_report(per_world):
+        print(f'  {line}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Determinism fingerprints for `levelgen_smoke.py` levels.
+
+Each generated level is reduced to a 64-bit BLAKE2b hash. The input is its
+collision grid bit-packed with `np.packbits`, plus the spawn and goal
+positions. `--record` writes the hashes for a world/level/seed sweep to a
+compressed `.npz` index (about 16 bytes per level before compression). The
+index for the default sweep is committed, so a fresh checkout checks the
+generator against a known reference rather than against itself.
+Without `--record`, the same sweep is regenerated across a process pool and
+compared against the index, and the first divergent seeds are reported for
+each world/level. Levels missing from the index fail the check. Index
+entries outside the sweep are listed, and fail it only with `--strict`.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import os
+from pathlib import Path
+import time
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    print('ERROR: numpy is required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+from levelgen_smoke import GOAL, SOLID, SPAWN, generate_grid, parse_range
+
+
+# Tracked reference for the default sweep; refresh it with --record only when a generator change is intended.
+DEFAULT_INDEX = 'tools/fixtures/levelgen_fingerprints.npz'
+# Bump when the fingerprint encoding changes; old indexes are then rejected instead of mis-compared.
+FINGERPRINT_VERSION = 1
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Record or verify determinism fingerprints of generated levels.')
+    parser.add_argument('--index', default=DEFAULT_INDEX, help='Fingerprint index (.npz).')
+    parser.add_argument('--record', action='store_true', help='Write a new index instead of checking against one.')
+    parser.add_argument('--worlds', default='1-7', help='World range, e.g. 1-7 or 1,3,5.')
+    parser.add_argument('--levels', default='1-6', help='Level range.')
+    parser.add_argument('--seeds', default='0-999', help='Seed range.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes.')
+    parser.add_argument('--chunk', type=int, default=2000, help='Seeds per worker task.')
+    parser.add_argument('--show', type=int, default=5, help='Seeds listed per world/level.')
+    parser.add_argument('--strict', action='store_true', help='Also fail when index entries are outside the sweep.')
+    return parser.parse_args()
+
+
+def fingerprint(grid: np.ndarray) -> int:
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(np.array(grid.shape, dtype=np.uint16).tobytes())
+    digest.update(np.packbits(grid == SOLID).tobytes())
+    for marker in (SPAWN, GOAL):
+        digest.update(np.argwhere(grid == marker).astype(np.uint16).tobytes())
+    return int.from_bytes(digest.digest(), 'little')
+
+
+def fingerprint_chunk(world: int, level: int, seeds: list[int]) -> np.ndarray:
+    return np.array([fingerprint(generate_grid(world, level, seed)) for seed in seeds], dtype=np.uint64)
+
+
+def sweep(worlds: list[int], levels: list[int], seeds: list[int], jobs: int, chunk: int) -> dict[str, np.ndarray]:
+    """Fingerprint every (world, level, seed); returns columns world/level/seed/hash."""
+    chunk = max(1, chunk)
+    tasks = [
+        (world, level, seeds[start:start + chunk])
+        for world in worlds
+        for level in levels
+        for start in range(0, len(seeds), chunk)
+    ]
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as pool:
+        hashes = list(pool.map(fingerprint_chunk, *zip(*tasks))) if tasks else []
+
+    return {
+        'world': np.concatenate([np.full(len(task[2]), task[0], dtype=np.uint8) for task in tasks]),
+        'level': np.concatenate([np.full(len(task[2]), task[1], dtype=np.uint8) for task in tasks]),
+        'seed': np.concatenate([np.asarray(task[2], dtype=np.uint32) for task in tasks]),
+        'hash': np.concatenate(hashes),
+    }
+
+
+def load_index(path: Path) -> dict[str, np.ndarray]:
+    with np.load(path) as data:
+        if int(data['version']) != FINGERPRINT_VERSION:
+            raise RuntimeError(f'{path} has fingerprint version {int(data["version"])}, expected {FINGERPRINT_VERSION}')
+        return {key: data[key] for key in ('world', 'level', 'seed', 'hash')}
+
+
+def entry_keys(columns: dict[str, np.ndarray]) -> np.ndarray:
+    return (
+        columns['world'].astype(np.uint64) << np.uint64(40)
+        | columns['level'].astype(np.uint64) << np.uint64(32)
+        | columns['seed'].astype(np.uint64)
+    )
+
+
+def print_seeds(columns: dict[str, np.ndarray], mask: np.ndarray, show: int) -> None:
+    pairs = np.unique(np.stack([columns['world'][mask], columns['level'][mask]], axis=1), axis=0)
+    for world, level in pairs:
+        selected = mask & (columns['world'] == world) & (columns['level'] == level)
+        first = np.sort(columns['seed'][selected])[:show]
+        print(f'- world={world} level={level}: {int(selected.sum())} seed(s), first {", ".join(str(seed) for seed in first)}')
+
+
+def main() -> int:
+    args = parse_args()
+    worlds = parse_range(args.worlds)
+    levels = parse_range(args.levels)
+    seeds = parse_range(args.seeds)
+    index_path = Path(__file__).resolve().parents[1] / args.index
+
+    started = time.perf_counter()
+    current = sweep(worlds, levels, seeds, args.jobs, args.chunk)
+    elapsed = time.perf_counter() - started
+    count = len(current['hash'])
+
+    if args.record:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(index_path, version=np.array(FINGERPRINT_VERSION), **current)
+        print(f'Recorded {count} fingerprint(s) in {elapsed:.2f}s to {index_path} ({index_path.stat().st_size} bytes).')
+        return 0
+
+    if not index_path.exists():
+        print(f'No fingerprint index at {index_path}; run with --record first.')
+        return 1
+    try:
+        recorded = load_index(index_path)
+    except (RuntimeError, KeyError, ValueError) as error:
+        print(f'Fingerprint index unreadable: {error}')
+        return 1
+
+    recorded_keys = entry_keys(recorded)
+    order = np.argsort(recorded_keys)
+    current_keys = entry_keys(current)
+    position = np.searchsorted(recorded_keys[order], current_keys)
+    position = np.minimum(position, len(order) - 1) if len(order) else position
+    found = len(order) > 0
+    known = recorded_keys[order][position] == current_keys if found else np.zeros(count, dtype=bool)
+    expected = recorded['hash'][order][position] if found else np.zeros(count, dtype=np.uint64)
+    diverged = known & (expected != current['hash'])
+
+    uncovered = ~known
+    unswept = ~np.isin(recorded_keys, current_keys)
+    print(f'Fingerprinted {count} level(s) in {elapsed:.2f}s; {int(known.sum())} covered by {index_path}.')
+    if uncovered.any():
+        print(f'{int(uncovered.sum())} level(s) are not in the index; re-run with --record:')
+        print_seeds(current, uncovered, args.show)
+    if unswept.any():
+        print(f'{int(unswept.sum())} index entries are outside this sweep' + ('' if args.strict else ' (not compared)') + ':')
+        print_seeds(recorded, unswept, args.show)
+    if diverged.any():
+        print(f'{int(diverged.sum())} level(s) diverged from the recorded fingerprints:')
+        print_seeds(current, diverged, args.show)
+    if diverged.any() or uncovered.any() or (args.strict and unswept.any()):
+        return 1
+    print('Determinism check passed.')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
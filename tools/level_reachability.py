@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Jump-arc reachability solver for generated heightmap level grids.
+
+The jump model is read from `PLAYER_CONSTANTS` in `src/core/constants.ts`,
+the values `src/player/movement.ts` integrates each frame: jump velocity,
+gravity, max speed with the run multiplier, and the tile size. From those it
+precomputes two tables once. `landing[dx, rise]` says whether a running jump
+can land `dx` columns away on ground `rise` rows higher (negative = lower).
+`clearance[k]` is the lowest height the arc has above intermediate column
+`k`. Per grid, column tops are compared against the tables for every jump
+length at once. Spawn-to-goal reachability is then a BFS over the resulting
+column adjacency matrix.
+
+The model is deliberately simple: the arc is the full-speed, full-hold jump,
+there is no wall-jump or bounce, and terrain is treated as a heightmap
+(first solid row per column).
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from functools import lru_cache
+import math
+from pathlib import Path
+import re
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    print('ERROR: numpy is required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+
+CONSTANTS_PATH = 'src/core/constants.ts'
+CONSTANT_RE = re.compile(r'^\s*(\w+):\s*(-?\d+(?:\.\d+)?)', re.MULTILINE)
+TILE_SIZE_RE = re.compile(r'export const TILE_SIZE = (\d+);')
+# Mirrors physicsMultipliers.gravityMultiplier in src/content/contentManifest.ts.
+WORLD_GRAVITY_MULTIPLIERS = {5: 1.15}
+# Horizontal slack (px) the player needs to get feet onto the landing column.
+LANDING_MARGIN_PX = 4.0
+SOLID = 1
+SPAWN = 2
+GOAL = 3
+
+
+@dataclass(frozen=True)
+class JumpModel:
+    tile: int
+    jump_velocity: float
+    gravity: float
+    air_speed: float
+    max_rows: int
+    landing: np.ndarray
+    clearance: np.ndarray
+
+    @property
+    def max_dx(self) -> int:
+        return self.landing.shape[0] - 1
+
+    def can_land(self, dx: np.ndarray | int, rise_rows: np.ndarray | int) -> np.ndarray:
+        rise = np.clip(rise_rows, -self.max_rows, self.max_rows) + self.max_rows
+        return self.landing[dx, rise]
+
+
+def read_player_constants(repo: Path) -> tuple[dict[str, float], int]:
+    text = (repo / CONSTANTS_PATH).read_text(encoding='utf-8')
+    block = text[text.index('export const PLAYER_CONSTANTS'):]
+    block = block[: block.index('} as const')]
+    tile = TILE_SIZE_RE.search(text)
+    if tile is None:
+        raise RuntimeError(f'TILE_SIZE not found in {CONSTANTS_PATH}')
+    return {name: float(value) for name, value in CONSTANT_RE.findall(block)}, int(tile.group(1))
+
+
+def arc_height(t: np.ndarray, jump_velocity: float, gravity: float) -> np.ndarray:
+    return jump_velocity * t - 0.5 * gravity * t * t
+
+
+@lru_cache(maxsize=None)
+def build_model(repo: str, gravity_multiplier: float = 1.0, max_rows: int = 32) -> JumpModel:
+    constants, tile = read_player_constants(Path(repo))
+    jump_velocity = -constants['jumpVelocity']
+    gravity = constants['gravityY'] * gravity_multiplier
+    air_speed = constants['maxSpeed'] * constants['runSpeedMultiplier']
+
+    # Latest time the arc is at `rise` px (descending branch); NaN above the apex.
+    rise_px = np.arange(-max_rows, max_rows + 1, dtype=np.float64) * tile
+    disc = jump_velocity ** 2 - 2.0 * gravity * rise_px
+    with np.errstate(invalid='ignore'):
+        t_down = (jump_velocity + np.sqrt(disc)) / gravity
+    reach_px = np.where(disc >= 0, air_speed * t_down, -1.0)
+
+    max_dx = int(math.floor((reach_px.max() - LANDING_MARGIN_PX) / tile)) + 1
+    needed_px = (np.arange(max_dx + 1, dtype=np.float64)[:, None] - 1) * tile + LANDING_MARGIN_PX
+    landing = reach_px[None, :] >= needed_px
+    landing[0] = False
+
+    # Arc height over intermediate column k spans x in [(k-1)*tile, k*tile]; a concave arc is lowest at an end.
+    edges = np.arange(max_dx + 1, dtype=np.float64) * tile / air_speed
+    heights = arc_height(edges, jump_velocity, gravity)
+    clearance = np.full(max_dx + 1, np.inf)
+    clearance[1:] = np.minimum(heights[:-1], heights[1:])
+    return JumpModel(tile, jump_velocity, gravity, air_speed, max_rows, landing, clearance)
+
+
+def column_tops(grid: np.ndarray) -> np.ndarray:
+    """First solid row per column (grid height for columns with no ground)."""
+    solid = grid == SOLID
+    return np.where(solid.any(axis=0), solid.argmax(axis=0), grid.shape[0]).astype(np.int32)
+
+
+def jump_adjacency(tops: np.ndarray, height: int, model: JumpModel) -> np.ndarray:
+    """Boolean (W, W) matrix: adjacency[i, j] if column j is reachable from column i in one jump."""
+    width = len(tops)
+    standable = tops < height
+    adjacency = np.zeros((width, width), dtype=bool)
+    if not standable.any():
+        return adjacency
+    # No jump in this grid can drop further than its lowest ground, which bounds the jump length.
+    ground = tops[standable]
+    max_drop = int(ground.max() - ground.min())
+    reachable_dx = np.flatnonzero(model.can_land(np.arange(model.max_dx + 1), -max_drop))
+    max_dx = min(int(reachable_dx.max(initial=0)), width - 1)
+    for direction in (1, -1):
+        t = tops if direction == 1 else tops[::-1]
+        stand = standable if direction == 1 else standable[::-1]
+        clear = np.ones(width, dtype=bool)
+        for dx in range(1, max_dx + 1):
+            src = np.arange(width - dx)
+            if dx > 1:
+                # Intermediate column dx-1 must stay under the arc for this and every longer jump.
+                rise_k = (t[src] - t[src + dx - 1]) * model.tile
+                clear[src] &= rise_k <= model.clearance[dx - 1]
+            ok = stand[src] & stand[src + dx] & clear[src] & model.can_land(dx, t[src] - t[src + dx])
+            hits = src[ok]
+            if direction == 1:
+                adjacency[hits, hits + dx] = True
+            else:
+                adjacency[width - 1 - hits, width - 1 - hits - dx] = True
+    return adjacency
+
+
+@dataclass(frozen=True)
+class ReachResult:
+    reachable: bool
+    spawn_column: int
+    goal_column: int
+    furthest_column: int
+    reason: str = ''
+
+
+def solve(grid: np.ndarray, model: JumpModel) -> ReachResult:
+    spawn = np.argwhere(grid == SPAWN)
+    goal = np.argwhere(grid == GOAL)
+    if not len(spawn) or not len(goal):
+        return ReachResult(False, -1, -1, -1, 'missing spawn or goal marker')
+    spawn_col = int(spawn[0][1])
+    goal_col = int(goal[0][1])
+    tops = column_tops(grid)
+    if tops[spawn_col] >= grid.shape[0]:
+        return ReachResult(False, spawn_col, goal_col, spawn_col, 'spawn column has no ground')
+    if tops[goal_col] >= grid.shape[0]:
+        return ReachResult(False, spawn_col, goal_col, spawn_col, 'goal column has no ground')
+
+    adjacency = jump_adjacency(tops, grid.shape[0], model)
+    reached = np.zeros(len(tops), dtype=bool)
+    reached[spawn_col] = True
+    frontier = reached.copy()
+    while frontier.any() and not reached[goal_col]:
+        frontier = adjacency[frontier].any(axis=0) & ~reached
+        reached |= frontier
+
+    columns = np.flatnonzero(reached)
+    furthest = int(columns.max()) if goal_col >= spawn_col else int(columns.min())
+    if reached[goal_col]:
+        return ReachResult(True, spawn_col, goal_col, furthest)
+    return ReachResult(False, spawn_col, goal_col, furthest, f'stuck at column {furthest}')
+
+
+def model_for_world(repo: Path, world: int) -> JumpModel:
+    return build_model(str(repo), WORLD_GRAVITY_MULTIPLIERS.get(world, 1.0))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Check that a generated smoke level is beatable with the player jump arc.')
+    parser.add_argument('--world', type=int, required=True)
+    parser.add_argument('--level', type=int, required=True)
+    parser.add_argument('--seed', type=int, required=True)
+    return parser.parse_args()
+
+
+def main() -> int:
+    from levelgen_smoke import generate_grid, render_ascii
+
+    args = parse_args()
+    repo = Path(__file__).resolve().parents[1]
+    model = model_for_world(repo, args.world)
+    print(
+        f'Jump model: apex {model.jump_velocity ** 2 / (2 * model.gravity) / model.tile:.2f} tiles, '
+        f'air speed {model.air_speed:.0f}px/s, max jump {model.max_dx} columns'
+    )
+    grid = generate_grid(args.world, args.level, args.seed)
+    result = solve(grid, model)
+    if result.reachable:
+        print(f'Level world={args.world} level={args.level} seed={args.seed} is beatable.')
+        return 0
+
+    for row in render_ascii(grid):
+        print(row)
+    print(f'Level world={args.world} level={args.level} seed={args.seed} is unbeatable: {result.reason}.')
+    return 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,49 +1,215 @@
 #!/usr/bin/env python3
-"""Deterministic level generation smoke check with ASCII preview."""
+"""Deterministic level generation smoke check with ASCII preview.
+
+Single mode (`--world/--level/--seed`) prints one level as ASCII. Batch mode
+(`--batch`) sweeps seed, world and level ranges across a process pool and
+prints an aggregate summary. Grids are uint8 arrays (`EMPTY`, `SOLID`,
+`SPAWN`, `GOAL`). The generator draws one ground top per column, then fills
+the terrain with a single broadcast comparison.
+"""
 
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
 import random
+import time
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    print('ERROR: numpy is required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+
+WIDTH = 120
+HEIGHT = 22
+BASE_Y = 16
+
+EMPTY = 0
+SOLID = 1
+SPAWN = 2
+GOAL = 3
+ASCII = np.array(['.', '#', 'S', 'G'])
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser()
-    p.add_argument('--world', type=int, required=True)
-    p.add_argument('--level', type=int, required=True)
-    p.add_argument('--seed', type=int, required=True)
+    p.add_argument('--world', type=int)
+    p.add_argument('--level', type=int)
+    p.add_argument('--seed', type=int)
+    p.add_argument('--batch', action='store_true', help='Sweep --worlds/--levels/--seeds and print a summary.')
+    p.add_argument('--worlds', default='1-7', help='Batch world range, e.g. 1-7 or 1,3,5.')
+    p.add_argument('--levels', default='1-6', help='Batch level range.')
+    p.add_argument('--seeds', default='0-999', help='Batch seed range.')
+    p.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes for --batch.')
+    p.add_argument('--chunk', type=int, default=2000, help='Seeds per worker task.')
+    p.add_argument(
+        '--reachability',
+        action='store_true',
+        help='Also run the jump-arc solver (tools/level_reachability.py) and fail on unbeatable levels.'
+    )
     return p.parse_args()
 
 
+def parse_range(text: str) -> list[int]:
+    values: list[int] = []
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-', 1)
+            values.extend(range(int(start), int(end) + 1))
+        else:
+            values.append(int(part))
+    return values
+
+
+def column_tops(world: int, level: int, seed: int) -> tuple[np.ndarray, int]:
+    """Per-column ground top row (HEIGHT for gaps) and the final ground height."""
+    rng = random.Random(seed + world * 100_003 + level * 9_973)
+    tops = np.full(WIDTH, HEIGHT, dtype=np.int16)
+    gap_chance = 0.05 + world * 0.01
+    y = BASE_Y
+    for x in range(WIDTH):
+        if x % 12 == 0:
+            y = max(12, min(18, y + rng.choice([-1, 0, 1])))
+        if not rng.random() < gap_chance:
+            tops[x] = y
+    return tops, y
+
+
+def generate_grid(world: int, level: int, seed: int) -> np.ndarray:
+    tops, y = column_tops(world, level, seed)
+    rows = np.arange(HEIGHT, dtype=np.int16)[:, None]
+    grid = (rows >= tops[None, :]).astype(np.uint8)
+    grid[y - 1, 2] = SPAWN
+    grid[y - 1, WIDTH - 3] = GOAL
+    return grid
+
+
+def render_ascii(grid: np.ndarray) -> list[str]:
+    return [''.join(row) for row in ASCII[grid]]
+
+
+def validate_grid(grid: np.ndarray) -> list[str]:
+    errors = []
+    if not (grid == SPAWN).any():
+        errors.append('missing spawn marker')
+    if not (grid == GOAL).any():
+        errors.append('missing goal marker')
+    return errors
+
+
+def gap_widths(grid: np.ndarray) -> np.ndarray:
+    """Widths of runs of columns with no solid tile."""
+    open_columns = np.concatenate([[0], (grid == SOLID).sum(axis=0) == 0, [0]]).astype(np.int8)
+    edges = np.diff(open_columns)
+    return np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+
+
+def sweep_chunk(world: int, level: int, seeds: list[int], reachability: bool = False) -> dict:
+    """Generate and validate a run of seeds; returns aggregate counters only."""
+    stats = {'levels': 0, 'failures': [], 'gapColumns': 0, 'widestGap': 0, 'minTop': HEIGHT, 'maxTop': 0, 'unbeatable': 0}
+    model = None
+    if reachability:
+        from level_reachability import model_for_world, solve
+
+        model = model_for_world(Path(__file__).resolve().parents[1], world)
+    for seed in seeds:
+        grid = generate_grid(world, level, seed)
+        stats['levels'] += 1
+        errors = validate_grid(grid)
+        if model is not None and not errors:
+            result = solve(grid, model)
+            if not result.reachable:
+                stats['unbeatable'] += 1
+                errors.append(f'unbeatable ({result.reason})')
+        if errors:
+            stats['failures'].append(f'world={world} level={level} seed={seed}: {", ".join(errors)}')
+        widths = gap_widths(grid)
+        stats['gapColumns'] += int(widths.sum())
+        stats['widestGap'] = max(stats['widestGap'], int(widths.max(initial=0)))
+        solid = grid == SOLID
+        tops = np.where(solid.any(axis=0), solid.argmax(axis=0), HEIGHT)
+        ground = tops[tops < HEIGHT]
+        if ground.size:
+            stats['minTop'] = min(stats['minTop'], int(ground.min()))
+            stats['maxTop'] = max(stats['maxTop'], int(ground.max()))
+    return stats
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    worlds = parse_range(args.worlds)
+    levels = parse_range(args.levels)
+    seeds = parse_range(args.seeds)
+    chunk = max(1, args.chunk)
+    tasks = [
+        (world, level, seeds[start:start + chunk])
+        for world in worlds
+        for level in levels
+        for start in range(0, len(seeds), chunk)
+    ]
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = [pool.submit(sweep_chunk, *task, args.reachability) for task in tasks]
+        results = [(task[0], future.result()) for task, future in zip(tasks, futures)]
+    elapsed = time.perf_counter() - started
+
+    per_world: dict[int, dict] = {}
+    failures: list[str] = []
+    for world, stats in results:
+        total = per_world.setdefault(
+            world, {'levels': 0, 'gapColumns': 0, 'widestGap': 0, 'minTop': HEIGHT, 'maxTop': 0, 'unbeatable': 0}
+        )
+        total['levels'] += stats['levels']
+        total['unbeatable'] += stats['unbeatable']
+        total['gapColumns'] += stats['gapColumns']
+        total['widestGap'] = max(total['widestGap'], stats['widestGap'])
+        total['minTop'] = min(total['minTop'], stats['minTop'])
+        total['maxTop'] = max(total['maxTop'], stats['maxTop'])
+        failures.extend(stats['failures'])
+
+    levels_checked = sum(total['levels'] for total in per_world.values())
+    print(f'Level smoke batch: {len(worlds)} world(s) x {len(levels)} level(s) x {len(seeds)} seed(s)')
+    for world in sorted(per_world):
+        total = per_world[world]
+        print(
+            f'  world {world}: {total["levels"]} levels, '
+            f'{total["gapColumns"] / max(1, total["levels"]):.2f} gap columns/level, widest gap {total["widestGap"]}, '
+            f'ground rows {total["minTop"]}-{total["maxTop"]}'
+            + (f', {total["unbeatable"]} unbeatable' if args.reachability else '')
+        )
+    print(f'Checked {levels_checked} level(s) in {elapsed:.2f}s ({levels_checked / max(elapsed, 1e-9):.0f}/s).')
+
+    if failures:
+        print(f'{len(failures)} level(s) failed smoke validation:')
+        for entry in failures[:20]:
+            print(f'- {entry}')
+        return 1
+    print('Smoke validation passed.')
+    return 0
+
+
 def main() -> int:
     args = parse_args()
-    width = 120
-    height = 22
-    base_y = 16
-
-    rng = random.Random(args.seed + args.world * 100_003 + args.level * 9_973)
-    grid = [['.' for _ in range(width)] for _ in range(height)]
-
-    y = base_y
-    for x in range(width):
-      if x % 12 == 0:
-        y = max(12, min(18, y + rng.choice([-1, 0, 1])))
-      gap = rng.random() < (0.05 + args.world * 0.01)
-      if not gap:
-        for yy in range(y, height):
-          grid[yy][x] = '#'
-
-    spawn = (2, y - 1)
-    goal = (width - 3, y - 1)
-    grid[spawn[1]][spawn[0]] = 'S'
-    grid[goal[1]][goal[0]] = 'G'
+    if args.batch:
+        return run_batch(args)
+    if args.world is None or args.level is None or args.seed is None:
+        print('--world, --level and --seed are required unless --batch is given.')
+        return 2
 
+    grid = generate_grid(args.world, args.level, args.seed)
     print(f'Level smoke world={args.world} level={args.level} seed={args.seed}')
-    for row in grid:
-      print(''.join(row))
+    for row in render_ascii(grid):
+        print(row)
 
-    assert any('S' in ''.join(r) for r in grid), 'missing spawn marker'
-    assert any('G' in ''.join(r) for r in grid), 'missing goal marker'
+    errors = validate_grid(grid)
+    assert not errors, '; '.join(errors)
     print('Smoke validation passed.')
     return 0
 
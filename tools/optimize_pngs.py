@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""Lossless PNG optimization for shipped Super BART assets.
+
+Every PNG under the asset root is re-encoded with a small search over PNG
+row filters and zlib strategies. Images with binary alpha and at most 256
+distinct RGBA values are converted to indexed colour (bit-packed when the
+palette allows it) with a tRNS chunk for transparency. Ancillary chunks are
+not written, so metadata is stripped. A candidate only replaces the original
+when it is smaller and decodes to byte-identical RGBA pixels.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+import os
+from pathlib import Path
+import struct
+import zlib
+
+try:
+    import numpy as np
+    from PIL import Image
+except Exception:  # pragma: no cover
+    print('ERROR: Pillow and numpy are required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+COLOR_TYPE_RGB = 2
+COLOR_TYPE_PALETTE = 3
+COLOR_TYPE_RGBA = 6
+
+FILTER_NONE = 0
+FILTER_SUB = 1
+FILTER_UP = 2
+FILTER_AVERAGE = 3
+FILTER_PAETH = 4
+FILTER_ADAPTIVE = -1
+FILTER_CHOICES = (FILTER_NONE, FILTER_SUB, FILTER_UP, FILTER_AVERAGE, FILTER_PAETH, FILTER_ADAPTIVE)
+
+ZLIB_STRATEGIES = (
+    zlib.Z_DEFAULT_STRATEGY,
+    zlib.Z_FILTERED,
+    zlib.Z_HUFFMAN_ONLY,
+    zlib.Z_RLE,
+)
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    """Raw (unfiltered) scanlines plus the header data needed to write a PNG."""
+
+    width: int
+    height: int
+    bit_depth: int
+    color_type: int
+    bytes_per_pixel: int
+    rows: np.ndarray
+    palette: bytes = b''
+    transparency: bytes = b''
+
+
+@dataclass(frozen=True)
+class OptimizeResult:
+    path: str
+    original_bytes: int
+    optimized_bytes: int
+    mode: str
+    replaced: bool
+    error: str | None = None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Losslessly recompress PNG assets (indexed colour, filter and zlib search).')
+    parser.add_argument('paths', nargs='*', default=['public/assets'], help='PNG files or directories to optimize.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes (default: CPU count).')
+    parser.add_argument('--dry-run', action='store_true', help='Report savings without rewriting any file.')
+    return parser.parse_args()
+
+
+def png_chunk(tag: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+
+def pack_indices(indices: np.ndarray, bit_depth: int) -> np.ndarray:
+    """Pack a (height, width) uint8 index array into PNG scanline bytes."""
+    if bit_depth == 8:
+        return indices.astype(np.uint8)
+    per_byte = 8 // bit_depth
+    height, width = indices.shape
+    padded_width = -(-width // per_byte) * per_byte
+    padded = np.zeros((height, padded_width), dtype=np.uint8)
+    padded[:, :width] = indices
+    groups = padded.reshape(height, padded_width // per_byte, per_byte)
+    shifts = np.arange(per_byte - 1, -1, -1, dtype=np.uint8) * bit_depth
+    return np.bitwise_or.reduce(groups << shifts, axis=2).astype(np.uint8)
+
+
+def palette_bit_depth(color_count: int) -> int:
+    for depth in (1, 2, 4):
+        if color_count <= 1 << depth:
+            return depth
+    return 8
+
+
+def encode_rgba(rgba: np.ndarray) -> EncodedImage:
+    """Choose the smallest lossless pixel layout for an RGBA array."""
+    height, width, _ = rgba.shape
+    alpha = rgba[:, :, 3]
+    binary_alpha = bool(np.all((alpha == 0) | (alpha == 255)))
+
+    if binary_alpha:
+        packed = rgba.reshape(-1, 4).copy().view(np.uint32).ravel()
+        colors, inverse = np.unique(packed, return_inverse=True)
+        if colors.size <= 256:
+            entries = colors.view(np.uint8).reshape(-1, 4)
+            # Transparent entries first so the tRNS chunk can stop at the last one.
+            order = np.argsort(entries[:, 3] != 0, kind='stable')
+            remap = np.empty_like(order)
+            remap[order] = np.arange(order.size)
+            entries = entries[order]
+            indices = remap[inverse].reshape(height, width).astype(np.uint8)
+            transparent = int(np.count_nonzero(entries[:, 3] == 0))
+            bit_depth = palette_bit_depth(colors.size)
+            return EncodedImage(
+                width=width,
+                height=height,
+                bit_depth=bit_depth,
+                color_type=COLOR_TYPE_PALETTE,
+                bytes_per_pixel=1,
+                rows=pack_indices(indices, bit_depth),
+                palette=entries[:, :3].tobytes(),
+                transparency=entries[:transparent, 3].tobytes(),
+            )
+
+    if bool(np.all(alpha == 255)):
+        return EncodedImage(
+            width=width,
+            height=height,
+            bit_depth=8,
+            color_type=COLOR_TYPE_RGB,
+            bytes_per_pixel=3,
+            rows=np.ascontiguousarray(rgba[:, :, :3]).reshape(height, width * 3),
+        )
+
+    return EncodedImage(
+        width=width,
+        height=height,
+        bit_depth=8,
+        color_type=COLOR_TYPE_RGBA,
+        bytes_per_pixel=4,
+        rows=np.ascontiguousarray(rgba).reshape(height, width * 4),
+    )
+
+
+def filter_rows(rows: np.ndarray, bpp: int) -> np.ndarray:
+    """Return every PNG filter applied to all rows, shape (5, height, stride)."""
+    raw = rows.astype(np.int16)
+    left = np.zeros_like(raw)
+    left[:, bpp:] = raw[:, :-bpp]
+    up = np.zeros_like(raw)
+    up[1:] = raw[:-1]
+    up_left = np.zeros_like(raw)
+    up_left[1:, bpp:] = raw[:-1, :-bpp]
+
+    estimate = left + up - up_left
+    dist_left = np.abs(estimate - left)
+    dist_up = np.abs(estimate - up)
+    dist_up_left = np.abs(estimate - up_left)
+    paeth = np.where(
+        (dist_left <= dist_up) & (dist_left <= dist_up_left),
+        left,
+        np.where(dist_up <= dist_up_left, up, up_left),
+    )
+
+    filtered = np.stack([
+        raw,
+        raw - left,
+        raw - up,
+        raw - ((left + up) >> 1),
+        raw - paeth,
+    ])
+    return (filtered & 0xFF).astype(np.uint8)
+
+
+def filtered_stream(filtered: np.ndarray, choice: int) -> bytes:
+    height = filtered.shape[1]
+    if choice == FILTER_ADAPTIVE:
+        # Minimum sum of absolute differences heuristic from the PNG spec.
+        cost = np.abs(filtered.view(np.int8).astype(np.int32)).sum(axis=2)
+        types = np.argmin(cost, axis=0)
+        body = filtered[types, np.arange(height)]
+    else:
+        types = np.full(height, choice)
+        body = filtered[choice]
+    return np.hstack([types.astype(np.uint8)[:, None], body]).tobytes()
+
+
+def compress(data: bytes, strategy: int) -> bytes:
+    compressor = zlib.compressobj(9, zlib.DEFLATED, zlib.MAX_WBITS, 9, strategy)
+    return compressor.compress(data) + compressor.flush()
+
+
+def write_png(image: EncodedImage, idat: bytes) -> bytes:
+    header = struct.pack('>IIBBBBB', image.width, image.height, image.bit_depth, image.color_type, 0, 0, 0)
+    chunks = [png_chunk(b'IHDR', header)]
+    if image.palette:
+        chunks.append(png_chunk(b'PLTE', image.palette))
+    if image.transparency:
+        chunks.append(png_chunk(b'tRNS', image.transparency))
+    chunks.append(png_chunk(b'IDAT', idat))
+    chunks.append(png_chunk(b'IEND', b''))
+    return PNG_SIGNATURE + b''.join(chunks)
+
+
+def encode_smallest(image: EncodedImage) -> bytes:
+    filtered = filter_rows(image.rows, image.bytes_per_pixel)
+    best: bytes | None = None
+    for choice in FILTER_CHOICES:
+        stream = filtered_stream(filtered, choice)
+        for strategy in ZLIB_STRATEGIES:
+            idat = compress(stream, strategy)
+            if best is None or len(idat) < len(best):
+                best = idat
+    assert best is not None
+    return write_png(image, best)
+
+
+def decode_rgba(data: bytes) -> np.ndarray:
+    with Image.open(BytesIO(data)) as img:
+        return np.array(img.convert('RGBA'))
+
+
+def optimize_png(path: Path, dry_run: bool) -> OptimizeResult:
+    original = path.read_bytes()
+    try:
+        with Image.open(BytesIO(original)) as img:
+            # Some generated art is JPEG data behind a .png name; leave it untouched.
+            if img.format != 'PNG' or img.mode not in {'1', 'L', 'LA', 'P', 'PA', 'RGB', 'RGBA'}:
+                return OptimizeResult(str(path), len(original), len(original), img.format or img.mode, False)
+            rgba = np.array(img.convert('RGBA'))
+
+        image = encode_rgba(rgba)
+        candidate = encode_smallest(image)
+        if not np.array_equal(decode_rgba(candidate), rgba):
+            raise RuntimeError('re-encoded pixels do not match the original')
+    except Exception as error:
+        return OptimizeResult(str(path), len(original), len(original), '?', False, str(error))
+
+    mode = 'P' if image.color_type == COLOR_TYPE_PALETTE else ('RGB' if image.color_type == COLOR_TYPE_RGB else 'RGBA')
+    if len(candidate) >= len(original):
+        return OptimizeResult(str(path), len(original), len(original), mode, False)
+
+    if not dry_run:
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        tmp_path.write_bytes(candidate)
+        tmp_path.replace(path)
+    return OptimizeResult(str(path), len(original), len(candidate), mode, True)
+
+
+def collect_pngs(paths: list[str]) -> list[Path]:
+    files: list[Path] = []
+    for entry in paths:
+        root = Path(entry)
+        if root.is_dir():
+            files.extend(sorted(root.rglob('*.png')))
+        elif root.suffix.lower() == '.png':
+            files.append(root)
+        else:
+            print(f'[SKIP] {entry}: not a PNG file or directory')
+    return files
+
+
+def main() -> int:
+    args = parse_args()
+    files = collect_pngs(args.paths)
+    if not files:
+        print('No PNG files found.')
+        return 0
+
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(optimize_png, files, [args.dry_run] * len(files)))
+
+    failures: list[str] = []
+    before = 0
+    after = 0
+    for result in results:
+        before += result.original_bytes
+        after += result.optimized_bytes
+        if result.error:
+            failures.append(f'{result.path}: {result.error}')
+            continue
+        if result.replaced:
+            saved = result.original_bytes - result.optimized_bytes
+            label = 'WOULD-OPTIMIZE' if args.dry_run else 'OPTIMIZED'
+            print(
+                f'[{label}] {result.path}: {result.original_bytes} -> {result.optimized_bytes} bytes '
+                f'(-{saved}, {result.mode})'
+            )
+
+    if failures:
+        print('PNG optimization failed:')
+        for entry in failures:
+            print(f'- {entry}')
+        return 1
+
+    saved = before - after
+    percent = (saved / before * 100.0) if before else 0.0
+    print(f'PNG optimization complete: {len(files)} file(s), {before} -> {after} bytes, saved {saved} ({percent:.1f}%).')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
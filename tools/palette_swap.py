@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Palette-swap extraction for sprite sheets that differ only in colour.
+
+A variant sheet (for example `bart_body_big_fire.png`) is a palette swap of a
+base sheet when every base colour maps to exactly one variant colour. For such
+pairs this tool writes one indexed base sheet plus a JSON table holding one
+palette per variant, indexed like the base sheet. `--derive-dir` runs the
+reverse step and rebuilds every variant PNG from the tables.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import json
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except Exception:  # pragma: no cover
+    print('ERROR: Pillow and numpy are required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+from optimize_pngs import COLOR_TYPE_PALETTE, EncodedImage, encode_smallest, pack_indices, palette_bit_depth
+
+
+DEFAULT_SPRITES_DIR = 'public/assets/sprites'
+DEFAULT_OUT_DIR = 'public/assets/sprites/palette_swaps'
+DEFAULT_VARIANT_SUFFIXES = ['fire']
+
+
+@dataclass(frozen=True)
+class RemapResult:
+    base: str
+    variant: str
+    colors: int
+    conflicts: int
+    base_palette: np.ndarray | None = None
+    variant_palette: np.ndarray | None = None
+    indices: np.ndarray | None = None
+
+
+def parse_pair(value: str) -> tuple[str, str]:
+    first, sep, second = value.partition(':')
+    if not sep or not first or not second:
+        raise argparse.ArgumentTypeError(f'expected BASE:VARIANT, got {value!r}')
+    return first, second
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Detect palette-swapped sprite sheets and emit indexed base sheets.')
+    parser.add_argument('--sprites-dir', default=DEFAULT_SPRITES_DIR, help='Directory containing sprite sheet PNGs.')
+    parser.add_argument('--out-dir', default=DEFAULT_OUT_DIR, help='Directory for indexed sheets and palette tables.')
+    parser.add_argument(
+        '--pair',
+        action='append',
+        default=[],
+        type=parse_pair,
+        metavar='BASE:VARIANT',
+        help='Explicit base:variant sheet stems (repeatable). Default: discover <stem>_<suffix> pairs.'
+    )
+    parser.add_argument(
+        '--suffixes',
+        default=','.join(DEFAULT_VARIANT_SUFFIXES),
+        help='Comma-separated variant suffixes used for pair discovery.'
+    )
+    parser.add_argument('--derive-dir', help='Rebuild variant PNGs from existing palette tables into this directory.')
+    parser.add_argument('--dry-run', action='store_true', help='Report detected remaps without writing files.')
+    return parser.parse_args()
+
+
+def load_rgba(path: Path) -> np.ndarray:
+    with Image.open(path) as img:
+        return np.array(img.convert('RGBA'))
+
+
+def pack_rgba(rgba: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(rgba).reshape(-1, 4).view(np.uint32).ravel()
+
+
+def unpack_rgba(packed: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(packed, dtype=np.uint32).view(np.uint8).reshape(-1, 4)
+
+
+def detect_remap(base_name: str, base: np.ndarray, variant_name: str, variant: np.ndarray) -> RemapResult:
+    """Check whether `variant` is a per-colour remap of `base`."""
+    if base.shape != variant.shape:
+        return RemapResult(base_name, variant_name, 0, -1)
+
+    base_colors, indices = np.unique(pack_rgba(base), return_inverse=True)
+    pairs = (indices.astype(np.uint64) << np.uint64(32)) | pack_rgba(variant).astype(np.uint64)
+    unique_pairs = np.unique(pairs)
+    conflicts = int(unique_pairs.size - base_colors.size)
+    if conflicts or base_colors.size > 256:
+        return RemapResult(base_name, variant_name, int(base_colors.size), conflicts)
+
+    # unique_pairs is sorted by base index, so it lists one variant colour per base colour in order.
+    variant_colors = (unique_pairs & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+    return RemapResult(
+        base=base_name,
+        variant=variant_name,
+        colors=int(base_colors.size),
+        conflicts=0,
+        base_palette=unpack_rgba(base_colors),
+        variant_palette=unpack_rgba(variant_colors),
+        indices=indices.reshape(base.shape[:2]).astype(np.uint8),
+    )
+
+
+def discover_pairs(sprites_dir: Path, suffixes: list[str]) -> list[tuple[str, str]]:
+    pairs: list[tuple[str, str]] = []
+    for path in sorted(sprites_dir.glob('*.png')):
+        for suffix in suffixes:
+            marker = f'_{suffix}'
+            if path.stem.endswith(marker) and (sprites_dir / f'{path.stem[:-len(marker)]}.png').exists():
+                pairs.append((path.stem[:-len(marker)], path.stem))
+    return pairs
+
+
+def hex_colors(palette: np.ndarray) -> list[str]:
+    return ['#{:02X}{:02X}{:02X}{:02X}'.format(*(int(c) for c in entry)) for entry in palette]
+
+
+def palette_from_hex(entries: list[str]) -> np.ndarray:
+    return np.array([[int(entry[i:i + 2], 16) for i in (1, 3, 5, 7)] for entry in entries], dtype=np.uint8)
+
+
+def encode_indexed(indices: np.ndarray, palette: np.ndarray) -> bytes:
+    bit_depth = palette_bit_depth(len(palette))
+    alpha = palette[:, 3]
+    opaque_tail = np.flatnonzero(alpha != 255)
+    transparency = alpha[: int(opaque_tail[-1]) + 1].tobytes() if opaque_tail.size else b''
+    image = EncodedImage(
+        width=indices.shape[1],
+        height=indices.shape[0],
+        bit_depth=bit_depth,
+        color_type=COLOR_TYPE_PALETTE,
+        bytes_per_pixel=1,
+        rows=pack_indices(indices, bit_depth),
+        palette=palette[:, :3].tobytes(),
+        transparency=transparency,
+    )
+    return encode_smallest(image)
+
+
+def write_tables(results: list[RemapResult], sprites_dir: Path, out_dir: Path) -> int:
+    by_base: dict[str, list[RemapResult]] = {}
+    for result in results:
+        by_base.setdefault(result.base, []).append(result)
+
+    saved = 0
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for base, variants in by_base.items():
+        first = variants[0]
+        assert first.indices is not None and first.base_palette is not None
+        sheet_name = f'{base}.indexed.png'
+        sheet_bytes = encode_indexed(first.indices, first.base_palette)
+        (out_dir / sheet_name).write_bytes(sheet_bytes)
+
+        palettes = {base: hex_colors(first.base_palette)}
+        for result in variants:
+            assert result.variant_palette is not None
+            palettes[result.variant] = hex_colors(result.variant_palette)
+        table = {
+            'base': base,
+            'sheet': sheet_name,
+            'width': int(first.indices.shape[1]),
+            'height': int(first.indices.shape[0]),
+            'palettes': palettes,
+        }
+        table_path = out_dir / f'{base}.palettes.json'
+        table_path.write_text(json.dumps(table, indent=2) + '\n', encoding='utf-8')
+
+        shipped = sum((sprites_dir / f'{name}.png').stat().st_size for name in palettes)
+        emitted = len(sheet_bytes) + table_path.stat().st_size
+        saved += shipped - emitted
+        print(f'[PALETTE] {base}: {len(palettes)} palette(s), {shipped} -> {emitted} bytes')
+    return saved
+
+
+def derive_variants(table_dir: Path, derive_dir: Path) -> int:
+    derive_dir.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for table_path in sorted(table_dir.glob('*.palettes.json')):
+        table = json.loads(table_path.read_text(encoding='utf-8'))
+        with Image.open(table_dir / table['sheet']) as sheet:
+            indices = np.array(sheet)
+        for name, entries in table['palettes'].items():
+            rgba = palette_from_hex(entries)[indices]
+            Image.fromarray(rgba, 'RGBA').save(derive_dir / f'{name}.png')
+            print(f'[DERIVED] {name}.png from {table["sheet"]}')
+            count += 1
+    return count
+
+
+def main() -> int:
+    args = parse_args()
+    sprites_dir = Path(args.sprites_dir)
+    out_dir = Path(args.out_dir)
+
+    if args.derive_dir:
+        count = derive_variants(out_dir, Path(args.derive_dir))
+        print(f'Derived {count} sheet(s).')
+        return 0
+
+    if args.pair:
+        pairs = args.pair
+    else:
+        suffixes = [entry.strip() for entry in args.suffixes.split(',') if entry.strip()]
+        pairs = discover_pairs(sprites_dir, suffixes)
+    if not pairs:
+        print('No candidate sheet pairs found.')
+        return 0
+
+    remaps: list[RemapResult] = []
+    for base_name, variant_name in pairs:
+        base = load_rgba(sprites_dir / f'{base_name}.png')
+        variant = load_rgba(sprites_dir / f'{variant_name}.png')
+        result = detect_remap(base_name, base, variant_name, variant)
+        if result.conflicts < 0:
+            print(f'[SKIP] {variant_name}: size {variant.shape[1]}x{variant.shape[0]} differs from {base_name}')
+        elif result.indices is None:
+            reason = f'{result.conflicts} conflicting colour mapping(s)' if result.conflicts else f'{result.colors} colours'
+            print(f'[SKIP] {variant_name}: not a palette swap of {base_name} ({reason})')
+        else:
+            print(f'[REMAP] {variant_name} = {base_name} with {result.colors} remapped colour(s)')
+            remaps.append(result)
+
+    if args.dry_run or not remaps:
+        print(f'{len(remaps)} palette swap(s) detected.')
+        return 0
+
+    saved = write_tables(remaps, sprites_dir, out_dir)
+    print(f'{len(remaps)} palette swap(s) written to {out_dir}, saving {saved} bytes.')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
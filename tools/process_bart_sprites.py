@@ -1,195 +1,168 @@
+#!/usr/bin/env python3
+"""Compose Bart body sprite sheets from a generated source grid.
 
-import sys
-from PIL import Image
-import os
-
-def process_sprites():
-    # Load the generated sprite sheet
-    # Assuming the user provided image name is consistent or passed as arg
-    # For now, I'll use the one I generated: bart_spritesheet_1771043194720.png
-    # But I don't know the exact path if the tool doesn't tell me.
-    # Ah, I saw the output: /Users/damian/.gemini/antigravity/brain/759ccdf6-979e-4751-a5e4-7fd4b8efe2d6/bart_spritesheet_1771043194720.png
-    
-    # Let's find the latest png in the artifacts dir
-    artifacts_dir = "/Users/damian/.gemini/antigravity/brain/759ccdf6-979e-4751-a5e4-7fd4b8efe2d6"
-    files = [f for f in os.listdir(artifacts_dir) if f.startswith("bart_spritesheet") and f.endswith(".png")]
-    if not files:
-        print("No generated sprite sheet found.")
-        return
-    
-    latest_file = max([os.path.join(artifacts_dir, f) for f in files], key=os.path.getctime)
-    print(f"Processing {latest_file}")
-    
-    img = Image.open(latest_file)
-    
-    # The generated image is a grid. I asked for:
-    # 1. Idle - 4 frames
-    # 2. Run - 6 frames
-    # 3. Jump - 1 frame
-    # 4. Fall - 1 frame
-    # 5. Skid - 1 frame
-    # Total ~13 frames.
-    # The image likely put them in a grid. I need to slice them.
-    # Since I don't see the image, I have to guess or assume a simple layout.
-    # Usually it's a grid. Let's assume 4 columns.
-    
-    # Actually, to be safe, I should just take 14 frames from the grid reading left-to-right, top-to-bottom.
-    
-    # Target formats:
-    # bart_body_small.png: 16x24 frames. 14 frames total (0-13).
-    # bart_body_big.png: 16x32 frames. 14 frames total (0-13).
-    
-    # Mapping:
-    # 0: Idle (Frame 0 of gen)
-    # 1: Walk (Frame 4 of gen - start of run)
-    # 2: Walk (Frame 5 of gen)
-    # 3: Walk (Frame 6 of gen)
-    # 4: Run (Frame 4 of gen)
-    # 5: Run (Frame 5 of gen)
-    # 6: Run (Frame 6 of gen)
-    # 7: Skid (Frame 12 of gen - last one?)
-    # 8: Jump (Frame 10)
-    # 9: Fall (Frame 11)
-    # 10: Land (Frame 0 reused)
-    # 11: Hurt (Frame 11 reused)
-    # 12: Win (Frame 0 reused)
-    # 13: Dead (Frame 11 reused)
-    
-    # Wait, the prompt asked for:
-    # 1. Idle (4)
-    # 2. Run (6)
-    # 3. Jump (1)
-    # 4. Fall (1)
-    # 5. Skid (1)
-    # Total 13 frames.
-    
-    frames = []
-    
-    # Scan the image to find sprite bounding boxes or just grid slice?
-    # Let's assume grid slice based on image size.
-    # If image is WxH and I expect roughly N sprites ...
-    
-    # Let's define the grid. 
-    # Assumed row height and col width based on total size.
-    # Actually, I'll just use a smart slicer or assume uniform grid.
-    # Let's assume standard cell size of 48x48 (since I asked for 32x32 or 48x48).
-    
-    cell_w = 48
-    cell_h = 48
-    
-    cols = img.width // cell_w
-    rows = img.height // cell_h
-    
-    extracted = []
-    for r in range(rows):
-        for c in range(cols):
-            x = c * cell_w
-            y = r * cell_h
-            frame = img.crop((x, y, x+cell_w, y+cell_h))
-            
-            # Check if frame is empty
-            if frame.getbbox():
-                extracted.append(frame)
-                
-    print(f"Extracted {len(extracted)} frames")
-    
-    if len(extracted) < 13:
-        print("Warning: Not enough frames extracted. Reusing last frame.")
-        while len(extracted) < 13:
-            extracted.append(extracted[-1])
-            
-    # Map to Game Frames (0-13)
-    # Game expects:
-    # 0: Idle
-    # 1-3: Walk
-    # 4-6: Run
-    # 7: Skid
-    # 8: Jump
-    # 9: Fall
-    # 10: Land
-    # 11: Hurt
-    # 12: Win
-    # 13: Dead
-    
-    # Gen frames (0-12 idx):
-    # 0-3: Idle
-    # 4-9: Run
-    # 10: Jump
-    # 11: Fall
-    # 12: Skid
-    
-    final_frames = []
-    
-    # 0: Idle
-    final_frames.append(extracted[0])
-    
-    # 1-3: Walk (Use Run 0, 1, 2)
-    final_frames.append(extracted[4])
-    final_frames.append(extracted[5])
-    final_frames.append(extracted[6])
-    
-    # 4-6: Run (Use Run 3, 4, 5)
-    final_frames.append(extracted[7])
-    final_frames.append(extracted[8])
-    final_frames.append(extracted[9])
-    
-    # 7: Skid
-    final_frames.append(extracted[12] if len(extracted) > 12 else extracted[-1])
-    
-    # 8: Jump
-    final_frames.append(extracted[10] if len(extracted) > 10 else extracted[-1])
-    
-    # 9: Fall
-    final_frames.append(extracted[11] if len(extracted) > 11 else extracted[-1])
-    
-    # 10: Land (Use Idle 0)
-    final_frames.append(extracted[0])
-    
-    # 11: Hurt (Use Fall)
-    final_frames.append(extracted[11] if len(extracted) > 11 else extracted[-1])
-    
-    # 12: Win (Use Idle 1 - maybe hands up?)
-    final_frames.append(extracted[1]) 
-    
-    # 13: Dead (Use Skid or Fall rotated?)
-    final_frames.append(extracted[11] if len(extracted) > 11 else extracted[-1])
-    
-    # Create Sheets
-    # Small: 16x24
-    # Big: 16x32
-    
-    # NOTE: Resizing 48x48 down to 16x24/32 might lose detail. 
-    # But for now, we must match the engine or update the engine.
-    # Plan: Update engine to support 32x32 frames if possible, BUT simpler to just resize for now to verify pipeline.
-    # User wanted "Premium SNES", resizing to 16px wide is very NES.
-    # I should try to keep them 32px wide if possible.
-    # If I change frameWidth in assetManifest, Phaser will handle it.
-    # But physics body (10x24 approx) might look small compared to sprite.
-    
-    # Let's create 'bart_body_big.png' as 32x48 per frame (Premium size)
-    # And 'bart_body_small.png' as 32x32 per frame.
-    # I will verify this by updating assetManifest.
-    
-    def create_sheet(frames, w, h):
-        sheet = Image.new("RGBA", (w * len(frames), h))
-        for i, f in enumerate(frames):
-            # Maintain aspect ratio?
-            # Scale to fit
-            # f.thumbnail((w, h), Image.NEAREST) # Maintains aspect
-            # Force resize
-            resized = f.resize((w, h), Image.NEAREST)
-            sheet.paste(resized, (i * w, 0))
-        return sheet
-
-    # Generate Big Sheet (32x48)
-    big_sheet = create_sheet(final_frames, 32, 48)
-    big_sheet.save("public/assets/sprites/bart_body_big.png")
-    print("Saved public/assets/sprites/bart_body_big.png")
-    
-    # Generate Small Sheet (32x32)
-    small_sheet = create_sheet(final_frames, 32, 32)
-    small_sheet.save("public/assets/sprites/bart_body_small.png")
-    print("Saved public/assets/sprites/bart_body_small.png")
-    
-if __name__ == "__main__":
-    process_sprites()
+The cell size, the generated-to-game frame mapping and the output sheets are
+declared in `tools/imagegen/bart_frame_spec.json`, which is shared with
+`tools/imagegen/order_frames.py`. The source is decoded once into an array of
+cells. Every output sheet is built from that array with nearest-neighbour
+index lookups.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import re
+
+try:
+    import numpy as np
+    from PIL import Image
+except Exception:  # pragma: no cover
+    print('ERROR: Pillow and numpy are required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+
+SPEC_PATH = 'tools/imagegen/bart_frame_spec.json'
+PLAYER_ANIMS_PATH = 'src/anim/playerAnims.ts'
+
+SINGLE_FRAME_RE = re.compile(r"\$\{prefix\}(\w+)`,\s*frames: \[\{ key, frame: (\d+) \}\]")
+RANGE_FRAME_RE = re.compile(r"\$\{prefix\}(\w+)`,\s*frames: scene\.anims\.generateFrameNumbers\(key, \{ start: (\d+), end: (\d+) \}\)")
+TUPLE_FRAME_RE = re.compile(r"\['(\w+)', (\d+)\]")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Compose bart_body_* sheets from a generated sprite grid.')
+    parser.add_argument('--spec', default=SPEC_PATH, help='Frame-mapping spec shared with order_frames.py.')
+    parser.add_argument('--source', help='Generated sheet PNG, or a directory searched with the spec glob (latest wins).')
+    parser.add_argument('--check', action='store_true', help='Only validate the spec against playerAnims.ts.')
+    return parser.parse_args()
+
+
+def load_spec(path: Path) -> dict:
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def expected_anim_frames(anims_source: str) -> dict[int, str]:
+    """Map each game frame index referenced by playerAnims.ts to its animation name."""
+    frames: dict[int, str] = {}
+    for name, frame in SINGLE_FRAME_RE.findall(anims_source):
+        frames[int(frame)] = name
+    for name, start, end in RANGE_FRAME_RE.findall(anims_source):
+        for frame in range(int(start), int(end) + 1):
+            frames[frame] = name
+    for name, frame in TUPLE_FRAME_RE.findall(anims_source):
+        frames[int(frame)] = name
+    return frames
+
+
+def validate_spec(spec: dict, anims_source: str) -> list[str]:
+    errors: list[str] = []
+    expected = expected_anim_frames(anims_source)
+    frames = spec['frames']
+    generated_count = len(spec['source']['generatedFrames'])
+
+    if not expected:
+        return [f'no frame references found in {PLAYER_ANIMS_PATH}']
+    if len(frames) != max(expected) + 1:
+        errors.append(f'spec maps {len(frames)} frame(s); {PLAYER_ANIMS_PATH} expects {max(expected) + 1}')
+    for index, frame in enumerate(frames):
+        anim = expected.get(index)
+        if anim is None:
+            errors.append(f'frame {index} ({frame["anim"]}) is not used by {PLAYER_ANIMS_PATH}')
+        elif anim != frame['anim']:
+            errors.append(f'frame {index} is "{frame["anim"]}" in the spec but "{anim}" in {PLAYER_ANIMS_PATH}')
+        if not 0 <= frame['generated'] < generated_count:
+            errors.append(f'frame {index} references generated frame {frame["generated"]} of {generated_count}')
+    return errors
+
+
+def resolve_source(spec: dict, source_arg: str | None, repo: Path) -> Path | None:
+    source = Path(source_arg) if source_arg else repo / spec['source']['dir']
+    if source.is_file():
+        return source
+    if not source.is_dir():
+        return None
+    candidates = list(source.glob(spec['source']['glob']))
+    if not candidates:
+        return None
+    return max(candidates, key=lambda path: path.stat().st_ctime)
+
+
+def extract_cells(rgba: np.ndarray, cell_w: int, cell_h: int) -> np.ndarray:
+    """Split a decoded sheet into non-empty cells, row-major, shape (n, cell_h, cell_w, 4)."""
+    rows = rgba.shape[0] // cell_h
+    cols = rgba.shape[1] // cell_w
+    grid = rgba[: rows * cell_h, : cols * cell_w].reshape(rows, cell_h, cols, cell_w, 4)
+    cells = grid.swapaxes(1, 2).reshape(rows * cols, cell_h, cell_w, 4)
+    occupied = cells[..., 3].reshape(len(cells), -1).any(axis=1)
+    return cells[occupied]
+
+
+def nearest_indices(src: int, dst: int) -> np.ndarray:
+    # Pillow's NEAREST resize steps the sample position incrementally; cumsum reproduces
+    # the same float accumulation so sheets stay byte-identical to Image.resize output.
+    scale = src / dst
+    steps = np.full(dst, scale)
+    steps[0] = 0.5 * scale
+    return np.minimum(np.cumsum(steps).astype(np.intp), src - 1)
+
+
+def compose_sheet(frames: np.ndarray, frame_w: int, frame_h: int) -> np.ndarray:
+    count, src_h, src_w, channels = frames.shape
+    resized = frames[:, nearest_indices(src_h, frame_h)][:, :, nearest_indices(src_w, frame_w)]
+    return resized.transpose(1, 0, 2, 3).reshape(frame_h, count * frame_w, channels)
+
+
+def process_sprites(spec: dict, source: Path, repo: Path) -> None:
+    print(f'Processing {source}')
+    with Image.open(source) as img:
+        rgba = np.array(img.convert('RGBA'))
+
+    cell_w = spec['source']['cellWidth']
+    cell_h = spec['source']['cellHeight']
+    generated_count = len(spec['source']['generatedFrames'])
+
+    cells = extract_cells(rgba, cell_w, cell_h)
+    print(f'Extracted {len(cells)} frames')
+    if len(cells) == 0:
+        raise RuntimeError(f'no non-empty {cell_w}x{cell_h} cells in {source.name}')
+    if len(cells) < generated_count:
+        print('Warning: Not enough frames extracted. Reusing last frame.')
+        padding = np.repeat(cells[-1:], generated_count - len(cells), axis=0)
+        cells = np.concatenate([cells, padding])
+
+    frames = cells[[frame['generated'] for frame in spec['frames']]]
+    for output in spec['outputs']:
+        sheet = compose_sheet(frames, output['frameWidth'], output['frameHeight'])
+        out_path = repo / output['path']
+        Image.fromarray(sheet, 'RGBA').save(out_path)
+        print(f'Saved {output["path"]}')
+
+
+def main() -> int:
+    args = parse_args()
+    repo = Path(__file__).resolve().parents[1]
+    spec = load_spec(repo / args.spec if not Path(args.spec).is_absolute() else Path(args.spec))
+
+    errors = validate_spec(spec, (repo / PLAYER_ANIMS_PATH).read_text(encoding='utf-8'))
+    if errors:
+        print('Bart frame spec validation failed:')
+        for e in errors:
+            print(f'- {e}')
+        return 1
+    if args.check:
+        print(f'Bart frame spec matches {PLAYER_ANIMS_PATH} ({len(spec["frames"])} frames).')
+        return 0
+
+    source = resolve_source(spec, args.source, repo)
+    if source is None:
+        print('No generated sprite sheet found.')
+        return 1
+
+    process_sprites(spec, source, repo)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
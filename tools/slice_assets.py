@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Slice generated world art into runtime tiles, sprites and backgrounds.
+
+Each world has a manifest in `tools/imagegen/slice_manifests/`. A manifest
+names its source sheets, each with a grid, and lists the outputs. An output
+gives a box in grid units, a target size, a resampling filter and an output
+path. Each source is decoded once per world, and worlds are processed in
+parallel. Every written file is checked against its target size and against
+`REQUIRED_PNG_DIMENSIONS` from `asset_validate.py`.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import math
+import os
+from pathlib import Path
+
+try:
+    from PIL import Image
+except Exception:  # pragma: no cover
+    print('ERROR: Pillow is required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+from asset_validate import REQUIRED_PNG_DIMENSIONS
+
+
+MANIFEST_DIR = 'tools/imagegen/slice_manifests'
+
+RESAMPLE_FILTERS = {
+    'nearest': Image.NEAREST,
+    'bilinear': Image.BILINEAR,
+    'bicubic': Image.BICUBIC,
+    'lanczos': Image.LANCZOS,
+    'box': Image.BOX,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Slice generated world art using per-world manifests.')
+    parser.add_argument('--manifest-dir', default=MANIFEST_DIR, help='Directory containing world*.json manifests.')
+    parser.add_argument('--worlds', help='Comma-separated world numbers to slice (default: all manifests).')
+    parser.add_argument('--source-dir', help='Override the sourceDir of every manifest.')
+    parser.add_argument('--out-root', default='.', help='Root directory that manifest output paths are relative to.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes (default: CPU count).')
+    parser.add_argument('--dry-run', action='store_true', help='Validate manifests and sources without writing files.')
+    return parser.parse_args()
+
+
+def load_manifests(manifest_dir: Path, worlds: set[int] | None) -> list[dict]:
+    manifests = []
+    for path in sorted(manifest_dir.glob('world*.json')):
+        manifest = json.loads(path.read_text(encoding='utf-8'))
+        manifest['_path'] = str(path)
+        if worlds is None or manifest['world'] in worlds:
+            manifests.append(manifest)
+    return manifests
+
+
+def validate_manifest(manifest: dict) -> list[str]:
+    errors: list[str] = []
+    name = manifest['_path']
+    sources = manifest.get('sources', {})
+    seen: set[str] = set()
+    for index, output in enumerate(manifest.get('outputs', [])):
+        label = f'{name} output {index} ({output.get("out")})'
+        if output.get('out') in seen:
+            errors.append(f'{label}: duplicate output path')
+        seen.add(output.get('out'))
+        if output.get('source') is not None:
+            if output['source'] not in sources:
+                errors.append(f'{label}: unknown source "{output["source"]}"')
+            if output.get('filter', 'nearest') not in RESAMPLE_FILTERS:
+                errors.append(f'{label}: unknown filter "{output.get("filter")}"')
+            if len(output.get('box', [])) != 4:
+                errors.append(f'{label}: box must be [col0, row0, col1, row1]')
+        size = output.get('size')
+        if not size or len(size) != 2 or min(size) <= 0:
+            errors.append(f'{label}: size must be [width, height]')
+            continue
+        required = REQUIRED_PNG_DIMENSIONS.get(output['out'])
+        if required and tuple(size) != required:
+            errors.append(f'{label}: target size {tuple(size)} conflicts with REQUIRED_PNG_DIMENSIONS {required}')
+    return errors
+
+
+def pixel_box(output: dict, grid: list[int], image_size: tuple[int, int]) -> tuple[int, int, int, int]:
+    """Convert a grid-unit box into a pixel crop box, applying `square` and `inset`."""
+    width, height = image_size
+    cols, rows = grid
+    col0, row0, col1, row1 = output['box']
+    x0 = math.floor(col0 * width / cols)
+    y0 = math.floor(row0 * height / rows)
+    x1 = math.floor(col1 * width / cols)
+    y1 = math.floor(row1 * height / rows)
+    if output.get('square'):
+        # Generated sheets often carry captions under each panel; keep only the square top.
+        y1 = y0 + (x1 - x0)
+    inset = int((x1 - x0) * output.get('inset', 0.0))
+    return (x0 + inset, y0 + inset, x1 - inset, y1 - inset)
+
+
+def slice_world(manifest: dict, source_dir_override: str | None, out_root: str, dry_run: bool) -> list[str]:
+    """Slice one world. Returns a list of log lines; errors are prefixed with `FAIL`."""
+    source_dir = Path(source_dir_override or manifest['sourceDir'])
+    root = Path(out_root)
+    lines: list[str] = []
+
+    decoded: dict[str, Image.Image] = {}
+    for key, source in manifest['sources'].items():
+        path = source_dir / source['file']
+        if not path.exists():
+            lines.append(f'FAIL world {manifest["world"]}: missing source {path}')
+            continue
+        with Image.open(path) as img:
+            decoded[key] = img.convert('RGBA')
+    if any(line.startswith('FAIL') for line in lines):
+        return lines
+
+    for output in manifest['outputs']:
+        size = tuple(output['size'])
+        if output.get('source') is None:
+            result = Image.new('RGBA', size, (0, 0, 0, 0))
+        else:
+            source = decoded[output['source']]
+            box = pixel_box(output, manifest['sources'][output['source']]['grid'], source.size)
+            result = source.crop(box).resize(size, RESAMPLE_FILTERS[output.get('filter', 'nearest')])
+
+        required = REQUIRED_PNG_DIMENSIONS.get(output['out'])
+        if result.size != size or (required and result.size != required):
+            lines.append(f'FAIL {output["out"]}: produced {result.size}, expected {required or size}')
+            continue
+        if not dry_run:
+            out_path = root / output['out']
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            result.save(out_path)
+        lines.append(f'[SLICED] {output["out"]} {size[0]}x{size[1]}')
+    return lines
+
+
+def main() -> int:
+    args = parse_args()
+    worlds = {int(entry) for entry in args.worlds.split(',') if entry.strip()} if args.worlds else None
+    manifests = load_manifests(Path(args.manifest_dir), worlds)
+    if not manifests:
+        print('No slice manifests found.')
+        return 1
+
+    errors = [error for manifest in manifests for error in validate_manifest(manifest)]
+    if errors:
+        print('Slice manifest validation failed:')
+        for e in errors:
+            print(f'- {e}')
+        return 1
+
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = [
+            pool.submit(slice_world, manifest, args.source_dir, args.out_root, args.dry_run)
+            for manifest in manifests
+        ]
+        results = [future.result() for future in futures]
+
+    failures = 0
+    for manifest, lines in zip(manifests, results):
+        print(f'World {manifest["world"]} ({manifest.get("name", "")}):')
+        for line in lines:
+            print(f'  {line}')
+            failures += line.startswith('FAIL')
+
+    if failures:
+        print(f'{failures} slice(s) failed.')
+        return 1
+
+    print(f'Sliced {len(manifests)} world(s).')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Precompute greedy-meshed collision rectangles for Tiled JSON maps.
+
+Each collision tile layer is read into a (height, width) NumPy array of
+gids, from either a plain `data` array or Tiled's base64 encoding. Any
+non-zero gid counts as solid. Horizontal runs of solid tiles are found for
+every row at once using `np.diff`. A run is then extended down while the
+next row has a run with exactly the same span. Each run is emitted once as a
+rectangle, so a flat floor of hundreds of tiles becomes a single collider.
+
+Rectangles are written in pixels to a `<map>.colliders.json` sidecar next to
+the map. The map file itself stays unchanged. `--check` exits non-zero when a
+sidecar is missing or out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+from pathlib import Path
+import zlib
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    print('ERROR: numpy is required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+
+# Tiled stores flip/rotation flags in the top bits of each gid.
+GID_MASK = 0x1FFFFFFF
+SIDECAR_SUFFIX = '.colliders.json'
+COLLIDERS_VERSION = 1
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Merge solid Tiled tiles into collider rectangles.')
+    parser.add_argument('maps', nargs='*', help='Tiled JSON maps (default: public/assets/maps/*.json).')
+    parser.add_argument('--layers', default='ground', help='Comma-separated collision layer names.')
+    parser.add_argument('--check', action='store_true', help='Fail if a sidecar is missing or stale instead of writing.')
+    return parser.parse_args()
+
+
+def layer_gids(layer: dict) -> np.ndarray:
+    """Raw (height, width) uint32 gids of a tile layer, flip flags included."""
+    data = layer.get('data')
+    if layer.get('encoding') == 'base64':
+        raw = base64.b64decode(data)
+        compression = layer.get('compression') or ''
+        if compression in ('zlib', 'gzip'):
+            # wbits=47 auto-detects the zlib or gzip header.
+            raw = zlib.decompress(raw, wbits=47)
+        elif compression:
+            raise ValueError(f'layer {layer.get("name")!r} uses unsupported compression {compression!r}')
+        flat = np.frombuffer(raw, dtype='<u4')
+    elif isinstance(data, list):
+        flat = np.asarray(data, dtype=np.uint32)
+    else:
+        raise ValueError(f'layer {layer.get("name")!r} has no readable data')
+    return flat.reshape(layer['height'], layer['width'])
+
+
+def tile_layers(map_data: dict) -> dict[str, np.ndarray]:
+    """Gid grids (flip flags cleared) for every finite tile layer, keyed by layer name."""
+    if map_data.get('infinite'):
+        raise ValueError('infinite (chunked) maps are not supported')
+    return {
+        layer['name']: layer_gids(layer) & GID_MASK
+        for layer in map_data.get('layers', [])
+        if layer.get('type') == 'tilelayer'
+    }
+
+
+def greedy_mesh(solid: np.ndarray) -> np.ndarray:
+    """Rectangles (x, y, w, h) in tiles covering `solid` exactly, without overlap."""
+    height, width = solid.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = solid
+    edges = np.diff(padded, axis=1)
+    start_rows, start_cols = np.nonzero(edges == 1)
+    _, end_cols = np.nonzero(edges == -1)
+
+    rects: list[tuple[int, int, int, int]] = []
+    open_rects: dict[tuple[int, int], int] = {}
+    row_breaks = np.searchsorted(start_rows, np.arange(height + 1))
+    for y in range(height):
+        span = slice(row_breaks[y], row_breaks[y + 1])
+        runs = set(zip(start_cols[span].tolist(), end_cols[span].tolist()))
+        for key in list(open_rects):
+            if key not in runs:
+                top = open_rects.pop(key)
+                rects.append((key[0], top, key[1] - key[0], y - top))
+        for key in runs:
+            open_rects.setdefault(key, y)
+    for (x0, x1), top in open_rects.items():
+        rects.append((x0, top, x1 - x0, height - top))
+    rects.sort(key=lambda rect: (rect[1], rect[0]))
+    return np.asarray(rects, dtype=np.int32).reshape(-1, 4)
+
+
+def build_colliders(map_path: Path, layer_names: list[str]) -> dict:
+    map_data = json.loads(map_path.read_text(encoding='utf-8'))
+    layers = tile_layers(map_data)
+    tile_w = int(map_data['tilewidth'])
+    tile_h = int(map_data['tileheight'])
+    scale = np.array([tile_w, tile_h, tile_w, tile_h], dtype=np.int32)
+    result = {'version': COLLIDERS_VERSION, 'map': map_path.name, 'tileWidth': tile_w, 'tileHeight': tile_h, 'layers': {}}
+    for name in layer_names:
+        if name not in layers:
+            raise ValueError(f'no tile layer named {name!r}')
+        solid = layers[name] != 0
+        rects = greedy_mesh(solid)
+        result['layers'][name] = {'tiles': int(solid.sum()), 'rects': (rects * scale).tolist()}
+    return result
+
+
+def render_sidecar(colliders: dict) -> str:
+    # One rectangle per line keeps diffs of regenerated sidecars readable.
+    lines = ['{']
+    header = {key: value for key, value in colliders.items() if key != 'layers'}
+    for key, value in header.items():
+        lines.append(f'  {json.dumps(key)}: {json.dumps(value)},')
+    lines.append('  "layers": {')
+    layer_items = list(colliders['layers'].items())
+    for index, (name, layer) in enumerate(layer_items):
+        rects = ',\n'.join(f'        {json.dumps(rect)}' for rect in layer['rects'])
+        lines.append(f'    {json.dumps(name)}: {{')
+        lines.append(f'      "tiles": {layer["tiles"]},')
+        lines.append(f'      "rects": [\n{rects}\n      ]' if rects else '      "rects": []')
+        lines.append('    }' + (',' if index < len(layer_items) - 1 else ''))
+    lines.append('  }')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def sidecar_path(map_path: Path) -> Path:
+    return map_path.with_name(map_path.stem + SIDECAR_SUFFIX)
+
+
+def main() -> int:
+    args = parse_args()
+    root = Path(__file__).resolve().parents[1]
+    layer_names = [name.strip() for name in args.layers.split(',') if name.strip()]
+    if args.maps:
+        map_paths = [Path(path) for path in args.maps]
+    else:
+        map_paths = sorted(
+            path for path in (root / 'public/assets/maps').glob('*.json') if not path.name.endswith(SIDECAR_SUFFIX)
+        )
+    if not map_paths:
+        print('No Tiled maps found.')
+        return 1
+
+    failures = []
+    for map_path in map_paths:
+        try:
+            colliders = build_colliders(map_path, layer_names)
+        except (OSError, ValueError, KeyError) as error:
+            failures.append(f'{map_path}: {error}')
+            continue
+        out_path = sidecar_path(map_path)
+        text = render_sidecar(colliders)
+        tiles = sum(layer['tiles'] for layer in colliders['layers'].values())
+        rects = sum(len(layer['rects']) for layer in colliders['layers'].values())
+        if args.check:
+            if not out_path.exists() or out_path.read_text(encoding='utf-8') != text:
+                failures.append(f'{out_path} is missing or stale; run tools/tiled_colliders.py')
+            continue
+        out_path.write_text(text, encoding='utf-8')
+        print(f'[COLLIDERS] {map_path.name}: {tiles} solid tile(s) -> {rects} rectangle(s) in {out_path.name}')
+
+    if failures:
+        print('Collider generation failed:')
+        for entry in failures:
+            print(f'- {entry}')
+        return 1
+    if args.check:
+        print(f'Collider sidecars up to date for {len(map_paths)} map(s).')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Export Tiled JSON maps with base64 (optionally zlib) encoded tile layers.
+
+Tiled's plain `data` arrays ship one integer per line, which is most of the
+map's bytes and most of its parse time. This export stage rewrites every tile
+layer into Tiled's own `"encoding": "base64"` form: little-endian uint32
+gids. Layers are not compressed by default, because Phaser's Tiled parser
+reads base64 layers but skips compressed ones. `--compression zlib`
+produces smaller maps for other loaders.
+
+The export is opt-in and only writes compact JSON to `--out-dir`
+(`artifacts/maps` by default). It is not wired into `public/assets/maps`,
+and the game does not currently load those maps, so shipped payloads are
+unchanged until a loader is pointed at the encoded output. The reported
+savings are what that switch would gain.
+
+Every exported map is reloaded and verified. Each layer must decode to the
+original gids, flip flags included, and every non-layer field must be
+unchanged. The report compares raw and gzip transfer sizes and the
+best-of-`--repeat` time to parse the JSON and decode the layers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import copy
+import gzip
+import json
+from pathlib import Path
+import time
+import zlib
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    print('ERROR: numpy is required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+from tiled_colliders import SIDECAR_SUFFIX, layer_gids
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Encode Tiled tile layers as base64 (optionally zlib) and verify the round trip.')
+    parser.add_argument('maps', nargs='*', help='Tiled JSON maps (default: public/assets/maps/*.json).')
+    parser.add_argument('--out-dir', default='artifacts/maps', help='Where encoded maps are written.')
+    parser.add_argument(
+        '--compression', choices=['none', 'zlib'], default='none', help='Layer compression (Phaser only reads none).'
+    )
+    parser.add_argument('--repeat', type=int, default=20, help='Parse timings keep the best of this many runs.')
+    return parser.parse_args()
+
+
+def encode_layer(layer: dict, compression: str) -> dict:
+    raw = layer_gids(layer).astype('<u4').tobytes()
+    encoded = {key: value for key, value in layer.items() if key not in ('data', 'encoding', 'compression')}
+    encoded['encoding'] = 'base64'
+    if compression == 'zlib':
+        raw = zlib.compress(raw, 9)
+        encoded['compression'] = 'zlib'
+    encoded['data'] = base64.b64encode(raw).decode('ascii')
+    return encoded
+
+
+def encode_map(map_data: dict, compression: str) -> dict:
+    if map_data.get('infinite'):
+        raise ValueError('infinite (chunked) maps are not supported')
+    encoded = copy.deepcopy(map_data)
+    encoded['layers'] = [
+        encode_layer(layer, compression) if layer.get('type') == 'tilelayer' else layer
+        for layer in map_data.get('layers', [])
+    ]
+    return encoded
+
+
+def verify_round_trip(original: dict, encoded_text: str) -> list[str]:
+    errors = []
+    decoded = json.loads(encoded_text)
+    if len(decoded.get('layers', [])) != len(original.get('layers', [])):
+        return ['layer count changed']
+    for before, after in zip(original['layers'], decoded['layers']):
+        if before.get('type') != 'tilelayer':
+            if before != after:
+                errors.append(f'layer {before.get("name")!r} changed')
+            continue
+        if not np.array_equal(layer_gids(before), layer_gids(after)):
+            errors.append(f'layer {before.get("name")!r} gids differ after decoding')
+        strip = ('data', 'encoding', 'compression')
+        if {k: v for k, v in before.items() if k not in strip} != {k: v for k, v in after.items() if k not in strip}:
+            errors.append(f'layer {before.get("name")!r} properties changed')
+    if {k: v for k, v in original.items() if k != 'layers'} != {k: v for k, v in decoded.items() if k != 'layers'}:
+        errors.append('map properties changed')
+    return errors
+
+
+def parse_seconds(text: str, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        map_data = json.loads(text)
+        for layer in map_data.get('layers', []):
+            if layer.get('type') == 'tilelayer':
+                layer_gids(layer)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    args = parse_args()
+    root = Path(__file__).resolve().parents[1]
+    if args.maps:
+        map_paths = [Path(path) for path in args.maps]
+    else:
+        map_paths = sorted(
+            path for path in (root / 'public/assets/maps').glob('*.json') if not path.name.endswith(SIDECAR_SUFFIX)
+        )
+    if not map_paths:
+        print('No Tiled maps found.')
+        return 1
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    failures = []
+    totals = np.zeros(6)
+    for map_path in map_paths:
+        try:
+            source_text = map_path.read_text(encoding='utf-8')
+            original = json.loads(source_text)
+            encoded_text = json.dumps(encode_map(original, args.compression), separators=(',', ':')) + '\n'
+        except (OSError, ValueError, KeyError) as error:
+            failures.append(f'{map_path}: {error}')
+            continue
+        errors = verify_round_trip(original, encoded_text)
+        if errors:
+            failures.extend(f'{map_path}: {error}' for error in errors)
+            continue
+        (out_dir / map_path.name).write_text(encoded_text, encoding='utf-8')
+
+        sizes = [len(text.encode('utf-8')) for text in (source_text, encoded_text)]
+        gzipped = [len(gzip.compress(text.encode('utf-8'), 9)) for text in (source_text, encoded_text)]
+        timings = [parse_seconds(text, args.repeat) * 1000 for text in (source_text, encoded_text)]
+        totals += sizes + gzipped + timings
+        print(
+            f'[ENCODE] {map_path.name}: {sizes[0]} -> {sizes[1]} bytes '
+            f'(gzip {gzipped[0]} -> {gzipped[1]}), parse {timings[0]:.3f} -> {timings[1]:.3f} ms'
+        )
+
+    if failures:
+        print('Tile layer encoding failed:')
+        for entry in failures:
+            print(f'- {entry}')
+        return 1
+    print(
+        f'Encoded {len(map_paths)} map(s) to {out_dir}: {totals[0] - totals[1]:.0f} bytes saved '
+        f'({(1 - totals[1] / totals[0]) * 100:.0f}%), gzip {(1 - totals[3] / totals[2]) * 100:.0f}% smaller, '
+        f'parse {totals[4] / max(totals[5], 1e-9):.1f}x faster. Round trip verified.'
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Parity check between web-exported levels and the Unity fixture copies.
+
+Each `--pair REFERENCE:CANDIDATE` names two directories whose `.json` files
+are matched by file name. The defaults compare three things: a fresh
+`npm run unity:export:all` in `artifacts/unity/levels` against the committed
+fixtures, the fixture mirrors against each other, and the parity metrics
+copies. Every file pair is loaded and diffed in a worker process, so only the
+findings travel back.
+
+Level files (anything with a `tileGrid`) are first put into canonical form:
+the tile grid becomes a uint8 array, and entities and platforms become
+sorted column arrays keyed by id or position. Tile differences are one
+`reference != candidate` mask, reported as minimal covering rectangles (the
+greedy mesher from `tiled_colliders.py`). Entity differences come from array
+joins on id. Other JSON, such as `movement_metrics.json`, is flattened to
+leaf paths, and numeric leaves are compared with `--tolerance`.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from pathlib import Path
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    print('ERROR: numpy is required. Run: python3 -m pip install -r tools/requirements.txt')
+    raise SystemExit(1)
+
+from tiled_colliders import greedy_mesh
+
+
+UNITY_FIXTURES = 'unity-port-kit/Assets/SuperbartPort/Resources/Fixtures'
+UNITY_TEST_FIXTURES = 'unity-port-kit/Assets/SuperbartPort/Tests/Resources/Fixtures'
+DEFAULT_PAIRS = (
+    ('artifacts/unity/levels', 'unity-port-kit/Fixtures/levels'),
+    ('artifacts/unity/levels', f'{UNITY_FIXTURES}/levels'),
+    (f'{UNITY_FIXTURES}/levels', f'{UNITY_TEST_FIXTURES}/levels'),
+    ('unity-port-kit/Fixtures/parity', f'{UNITY_FIXTURES}/parity'),
+    (f'{UNITY_FIXTURES}/parity', f'{UNITY_TEST_FIXTURES}/parity'),
+)
+LEVEL_SCALARS = ('tileSize', 'width', 'height')
+# Export timestamps differ on every run and are never parity drift.
+DEFAULT_IGNORED = 'generatedAt'
+
+
+def parse_pair(value: str) -> tuple[str, str]:
+    first, sep, second = value.partition(':')
+    if not sep or not first or not second:
+        raise argparse.ArgumentTypeError(f'expected REFERENCE:CANDIDATE, got {value!r}')
+    return first, second
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Diff exported levels and parity fixtures against their Unity copies.')
+    parser.add_argument(
+        '--pair',
+        action='append',
+        type=parse_pair,
+        metavar='REFERENCE:CANDIDATE',
+        help='Directories to compare by file name (repeatable; default: web export and Unity fixture mirrors).',
+    )
+    parser.add_argument('--tolerance', type=float, default=1e-6, help='Absolute tolerance for numeric leaves.')
+    parser.add_argument('--ignore', default=DEFAULT_IGNORED, help='Comma-separated JSON keys never compared.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes.')
+    parser.add_argument('--show', type=int, default=10, help='Differences printed per file pair.')
+    parser.add_argument('--strict', action='store_true', help='Also fail when a file has no counterpart.')
+    parser.add_argument('--report', default='artifacts/unity/parity_report.json', help='Where the full JSON report goes.')
+    return parser.parse_args()
+
+
+def canonical_entities(items: list[dict], key_fields: tuple[str, ...]) -> dict[str, np.ndarray]:
+    """Column arrays sorted by key; `payload` holds every remaining field as canonical JSON."""
+    keys = np.array(['|'.join(str(item.get(field)) for field in key_fields) for item in items], dtype=str)
+    payload = np.array(
+        [json.dumps({k: v for k, v in item.items() if k not in key_fields}, sort_keys=True) for item in items], dtype=str
+    )
+    order = np.argsort(keys, kind='stable')
+    return {'key': keys[order], 'payload': payload[order]}
+
+
+def diff_collection(name: str, reference: list[dict], candidate: list[dict], key_fields: tuple[str, ...]) -> list[str]:
+    before = canonical_entities(reference, key_fields)
+    after = canonical_entities(candidate, key_fields)
+    diffs = [f'{name} {key}: missing' for key in np.setdiff1d(before['key'], after['key'])]
+    diffs += [f'{name} {key}: unexpected' for key in np.setdiff1d(after['key'], before['key'])]
+    common, left, right = np.intersect1d(before['key'], after['key'], return_indices=True)
+    changed = before['payload'][left] != after['payload'][right]
+    for key, old, new in zip(common[changed], before['payload'][left][changed], after['payload'][right][changed]):
+        diffs.append(f'{name} {key}: {old} -> {new}')
+    if len(before['key']) != len(np.unique(before['key'])) or len(after['key']) != len(np.unique(after['key'])):
+        diffs.append(f'{name}: duplicate keys, comparison by key is incomplete')
+    return diffs
+
+
+def diff_tiles(reference: np.ndarray, candidate: np.ndarray) -> list[str]:
+    if reference.shape != candidate.shape:
+        return [f'tileGrid shape {reference.shape} -> {candidate.shape}']
+    mask = reference != candidate
+    if not mask.any():
+        return []
+    diffs = []
+    for x, y, w, h in greedy_mesh(mask):
+        before = np.unique(reference[y:y + h, x:x + w])
+        after = np.unique(candidate[y:y + h, x:x + w])
+        diffs.append(f'tiles x={x} y={y} {w}x{h}: {before.tolist()} -> {after.tolist()}')
+    return diffs
+
+
+def diff_levels(reference: dict, candidate: dict, ignored: frozenset[str]) -> list[str]:
+    diffs = [
+        f'{field}: {reference.get(field)} -> {candidate.get(field)}'
+        for field in LEVEL_SCALARS
+        if reference.get(field) != candidate.get(field)
+    ]
+    diffs += diff_tiles(np.asarray(reference['tileGrid'], dtype=np.uint8), np.asarray(candidate['tileGrid'], dtype=np.uint8))
+    diffs += diff_collection('entity', reference.get('entities', []), candidate.get('entities', []), ('id',))
+    diffs += diff_collection(
+        'oneWayPlatform', reference.get('oneWayPlatforms', []), candidate.get('oneWayPlatforms', []), ('x', 'y', 'w')
+    )
+    diffs += diff_collection('movingPlatform', reference.get('movingPlatforms', []), candidate.get('movingPlatforms', []), ('id',))
+    diffs += diff_collection('checkpoint', reference.get('checkpoints', []), candidate.get('checkpoints', []), ('id',))
+    for field in ('goal', 'metadata'):
+        diffs += diff_json(reference.get(field), candidate.get(field), 0.0, field, ignored)
+    return diffs
+
+
+def flatten(value: object, prefix: str, leaves: dict[str, object], ignored: frozenset[str] = frozenset()) -> None:
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if key not in ignored:
+                flatten(child, f'{prefix}.{key}' if prefix else str(key), leaves, ignored)
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            flatten(child, f'{prefix}[{index}]', leaves, ignored)
+    else:
+        leaves[prefix] = value
+
+
+def diff_json(
+    reference: object, candidate: object, tolerance: float, prefix: str = '', ignored: frozenset[str] = frozenset()
+) -> list[str]:
+    before: dict[str, object] = {}
+    after: dict[str, object] = {}
+    flatten(reference, prefix, before, ignored)
+    flatten(candidate, prefix, after, ignored)
+    diffs = [f'{path}: missing' for path in sorted(before.keys() - after.keys())]
+    diffs += [f'{path}: unexpected' for path in sorted(after.keys() - before.keys())]
+
+    common = sorted(before.keys() & after.keys())
+    numeric = [
+        path for path in common
+        if all(isinstance(side[path], (int, float)) and not isinstance(side[path], bool) for side in (before, after))
+    ]
+    if numeric:
+        old = np.array([before[path] for path in numeric], dtype=np.float64)
+        new = np.array([after[path] for path in numeric], dtype=np.float64)
+        far = ~np.isclose(old, new, rtol=0.0, atol=tolerance, equal_nan=True)
+        diffs += [f'{path}: {a:g} -> {b:g}' for path, a, b in zip(np.array(numeric)[far], old[far], new[far])]
+    numeric_set = set(numeric)
+    diffs += [
+        f'{path}: {before[path]!r} -> {after[path]!r}'
+        for path in common
+        if path not in numeric_set and before[path] != after[path]
+    ]
+    return diffs
+
+
+def compare_files(reference_path: str, candidate_path: str, tolerance: float, ignored: frozenset[str]) -> list[str]:
+    try:
+        reference = json.loads(Path(reference_path).read_text(encoding='utf-8'))
+        candidate = json.loads(Path(candidate_path).read_text(encoding='utf-8'))
+    except (OSError, ValueError) as error:
+        return [f'unreadable: {error}']
+    if isinstance(reference, dict) and isinstance(candidate, dict) and 'tileGrid' in reference and 'tileGrid' in candidate:
+        return diff_levels(reference, candidate, ignored)
+    return diff_json(reference, candidate, tolerance, '', ignored)
+
+
+def main() -> int:
+    args = parse_args()
+    root = Path(__file__).resolve().parents[1]
+    pairs = args.pair or list(DEFAULT_PAIRS)
+    ignored = frozenset(key.strip() for key in args.ignore.split(',') if key.strip())
+
+    tasks: list[tuple[str, str]] = []
+    unpaired: list[str] = []
+    for reference_dir, candidate_dir in pairs:
+        reference_root = root / reference_dir
+        candidate_root = root / candidate_dir
+        if not reference_root.is_dir() or not candidate_root.is_dir():
+            missing = reference_dir if not reference_root.is_dir() else candidate_dir
+            print(f'[SKIP] {reference_dir} vs {candidate_dir}: {missing} not found')
+            continue
+        reference_files = {path.name for path in reference_root.glob('*.json')}
+        candidate_files = {path.name for path in candidate_root.glob('*.json')}
+        unpaired += [f'{reference_dir}/{name} has no copy in {candidate_dir}' for name in sorted(reference_files - candidate_files)]
+        unpaired += [f'{candidate_dir}/{name} has no reference in {reference_dir}' for name in sorted(candidate_files - reference_files)]
+        tasks += [(str(reference_root / name), str(candidate_root / name)) for name in sorted(reference_files & candidate_files)]
+
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(compare_files, *zip(*tasks), [args.tolerance] * len(tasks), [ignored] * len(tasks))) if tasks else []
+
+    report = {
+        'pairs': [
+            {
+                'reference': os.path.relpath(reference, root),
+                'candidate': os.path.relpath(candidate, root),
+                'diffs': diffs,
+            }
+            for (reference, candidate), diffs in zip(tasks, results)
+        ],
+        'unpaired': unpaired,
+    }
+    report_path = Path(args.report)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+
+    mismatched = [entry for entry in report['pairs'] if entry['diffs']]
+    print(f'Compared {len(tasks)} file pair(s); {len(mismatched)} differ. Report: {report_path}')
+    for entry in mismatched:
+        print(f'{entry["reference"]} vs {entry["candidate"]}: {len(entry["diffs"])} difference(s)')
+        for diff in entry['diffs'][: args.show]:
+            print(f'- {diff}')
+    if unpaired:
+        print(f'{len(unpaired)} file(s) without a counterpart' + ('' if args.strict else ' (not compared)') + ':')
+        for entry in unpaired[: args.show]:
+            print(f'- {entry}')
+    if mismatched or (args.strict and unpaired):
+        return 1
+    print('Fixture parity check passed.')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
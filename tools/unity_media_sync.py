@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""Incremental Unity media sync driven by `unity-port-kit/MediaSyncManifest.json`.
+
+Each manifest asset is copied from `public/<source>` to
+`<outputDir>/<destination>`, but only when it changed. A state file records
+each asset's source and destination size, mtime and BLAKE2b hash. An asset
+whose stat matches the state is skipped without being read, so a re-sync
+after one sprite edit costs one stat per asset plus one copy. Files whose
+stat changed are re-hashed, and identical content is not copied again.
+Hashing, copying and verification run in a thread pool.
+
+Copies are reflinks (copy-on-write clones) where the filesystem supports
+them, and plain copies otherwise. `--link hardlink` shares inodes instead.
+That is faster, but an edit to either side then changes both. Each copy
+lands on a temporary name and is renamed into place once its hash matches
+the source.
+
+Assets that a previous sync wrote but the manifest no longer lists are
+pruned, together with their Unity `.meta` files. Other files in `outputDir`,
+such as assets from another media profile, are only reported unless
+`--prune-untracked` is given. `--verify` re-hashes every destination.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import errno
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+MANIFEST_PATH = 'unity-port-kit/MediaSyncManifest.json'
+SOURCE_ROOT = 'public'
+DEFAULT_STATE = 'artifacts/unity/media_sync_state.json'
+STATE_VERSION = 1
+# Linux FICLONE ioctl: clone a whole file (btrfs, XFS with reflink, bcachefs).
+FICLONE = 0x40049409
+HASH_BLOCK = 1 << 20
+
+
+@dataclass(frozen=True)
+class SyncAsset:
+    source: str
+    destination: str
+    required: bool
+    bucket: str
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Copy changed Unity media assets listed in MediaSyncManifest.json.')
+    parser.add_argument('--manifest', default=MANIFEST_PATH, help='Media sync manifest.')
+    parser.add_argument('--state', default=DEFAULT_STATE, help='Sync state file.')
+    parser.add_argument('--link', choices=['auto', 'copy', 'hardlink'], default='auto', help='auto = reflink, else copy.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='I/O worker threads.')
+    parser.add_argument('--buckets', help='Comma-separated buckets to sync (default: all).')
+    parser.add_argument('--verify', action='store_true', help='Re-hash every destination against its source.')
+    parser.add_argument('--prune-untracked', action='store_true', help='Also delete files in outputDir the manifest does not list.')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing.')
+    return parser.parse_args()
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open('rb') as handle:
+        for block in iter(lambda: handle.read(HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def stat_key(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def reflink(source: Path, target: Path) -> bool:
+    if fcntl is None:
+        return False
+    with source.open('rb') as src, target.open('wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return True
+        except OSError as error:
+            if error.errno in (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.EBADF):
+                return False
+            raise
+
+
+def place(source: Path, destination: Path, mode: str) -> str:
+    """Write `source` to a temporary sibling of `destination`; returns the method used."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    staging = destination.with_name(f'.{destination.name}.sync-tmp')
+    staging.unlink(missing_ok=True)
+    if mode == 'hardlink':
+        try:
+            os.link(source, staging)
+            return 'hardlink'
+        except OSError:
+            pass
+    elif mode == 'auto' and reflink(source, staging):
+        return 'reflink'
+    shutil.copyfile(source, staging)
+    return 'copy'
+
+
+def sync_asset(asset: SyncAsset, source_root: Path, out_root: Path, previous: dict, mode: str, dry_run: bool) -> dict:
+    """Bring one destination up to date; returns its new state entry plus an `action`."""
+    source = source_root / asset.source
+    destination = out_root / asset.destination
+    source_stat = stat_key(source)
+    if source_stat is None:
+        return {'action': 'missing-required' if asset.required else 'missing-optional'}
+
+    destination_stat = stat_key(destination)
+    if (
+        previous.get('sourceStat') == source_stat
+        and previous.get('destinationStat') == destination_stat
+        and previous.get('source') == asset.source
+    ):
+        return {**previous, 'action': 'unchanged'}
+
+    source_hash = previous['hash'] if previous.get('sourceStat') == source_stat else file_hash(source)
+    if destination_stat is not None and destination_stat[0] == source_stat[0]:
+        known = previous.get('destinationStat') == destination_stat and previous.get('hash') == source_hash
+        if known or file_hash(destination) == source_hash:
+            entry = {'source': asset.source, 'sourceStat': source_stat, 'destinationStat': destination_stat, 'hash': source_hash}
+            return {**entry, 'action': 'unchanged'}
+    if dry_run:
+        return {'action': 'would-copy'}
+
+    method = place(source, destination, mode)
+    staging = destination.with_name(f'.{destination.name}.sync-tmp')
+    if file_hash(staging) != source_hash:
+        staging.unlink(missing_ok=True)
+        return {'action': 'corrupt'}
+    os.replace(staging, destination)
+    entry = {'source': asset.source, 'sourceStat': source_stat, 'destinationStat': stat_key(destination), 'hash': source_hash}
+    return {**entry, 'action': method}
+
+
+def verify_asset(asset: SyncAsset, source_root: Path, out_root: Path) -> str | None:
+    source = source_root / asset.source
+    destination = out_root / asset.destination
+    if not source.exists():
+        return None
+    if not destination.exists():
+        return f'{asset.destination}: missing'
+    if file_hash(source) != file_hash(destination):
+        return f'{asset.destination}: content differs from {SOURCE_ROOT}/{asset.source}'
+    return None
+
+
+def remove_with_meta(path: Path) -> None:
+    path.unlink(missing_ok=True)
+    path.with_name(path.name + '.meta').unlink(missing_ok=True)
+
+
+def main() -> int:
+    args = parse_args()
+    root = Path(__file__).resolve().parents[1]
+    manifest = json.loads((root / args.manifest).read_text(encoding='utf-8'))
+    source_root = root / SOURCE_ROOT
+    out_root = root / manifest['outputDir']
+    buckets = {bucket.strip() for bucket in args.buckets.split(',') if bucket.strip()} if args.buckets else None
+    assets = [
+        SyncAsset(entry['source'], entry['destination'], bool(entry.get('required', False)), entry.get('bucket', ''))
+        for entry in manifest['assets']
+        if buckets is None or entry.get('bucket') in buckets
+    ]
+
+    state_path = root / args.state
+    state = json.loads(state_path.read_text(encoding='utf-8')) if state_path.exists() else {}
+    if state.get('version') != STATE_VERSION or state.get('outputDir') != manifest['outputDir']:
+        state = {}
+    previous_entries: dict[str, dict] = state.get('entries', {})
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(
+            lambda asset: sync_asset(
+                asset, source_root, out_root, previous_entries.get(asset.destination, {}), args.link, args.dry_run
+            ),
+            assets,
+        ))
+        problems = [entry for entry in pool.map(lambda asset: verify_asset(asset, source_root, out_root), assets) if entry] if args.verify else []
+
+    entries: dict[str, dict] = {}
+    actions: dict[str, list[str]] = {}
+    for asset, result in zip(assets, results):
+        action = result.pop('action')
+        actions.setdefault(action, []).append(asset.destination)
+        if 'hash' in result:
+            entries[asset.destination] = result
+
+    # Entries outside the synced buckets are kept so a partial sync does not prune them.
+    listed = {entry['destination'] for entry in manifest['assets']}
+    synced = {asset.destination for asset in assets}
+    for destination, entry in previous_entries.items():
+        if destination in listed and destination not in synced:
+            entries[destination] = entry
+    orphans = sorted(set(previous_entries) - listed)
+    untracked = sorted(
+        str(path.relative_to(out_root))
+        for path in out_root.rglob('*')
+        if path.is_file()
+        and path.suffix != '.meta'
+        and not path.name.endswith('.sync-tmp')
+        and str(path.relative_to(out_root)) not in listed
+        and str(path.relative_to(out_root)) not in previous_entries
+    ) if out_root.exists() else []
+
+    if not args.dry_run:
+        for destination in orphans + (untracked if args.prune_untracked else []):
+            remove_with_meta(out_root / destination)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        state_path.write_text(
+            json.dumps({'version': STATE_VERSION, 'outputDir': manifest['outputDir'], 'entries': entries}, indent=2, sort_keys=True) + '\n',
+            encoding='utf-8',
+        )
+    elapsed = time.perf_counter() - started
+
+    written = sum(len(actions.get(method, [])) for method in ('copy', 'reflink', 'hardlink'))
+    methods = ', '.join(f'{len(actions[method])} {method}' for method in ('reflink', 'hardlink', 'copy') if actions.get(method))
+    print(
+        f'Unity media sync: {len(assets)} asset(s), {len(actions.get("unchanged", []))} unchanged, '
+        f'{written} written' + (f' ({methods})' if methods else '')
+        + (f', {len(actions["would-copy"])} would be written' if actions.get('would-copy') else '')
+        + f', {len(orphans)} orphan(s) {"to prune" if args.dry_run else "pruned"} in {elapsed:.2f}s.'
+    )
+    for destination in actions.get('copy', []) + actions.get('reflink', []) + actions.get('hardlink', []) + actions.get('would-copy', []):
+        print(f'[SYNC] {destination}')
+    if actions.get('missing-optional'):
+        print(f'Skipped {len(actions["missing-optional"])} optional asset(s) not present in {SOURCE_ROOT}/.')
+    if untracked:
+        verb = 'removed' if args.prune_untracked and not args.dry_run else 'not in the manifest (use --prune-untracked to remove)'
+        print(f'{len(untracked)} untracked file(s) in {manifest["outputDir"]} {verb}.')
+
+    failures = [f'missing required source {SOURCE_ROOT}/{entry}' for entry in actions.get('missing-required', [])]
+    failures += [f'{entry}: copy did not match source hash' for entry in actions.get('corrupt', [])]
+    failures += problems
+    if failures:
+        print('Unity media sync failed:')
+        for entry in failures:
+            print(f'- {entry}')
+        return 1
+    if args.verify:
+        print(f'Verified {len(assets)} destination(s) against their sources.')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())